@@ -22,7 +22,7 @@ from .core.options import (Options, Store, Cycle,        # noqa (API import)
                            Palette, StoreOptions)
 from .core.overlay import Overlay, NdOverlay             # noqa (API import)
 from .core.spaces import (HoloMap, Callable, DynamicMap, # noqa (API import)
-                          GridSpace, GridMatrix)
+                          GridSpace, GridMatrix, LazyHoloMap)
 
 from .operation import Operation                         # noqa (API import)
 from .element import *                                   # noqa (API import)
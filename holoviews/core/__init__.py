@@ -11,7 +11,7 @@ from .sheetcoords import *     # noqa (API import)
 from .spaces import *          # noqa (API import)
 from .tree import *            # noqa (API import)
 from .util import config       # noqa (API import)
-from .io import FileArchive
+from .io import FileArchive, OperationCache # noqa (API import)
 
 archive = FileArchive()
 
@@ -499,8 +499,14 @@ class Opts(object):
         print(pprinter.pprint(self._obj))
 
     def _holomap_opts(self, *args, **kwargs):
+        from .spaces import LazyHoloMap
+
         clone = kwargs.pop('clone', None)
         apply_groups, _, _ = util.deprecated_opts_signature(args, kwargs)
+        if isinstance(self._obj, LazyHoloMap):
+            # Defer applying the options until a value is evaluated
+            clone = apply_groups if clone is None else clone
+            return self._obj._map_values(lambda v: v.opts(*args, **kwargs), clone)
         data = OrderedDict([(k, v.opts(*args, **kwargs))
                              for k, v in self._obj.data.items()])
 
@@ -7,6 +7,10 @@ except ImportError:
 
 import types
 import copy
+import weakref
+
+from functools import partial
+
 import numpy as np
 import param
 from param.parameterized import add_metaclass, ParameterizedMetaclass
@@ -18,13 +22,14 @@ from ..dimension import (
 )
 from ..element import Element
 from ..ndmapping import OrderedDict, MultiDimensionalMapping
-from ..spaces import HoloMap, DynamicMap
+from ..spaces import HoloMap, DynamicMap, LazyHoloMap
 from .interface import Interface, iloc, ndloc
 from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .multipath import MultiInterface         # noqa (API import)
 from .image import ImageInterface             # noqa (API import)
+from .ragged import RaggedInterface, RaggedData # noqa (API import)
 from .spatialpandas import SpatialPandasInterface # noqa (API import)
 
 default_datatype = 'dictionary'
@@ -59,6 +64,8 @@ if 'array' not in datatypes:
     datatypes.append('array')
 if 'multitabular' not in datatypes:
     datatypes.append('multitabular')
+if 'ragged' not in datatypes:
+    datatypes.append('ragged')
 
 
 def concat(datasets, datatype=None):
@@ -216,7 +223,8 @@ class PipelineMeta(ParameterizedMetaclass):
                             output_type=type(result),
                         )
 
-                    elif isinstance(result, MultiDimensionalMapping):
+                    elif (isinstance(result, MultiDimensionalMapping) and
+                          not isinstance(result, LazyHoloMap)):
                         for key, element in result.items():
                             if isinstance(element, Dataset):
                                 getitem_op = method_op.instance(
@@ -350,6 +358,15 @@ class Dataset(Element):
         """
         return self._pipeline
 
+    def __getstate__(self):
+        "Drops cached values, indexes and grid orientation when pickling"
+        state = super(Dataset, self).__getstate__()
+        state.pop('_unique_values', None)
+        state.pop('_spatial_index', None)
+        state.pop('_grid_orientation', None)
+        state.pop('_dask_ranges', None)
+        return state
+
     def closest(self, coords=[], **kwargs):
         """Snaps coordinate(s) to closest coordinate in Dataset
 
@@ -845,7 +862,7 @@ argument to specify a selection specification""")
 
 
     def groupby(self, dimensions=[], container_type=HoloMap, group_type=None,
-                dynamic=False, **kwargs):
+                dynamic=False, lazy=False, **kwargs):
         """Groups object by one or more dimensions
 
         Applies groupby operation over the specified dimensions
@@ -857,11 +874,15 @@ argument to specify a selection specification""")
             container_type: Type to cast group container to
             group_type: Type to cast each group to
             dynamic: Whether to return a DynamicMap
+            lazy: Whether to return a LazyHoloMap
+                Groups of a LazyHoloMap are only selected when they
+                are accessed.
             **kwargs: Keyword arguments to pass to each group
 
         Returns:
             Returns object of supplied container_type containing the
-            groups. If dynamic=True returns a DynamicMap instead.
+            groups. If dynamic=True returns a DynamicMap and if
+            lazy=True a LazyHoloMap instead.
         """
         if not isinstance(dimensions, list): dimensions = [dimensions]
         if not len(dimensions): dimensions = self.dimensions('key', True)
@@ -870,7 +891,7 @@ argument to specify a selection specification""")
         dimensions = [self.get_dimension(d, strict=True) for d in dimensions]
         dim_names = [d.name for d in dimensions]
 
-        if dynamic:
+        if dynamic or lazy:
             group_dims = [kd for kd in self.kdims if kd not in dimensions]
             kdims = [self.get_dimension(d) for d in kwargs.pop('kdims', group_dims)]
             drop_dim = len(group_dims) != len(kdims)
@@ -886,6 +907,15 @@ argument to specify a selection specification""")
                 if drop_dim and self.interface.gridded:
                     data = data.columns()
                 return group_type(data, **group_kwargs)
+            if lazy:
+                if self.interface.gridded:
+                    values = [self.interface.values(self, d, False) for d in dim_names]
+                    keys = zip(*util.cartesian_product(values))
+                else:
+                    values = [self.dimension_values(d) for d in dim_names]
+                    keys = util.unique_iterator(zip(*values))
+                items = [(key, partial(load_subset, *key)) for key in keys]
+                return LazyHoloMap(items, kdims=dimensions)
             dynamic_dims = [d.clone(values=list(self.interface.values(self, d.name, False)))
                             for d in dimensions]
             return DynamicMap(load_subset, kdims=dynamic_dims)
@@ -926,7 +956,21 @@ argument to specify a selection specification""")
             NumPy array of values along the requested dimension
         """
         dim = self.get_dimension(dimension, strict=True)
-        return self.interface.values(self, dim, expanded, flat)
+        if expanded or self.interface.gridded:
+            return self.interface.values(self, dim, expanded, flat)
+
+        # Cache unique values (e.g. categorical factors) for as long as
+        # the interface can validate the values have not changed
+        token = self.interface.unique_token(self, dim)
+        if token is None:
+            return self.interface.values(self, dim, expanded, flat)
+        cache = self.__dict__.setdefault('_unique_values', {})
+        ref, cached_token, values = cache.get((dim.name, flat), (None, None, None))
+        if (ref is None or ref() is not self.data or len(cached_token) != len(token)
+            or any(a is not b for a, b in zip(cached_token, token))):
+            values = self.interface.values(self, dim, expanded, flat)
+            cache[(dim.name, flat)] = (weakref.ref(self.data), token, values)
+        return values.copy() if isinstance(values, np.ndarray) else values
 
 
     def get_dimension_type(self, dim):
@@ -989,6 +1033,21 @@ argument to specify a selection specification""")
         return OrderedDict([(d.name, self.dimension_values(d)) for d in dimensions])
 
 
+    def persist(self):
+        """Persists lazily evaluated data in memory.
+
+        Evaluates out-of-core data (e.g. dask arrays and dataframes)
+        and keeps the result in memory while preserving its chunked
+        structure. Repeated interactive reductions and range lookups
+        on the persisted Dataset then do not recompute the full task
+        graph.
+
+        Returns:
+            Clone of the Dataset with persisted data
+        """
+        return self.clone(self.interface.persist(self))
+
+
     @property
     def to(self):
         "Returns the conversion interface with methods to convert Dataset"
@@ -1038,6 +1097,11 @@ argument to specify a selection specification""")
             data, shared_data, new_type, *args, **overrides
         )
 
+        # Share the spatial index between clones of the same data
+        sindex = self.__dict__.get('_spatial_index')
+        if sindex is not None and new_dataset.data is sindex[0]:
+            new_dataset._spatial_index = sindex
+
         return new_dataset
 
     # Overrides of superclass methods that are needed so that PipelineMeta
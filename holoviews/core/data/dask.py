@@ -84,6 +84,10 @@ class DaskInterface(PandasInterface):
         else:
             return dd.compute(column.min(), column.max())
 
+    @classmethod
+    def persist(cls, dataset):
+        return dataset.data.persist()
+
     @classmethod
     def sort(cls, dataset, by=[], reverse=False):
         dataset.param.warning('Dask dataframes do not support sorting')
@@ -105,8 +109,13 @@ class DaskInterface(PandasInterface):
             data = data.unique()
         if keep_index:
             return data.compute() if compute else data
-        else:
-            return data.compute().values if compute else data.values
+        elif not compute:
+            return data.values
+        values = data.compute().values
+        if not expanded and isinstance(values, pd.Categorical):
+            # Match the unique values returned by the PandasInterface
+            values = np.asarray(values)
+        return values
 
     @classmethod
     def select_mask(cls, dataset, selection):
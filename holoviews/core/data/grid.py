@@ -18,7 +18,7 @@ from ..element import Element
 from ..dimension import OrderedDict as cyODict
 from ..ndmapping import NdMapping, item_check, sorted_context
 from .. import util
-from .interface import is_dask, dask_array_module, get_array_types
+from .interface import is_dask, dask_array_module, dask_reduction, get_array_types
 
 
 
@@ -275,7 +275,7 @@ class GridInterface(DictInterface):
             return data
 
         data = dataset.data[dim.name]
-        if ordered and np.all(data[1:] < data[:-1]):
+        if ordered and cls.descending(dataset, dim):
             data = data[::-1]
         shape = cls.shape(dataset, True)
         if dim in dataset.kdims:
@@ -291,6 +291,26 @@ class GridInterface(DictInterface):
         return data
 
 
+    @classmethod
+    def descending(cls, dataset, dim):
+        """
+        Whether the coordinates along a dimension are stored in
+        descending order. The orientation is cached on the dataset
+        while the underlying data object is unchanged, so that
+        repeated calls to canonicalize and coords do not have to
+        compare the coordinates again.
+        """
+        name = dimension_name(dim)
+        data, orientation = dataset.__dict__.get('_grid_orientation', (None, None))
+        if data is not dataset.data:
+            orientation = {}
+            dataset.__dict__['_grid_orientation'] = (dataset.data, orientation)
+        if name not in orientation:
+            coords = cls.coords(dataset, name)
+            orientation[name] = bool(coords.ndim == 1 and np.all(coords[1:] < coords[:-1]))
+        return orientation[name]
+
+
     @classmethod
     def canonicalize(cls, dataset, data, data_coords=None, virtual_coords=[]):
         """
@@ -324,21 +344,21 @@ class GridInterface(DictInterface):
             if inds:
                 data = data.transpose(inds[::-1])
 
-        # Reorient data
+        # Reorient data using strided views
         invert = False
         slices = []
         for d in dataset.kdims[::-1]:
-            coords = cls.coords(dataset, d)
-            if np.all(coords[1:] < coords[:-1]) and not coords.ndim > 1:
+            if cls.descending(dataset, d):
                 slices.append(slice(None, None, -1))
                 invert = True
             else:
                 slices.append(slice(None))
         data = data[tuple(slices)] if invert else data
 
-        # Allow lower dimensional views into data
+        # Allow lower dimensional views into data, reshape only
+        # copies if the data cannot be viewed as a flat array
         if len(dataset.kdims) < 2:
-            data = data.flatten()
+            data = data.reshape(-1)
         return data
 
 
@@ -441,16 +461,25 @@ class GridInterface(DictInterface):
 
         # Find all the keys along supplied dimensions
         keys = [cls.coords(dataset, d.name) for d in dimensions]
+        positions = [np.arange(len(k)) for k in keys]
         transpose = [dataset.ndims-dataset.kdims.index(kd)-1 for kd in kdims]
         transpose += [i for i in range(dataset.ndims) if i not in transpose]
 
+        # Regularly sampled groups can be sliced by integer index
+        strided = (not drop_dim and not dataset._binned and
+                   len(dimensions) < dataset.ndims and
+                   not any(cls.irregular(dataset, kd) for kd in dataset.kdims))
+
         # Iterate over the unique entries applying selection masks
         grouped_data = []
-        for unique_key in zip(*util.cartesian_product(keys)):
+        for unique_key, index in zip(zip(*util.cartesian_product(keys)),
+                                     zip(*util.cartesian_product(positions))):
             select = dict(zip(dim_names, unique_key))
             if drop_dim:
                 group_data = dataset.select(**select)
                 group_data = group_data if np.isscalar(group_data) else group_data.columns()
+            elif strided:
+                group_data = cls._slice_group(dataset, dimensions, unique_key, index)
             else:
                 group_data = cls.select(dataset, **select)
 
@@ -514,6 +543,27 @@ class GridInterface(DictInterface):
         return mask
 
 
+    @classmethod
+    def _slice_group(cls, dataset, dimensions, key, index):
+        """
+        Selects a single group along the supplied dimensions by
+        integer index. The value arrays are sliced rather than masked,
+        so numpy arrays are returned as views and dask arrays are not
+        computed.
+        """
+        slices = [slice(None)]*dataset.ndims
+        data = {}
+        for dim, k, i in zip(dimensions, key, index):
+            slices[dataset.ndims-dataset.kdims.index(dim)-1] = slice(i, i+1)
+            data[dim.name] = np.array([k])
+        for kdim in dataset.kdims:
+            if kdim not in dimensions:
+                data[kdim.name] = np.asarray(dataset.data[kdim.name])
+        for vdim in dataset.vdims:
+            data[vdim.name] = dataset.data[vdim.name][tuple(slices)]
+        return data
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         dimensions = dataset.kdims
@@ -632,6 +682,7 @@ class GridInterface(DictInterface):
 
     @classmethod
     def aggregate(cls, dataset, kdims, function, **kwargs):
+        function = dask_reduction(function)
         kdims = [dimension_name(kd) for kd in kdims]
         data = {kdim: dataset.data[kdim] for kdim in kdims}
         axes = tuple(dataset.ndims-dataset.get_dimension_index(kdim)-1
@@ -730,8 +781,53 @@ class GridInterface(DictInterface):
             return new_data[0][0]
         return tuple(new_data)
 
+    @classmethod
+    def persist(cls, dataset):
+        arrays = [(k, v) for k, v in dataset.data.items() if is_dask(v)]
+        if not arrays:
+            return dataset.data
+        import dask
+        keys, values = zip(*arrays)
+        data = type(dataset.data)(dataset.data)
+        data.update(zip(keys, dask.persist(*values)))
+        return data
+
+
+    @classmethod
+    def dask_ranges(cls, dataset):
+        """
+        Computes the ranges of all dask backed value dimensions in a
+        single graph computation. The ranges are cached on the
+        dataset while the underlying data object is unchanged.
+        """
+        data, ranges = dataset.__dict__.get('_dask_ranges', (None, None))
+        if data is dataset.data:
+            return ranges
+        da = dask_array_module()
+        reductions = OrderedDict()
+        for vd in dataset.vdims:
+            values = cls.values(dataset, vd, flat=False, compute=False)
+            if not is_dask(values) or not values.size:
+                continue
+            elif values.dtype.kind == 'M':
+                reductions[vd.name] = (values.min(), values.max())
+            elif values.dtype.kind in 'iufcb':
+                reductions[vd.name] = (da.nanmin(values), da.nanmax(values))
+        ranges = {}
+        if reductions:
+            computed = da.compute(*reductions.values())
+            ranges = dict(zip(reductions, [tuple(r) for r in computed]))
+        dataset.__dict__['_dask_ranges'] = (dataset.data, ranges)
+        return ranges
+
+
     @classmethod
     def range(cls, dataset, dimension):
+        dim = dataset.get_dimension(dimension, strict=True)
+        if dim in dataset.vdims:
+            ranges = cls.dask_ranges(dataset)
+            if dim.name in ranges:
+                return ranges[dim.name]
         if dataset._binned and dimension in dataset.kdims:
             expanded = cls.irregular(dataset, dimension)
             column = cls.coords(dataset, dimension, expanded=expanded, edges=True)
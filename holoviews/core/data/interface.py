@@ -32,6 +32,27 @@ def is_dask(array):
         return False
     return da and isinstance(array, da.Array)
 
+def dask_reduction(function):
+    """
+    Wraps a numpy reduction so that it dispatches to the equivalent
+    dask.array reduction when applied to a dask array. The reduction
+    is then evaluated lazily chunk by chunk instead of forcing the
+    array to be computed.
+    """
+    da = dask_array_module()
+    name = getattr(function, '__name__', None)
+    if da is None or name is None or getattr(np, name, None) is not function:
+        return function
+    dask_function = getattr(da, name, None)
+    if dask_function is None:
+        return function
+    def reduction(values, *args, **kwargs):
+        if isinstance(values, da.Array):
+            return dask_function(values, *args, **kwargs)
+        return function(values, *args, **kwargs)
+    reduction.__name__ = name
+    return reduction
+
 
 class DataError(ValueError):
     "DataError is raised when the data cannot be interpreted"
@@ -447,6 +468,25 @@ class Interface(param.Parameterized):
         concat_data = template.interface.concat(data, dimensions, vdims=template.vdims)
         return template.clone(concat_data, kdims=dimensions+template.kdims, new_type=new_type)
 
+    @classmethod
+    def persist(cls, dataset):
+        """
+        Returns the data with any lazily evaluated arrays computed and
+        held in memory. Interfaces for eagerly evaluated data return
+        the data unchanged.
+        """
+        return dataset.data
+
+    @classmethod
+    def unique_token(cls, dataset, dim):
+        """
+        Returns a token which changes whenever the values along the
+        dimension change, allowing the unique values to be cached, or
+        None if the values cannot be validated cheaply. The token is
+        a tuple of objects compared by identity.
+        """
+        return None
+
     @classmethod
     def reduce(cls, dataset, reduce_dims, function, **kwargs):
         kdims = [kdim for kdim in dataset.kdims if kdim not in reduce_dims]
@@ -490,6 +530,120 @@ class Interface(param.Parameterized):
         splits = np.where(np.isnan(coords.astype('float')))[0]
         return [[[]]*(len(splits)+1)]
 
+    @classmethod
+    def geom_bounds(cls, dataset):
+        """
+        Returns an array of the (x0, y0, x1, y1) bounding boxes of
+        each geometry in a multi-geometry dataset.
+        """
+        raise NotImplementedError('%s does not support spatial indexing.'
+                                  % cls.__name__)
+
+    @classmethod
+    def spatial_token(cls, dataset):
+        """
+        Returns a tuple of the objects holding the geometries of a
+        multi-geometry dataset, which are compared by identity to
+        validate a cached spatial index, or None if the index cannot
+        be validated and should not be cached.
+        """
+        return None
+
+    @classmethod
+    def spatial_index(cls, dataset):
+        """
+        Returns a HilbertRtree over the bounding boxes of each
+        geometry, which is built lazily and cached for as long as the
+        underlying data object and the objects returned by
+        spatial_token are unchanged.
+        """
+        from .sindex import HilbertRtree
+        token = cls.spatial_token(dataset)
+        if token is None:
+            return HilbertRtree(cls.geom_bounds(dataset))
+        data, cached, index = dataset.__dict__.get('_spatial_index', (None, None, None))
+        if (data is not dataset.data or cached is None or len(cached) != len(token)
+            or any(a is not b for a, b in zip(cached, token))):
+            index = HilbertRtree(cls.geom_bounds(dataset))
+            dataset._spatial_index = (dataset.data, token, index)
+        return index
+
+    @classmethod
+    def spatial_mask(cls, dataset, bounds=None, geometry=None):
+        """
+        Returns a boolean mask over the geometries of a multi-geometry
+        dataset selecting those which intersect the supplied (x0, y0,
+        x1, y1) bounds or polygon geometry, declared as an array of x-
+        and y-coordinates. A geometry intersects the region if one of
+        its vertices lies inside it, one of its edges crosses the
+        region boundary or, for polygons, if the region lies inside it.
+        """
+        if geometry is not None:
+            geometry = np.asarray(geometry, dtype='float')
+            bounds = (np.nanmin(geometry[:, 0]), np.nanmin(geometry[:, 1]),
+                      np.nanmax(geometry[:, 0]), np.nanmax(geometry[:, 1]))
+        elif bounds is None:
+            raise ValueError('Spatial selection requires bounds or a geometry.')
+        else:
+            x0, y0, x1, y1 = bounds
+            geometry = np.array([(x0, y0), (x1, y0), (x1, y1), (x0, y1)],
+                                dtype='float')
+        candidates = cls._spatial_candidates(dataset, bounds)
+        if len(candidates):
+            candidates = candidates[cls._intersects_polygon(dataset, candidates, geometry)]
+        mask = np.zeros(len(dataset.data), dtype=bool)
+        mask[candidates] = True
+        return mask
+
+    @classmethod
+    def _spatial_candidates(cls, dataset, bounds):
+        "Returns the index of the geometries intersecting the bounds"
+        return cls.spatial_index(dataset).intersects(bounds)
+
+    @classmethod
+    def _contains_vertices(cls, dataset, index, geometry):
+        """
+        Returns a boolean array indicating which of the indexed
+        geometries have a vertex inside the polygon geometry.
+        """
+        from .sindex import points_in_polygon
+        xdim, ydim = dataset.kdims[:2]
+        subset = dataset.iloc[index]
+        contained = []
+        for geom in cls.split(subset, None, None, 'array', dimensions=[xdim, ydim]):
+            inside = points_in_polygon(geom[:, 0], geom[:, 1],
+                                       geometry[:, 0], geometry[:, 1])
+            contained.append(inside.any())
+        return np.array(contained, dtype=bool)
+
+    @classmethod
+    def _intersects_polygon(cls, dataset, index, geometry):
+        """
+        Returns a boolean array indicating which of the indexed
+        geometries intersect the polygon geometry. Geometries with a
+        vertex inside the polygon are accepted first, the remaining
+        ones are tested for crossing edges and containment.
+        """
+        from .sindex import geometry_intersects_polygon, split_parts
+        intersects = cls._contains_vertices(dataset, index, geometry)
+        remaining = np.flatnonzero(~intersects)
+        geom_type = cls.geom_type(dataset)
+        if not len(remaining) or geom_type == 'Point':
+            return intersects
+        closed = geom_type == 'Polygon'
+        holes = cls.holes(dataset) if closed and cls.has_holes(dataset) else None
+        xdim, ydim = dataset.kdims[:2]
+        subset = dataset.iloc[index[remaining]]
+        geoms = cls.split(subset, None, None, 'array', dimensions=[xdim, ydim])
+        for i, geom in zip(remaining, geoms):
+            parts = split_parts(geom[:, 0], geom[:, 1])
+            if holes:
+                parts += [(np.asarray(h)[:, 0], np.asarray(h)[:, 1])
+                          for part in holes[index[i]] for h in part]
+            intersects[i] = geometry_intersects_polygon(
+                parts, geometry[:, 0], geometry[:, 1], closed)
+        return intersects
+
     @classmethod
     def as_dframe(cls, dataset):
         """
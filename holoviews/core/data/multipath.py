@@ -159,6 +159,30 @@ class MultiInterface(Interface):
             ranges.append(ds.interface.range(ds, dim))
         return util.max_range(ranges)
 
+    @classmethod
+    def geom_bounds(cls, dataset):
+        bounds = np.full((len(dataset.data), 4), np.NaN)
+        if not dataset.data:
+            return bounds
+        ds = cls._inner_dataset_template(dataset)
+        xdim, ydim = dataset.kdims[:2]
+        for i, d in enumerate(dataset.data):
+            ds.data = d
+            (x0, x1), (y0, y1) = ds.interface.range(ds, xdim), ds.interface.range(ds, ydim)
+            bounds[i] = [x0, y0, x1, y1]
+        return bounds
+
+    @classmethod
+    def spatial_token(cls, dataset):
+        # Replacing a geometry or its coordinate arrays invalidates the
+        # index, modifying the coordinates of a geometry inplace does not
+        token = []
+        for geom in dataset.data:
+            token.append(geom)
+            if isinstance(geom, dict):
+                token += [geom.get(kd.name) for kd in dataset.kdims[:2]]
+        return tuple(token)
+
     @classmethod
     def has_holes(cls, dataset):
         if not dataset.data:
@@ -209,17 +233,23 @@ class MultiInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         """
-        Applies selectiong on all the subpaths.
+        Applies selectiong on all the subpaths. A boolean
+        selection_mask may be supplied to select whole geometries.
         """
         from ...element import Polygons
         if not dataset.data:
             return dataset.data
+        geoms = dataset.data
+        if selection_mask is not None:
+            geoms = [geoms[i] for i in np.flatnonzero(selection_mask)]
+            if not selection:
+                return geoms
         ds = cls._inner_dataset_template(dataset)
         skipped = (Polygons._hole_key,)
         if hasattr(ds.interface, 'geo_column'):
             skipped += (ds.interface.geo_column(ds),)
         data = []
-        for d in dataset.data:
+        for d in geoms:
             ds.data = d
             selection_mask = ds.interface.select_mask(ds, selection)
             sel = ds.interface.select(ds, selection_mask)
@@ -300,11 +300,28 @@ class PandasInterface(Interface):
         dim = dataset.get_dimension(dim, strict=True)
         data = dataset.data[dim.name]
         if not expanded:
-            return data.unique()
+            return util.unique_array(data)
 
         return data if keep_index else data.values
 
 
+    @classmethod
+    def unique_token(cls, dataset, dim):
+        # Categoricals are validated by the identity of the Categorical
+        # and its categories, which are replaced whenever the column is
+        # assigned or recategorized; assigning individual values
+        # inplace is not detected
+        if not isinstance(dataset.data, pd.DataFrame):
+            return None
+        dim = dataset.get_dimension(dim, strict=True)
+        if dim.name not in dataset.data.columns:
+            return None
+        values = dataset.data[dim.name].values
+        if not isinstance(values, pd.Categorical):
+            return None
+        return (values, values.categories)
+
+
     @classmethod
     def sample(cls, dataset, samples=[]):
         data = dataset.data
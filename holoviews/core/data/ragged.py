@@ -0,0 +1,638 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from .. import util
+from ..dimension import dimension_name
+from ..element import Element
+from ..ndmapping import NdMapping, item_check, sorted_context
+from .interface import Interface, DataError
+
+
+class RaggedData(object):
+    """
+    RaggedData stores a list of geometries in packed form. The
+    coordinates and other per-vertex values of all geometries are
+    concatenated into flat columns, with an array of offsets marking
+    where each geometry starts and ends, i.e. geometry i spans the
+    vertices offsets[i]:offsets[i+1]. Values which are constant
+    across a geometry are stored once per geometry in the scalars.
+    """
+
+    def __init__(self, columns, offsets, scalars=None, geom_type=None):
+        self.columns = OrderedDict((k, np.asarray(v)) for k, v in columns.items())
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.scalars = OrderedDict((k, np.asarray(v)) for k, v in (scalars or {}).items())
+        self.geom_type = geom_type
+
+    def __len__(self):
+        return len(self.offsets)-1
+
+    def __contains__(self, name):
+        return name in self.columns or name in self.scalars
+
+    def __repr__(self):
+        return '%s(%d geometries, %d vertices)' % (type(self).__name__, len(self),
+                                                  self.offsets[-1])
+
+    @property
+    def lengths(self):
+        "The number of vertices in each geometry"
+        return np.diff(self.offsets)
+
+    def clone(self, columns=None, offsets=None, scalars=None):
+        return RaggedData(self.columns if columns is None else columns,
+                          self.offsets if offsets is None else offsets,
+                          self.scalars if scalars is None else scalars,
+                          self.geom_type)
+
+    def geometry_index(self):
+        "Returns the index of the geometry each vertex belongs to"
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def vertex_values(self, name):
+        "Returns the values of a column for each vertex"
+        if name in self.columns:
+            return self.columns[name]
+        return np.repeat(self.scalars[name], self.lengths)
+
+    def take(self, index):
+        """
+        Returns a new RaggedData containing the geometries at the
+        supplied integer index, gathering all vertices at once.
+        """
+        index = np.asarray(index, dtype=np.int64)
+        lengths = self.lengths[index]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        vertices = (np.repeat(self.offsets[:-1][index]-offsets[:-1], lengths) +
+                    np.arange(offsets[-1]))
+        columns = OrderedDict((k, v[vertices]) for k, v in self.columns.items())
+        scalars = OrderedDict((k, v[index]) for k, v in self.scalars.items())
+        return self.clone(columns, offsets, scalars)
+
+    def filter(self, mask):
+        """
+        Returns a new RaggedData containing only the vertices selected
+        by the boolean mask, dropping geometries without any vertices.
+        """
+        lengths = np.bincount(self.geometry_index()[mask], minlength=len(self))
+        keep = lengths > 0
+        offsets = np.concatenate([[0], np.cumsum(lengths[keep])]).astype(np.int64)
+        columns = OrderedDict((k, v[mask]) for k, v in self.columns.items())
+        scalars = OrderedDict((k, v[keep]) for k, v in self.scalars.items())
+        return self.clone(columns, offsets, scalars)
+
+    @classmethod
+    def from_geometries(cls, geometries, dimensions, geom_type=None):
+        """
+        Packs a list of geometries, each declared as a dictionary of
+        columns, a tuple of arrays, a 2D array or a DataFrame, with
+        the supplied dimension names. Dimensions with scalar values in
+        all geometries are stored as scalars.
+        """
+        from ...element import Polygons
+
+        geoms = []
+        for geom in geometries:
+            if isinstance(geom, dict):
+                if Polygons._hole_key in geom:
+                    raise ValueError('RaggedData does not support polygons with holes.')
+                gt = geom.get('geom_type')
+                if gt is not None:
+                    if geom_type is not None and gt != geom_type:
+                        raise ValueError('RaggedData does not support mixed geometry types.')
+                    geom_type = gt
+                geom = {d: geom[d] for d in dimensions if d in geom}
+            elif isinstance(geom, tuple):
+                geom = dict(zip(dimensions, geom))
+            elif isinstance(geom, np.ndarray):
+                geom = {d: geom[:, i] for i, d in enumerate(dimensions[:geom.shape[1]])}
+            elif util.pd and isinstance(geom, util.pd.DataFrame):
+                geom = {d: geom[d].values for d in dimensions if d in geom}
+            else:
+                raise ValueError('RaggedData cannot pack geometries of type %s.'
+                                 % type(geom).__name__)
+            geoms.append(geom)
+
+        lengths = []
+        for geom in geoms:
+            arrays = [v for v in geom.values() if not util.isscalar(v)]
+            lengths.append(len(arrays[0]) if arrays else 1)
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+        columns, scalars = OrderedDict(), OrderedDict()
+        for d in dimensions:
+            if not any(d in geom for geom in geoms):
+                continue
+            values = [geom.get(d, np.NaN) for geom in geoms]
+            if all(util.isscalar(v) for v in values):
+                scalars[d] = np.array(values)
+            else:
+                columns[d] = np.concatenate(
+                    [np.full(n, v) if util.isscalar(v) else np.asarray(v)
+                     for v, n in zip(values, lengths)]) if values else np.array([])
+        if not geoms:
+            columns = OrderedDict((d, np.array([])) for d in dimensions)
+        return cls(columns, offsets, scalars, geom_type)
+
+
+
+def _column_range(column):
+    "Computes the range of a column following Interface.range"
+    if column.dtype.kind == 'M':
+        return column.min(), column.max()
+    elif len(column) == 0:
+        return np.NaN, np.NaN
+    try:
+        assert column.dtype.kind not in 'SUO'
+        with np.errstate(invalid='ignore'):
+            return (np.nanmin(column), np.nanmax(column))
+    except (AssertionError, TypeError):
+        column = [v for v in util.python2sort(column) if v is not None]
+        if not len(column):
+            return np.NaN, np.NaN
+        return column[0], column[-1]
+
+
+class RaggedInterface(Interface):
+    """
+    RaggedInterface represents path and polygon geometries using the
+    packed RaggedData format, storing the vertices of all geometries
+    in flat columns with offsets rather than as a list of separate
+    tabular datasets. This allows computing values, ranges and
+    selections across many thousands of geometries in a vectorized
+    manner, while split provides views into the flat columns.
+
+    Data may be supplied as RaggedData or as a list of geometries in
+    any of the formats supported by RaggedData.from_geometries. The
+    interface supports lines and polygons without holes.
+    """
+
+    types = (RaggedData,)
+
+    datatype = 'ragged'
+
+    geom_types = ['Polygon', 'Ring', 'Line']
+
+    multi = True
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        if kdims is None:
+            kdims = eltype.kdims
+        if vdims is None:
+            vdims = eltype.vdims
+        dimensions = [dimension_name(d) for d in kdims+vdims]
+
+        if (isinstance(data, list) and len(data) and
+            all(isinstance(d, tuple) and all(util.isscalar(v) for v in d) for d in data)):
+            data = [np.array(data)]
+        if isinstance(data, list):
+            data = RaggedData.from_geometries(data, dimensions)
+        elif not isinstance(data, RaggedData):
+            raise ValueError('RaggedInterface expects RaggedData or a '
+                             'list of geometries.')
+        if data.geom_type is not None and data.geom_type not in cls.geom_types:
+            raise DataError("Geometry type '%s' not recognized, must be one "
+                            "of %s." % (data.geom_type, cls.geom_types))
+        return data, {'kdims': kdims, 'vdims': vdims}, {}
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        dims = 'all' if vdims else 'key'
+        data = dataset.data
+        not_found = [d for d in dataset.dimensions(dims, label='name')
+                     if d not in data]
+        if not_found:
+            raise DataError("Supplied data does not contain specified "
+                            "dimensions, the following dimensions were "
+                            "not found: %s" % repr(not_found), cls)
+        nvertices = data.offsets[-1]
+        for name, column in data.columns.items():
+            if len(column) != nvertices:
+                raise DataError('RaggedData column %r has length %d, expected '
+                                '%d vertices.' % (name, len(column), nvertices), cls)
+        for name, column in data.scalars.items():
+            if len(column) != len(data):
+                raise DataError('RaggedData scalar %r has length %d, expected '
+                                '%d geometries.' % (name, len(column), len(data)), cls)
+
+    @classmethod
+    def geom_type(cls, dataset):
+        from ...element import Polygons, Path
+        if isinstance(dataset, type):
+            eltype = dataset
+        else:
+            eltype = type(dataset)
+            if isinstance(dataset.data, RaggedData) and dataset.data.geom_type:
+                return dataset.data.geom_type
+        if issubclass(eltype, Polygons):
+            return 'Polygon'
+        elif issubclass(eltype, Path):
+            return 'Line'
+
+    @classmethod
+    def _column(cls, dataset, dim):
+        name = dataset.get_dimension(dim, strict=True).name
+        data = dataset.data
+        if name in data.columns:
+            return data.columns[name], False
+        return data.scalars[name], True
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        return cls._column(dataset, dim)[0].dtype.type
+
+    @classmethod
+    def dtype(cls, dataset, dimension):
+        return cls._column(dataset, dimension)[0].dtype
+
+    @classmethod
+    def shape(cls, dataset):
+        return (len(dataset.data), len(dataset.dimensions()))
+
+    @classmethod
+    def length(cls, dataset):
+        return len(dataset.data)
+
+    @classmethod
+    def nonzero(cls, dataset):
+        return bool(len(dataset.data))
+
+    @classmethod
+    def range(cls, dataset, dim):
+        dim = dataset.get_dimension(dim, strict=True)
+
+        # Backward compatibility for Contours/Polygons level
+        level = getattr(dataset, 'level', None)
+        if level is not None and dim is dataset.vdims[0]:
+            return (level, level)
+        if not len(dataset.data):
+            return (None, None)
+        return _column_range(cls._column(dataset, dim)[0])
+
+    @classmethod
+    def _constant(cls, data, column):
+        """
+        Returns a boolean array indicating whether the column is
+        constant across the vertices of each geometry.
+        """
+        starts, ends = data.offsets[:-1], data.offsets[1:]
+        changes = np.concatenate([[0], np.cumsum(column[1:] != column[:-1])])
+        return changes[np.maximum(ends-1, starts)] == changes[starts]
+
+    @classmethod
+    def _closing(cls, dataset):
+        """
+        Returns a boolean array indicating the polygon geometries
+        which have to be closed by repeating their first vertex.
+        """
+        data = dataset.data
+        if cls.geom_type(dataset) not in ('Polygon', 'Ring'):
+            return np.zeros(len(data), dtype=bool)
+        nonempty = data.lengths > 0
+        starts, ends = data.offsets[:-1], np.maximum(data.offsets[1:]-1, 0)
+        closing = np.zeros(len(data), dtype=bool)
+        for kd in dataset.kdims[:2]:
+            column = data.vertex_values(kd.name)
+            if len(column):
+                closing |= column[starts.clip(max=len(column)-1)] != column[ends]
+        return closing & nonempty
+
+    @classmethod
+    def _expanded_index(cls, dataset):
+        """
+        Computes the index of the vertex corresponding to each value
+        of the NaN separated representation of all geometries and the
+        index of the geometry it belongs to. Separators are given an
+        index of -1.
+        """
+        data = dataset.data
+        lengths = data.lengths
+        closing = cls._closing(dataset).astype(np.int64)
+        sizes = np.where(lengths > 0, lengths+closing+1, 0)
+        nonempty = np.where(lengths > 0)[0]
+        if len(nonempty):
+            sizes[nonempty[-1]] -= 1
+        out_offsets = np.concatenate([[0], np.cumsum(sizes)])
+        geoms = np.repeat(np.arange(len(data)), sizes)
+        pos = np.arange(out_offsets[-1])-out_offsets[:-1][geoms]
+        glengths = lengths[geoms]
+        index = data.offsets[:-1][geoms]+pos
+        index[pos == glengths] = data.offsets[:-1][geoms][pos == glengths]
+        index[pos >= (glengths+closing[geoms])] = -1
+        return index, geoms
+
+    @classmethod
+    def values(cls, dataset, dimension, expanded=True, flat=True,
+               compute=True, keep_index=False):
+        """
+        Returns a single array of all geometries separated by NaN
+        values. If expanded keyword is False a single value is
+        returned per geometry if the dimension is constant across
+        each geometry, otherwise an array of arrays is returned.
+        """
+        data = dataset.data
+        if not len(data):
+            return np.array([])
+        dim = dataset.get_dimension(dimension, strict=True)
+        column, scalar = cls._column(dataset, dim)
+        is_geom = dim in dataset.kdims[:2]
+
+        if expanded:
+            index, geoms = cls._expanded_index(dataset)
+            values = column[geoms] if scalar else column[index]
+            separators = index == -1
+            if separators.any():
+                if values.dtype.kind in 'iub':
+                    values = values.astype('float64')
+                elif values.dtype.kind not in 'fcMm':
+                    values = values.astype('object')
+                values[separators] = np.datetime64('NaT') if values.dtype.kind in 'Mm' else np.NaN
+            return values
+
+        nonempty = data.lengths > 0
+        if scalar:
+            return column if is_geom else column[nonempty]
+        constant = cls._constant(data, column)
+        starts = data.offsets[:-1]
+        if not is_geom and constant[nonempty].all():
+            return column[starts[nonempty]]
+        closing = cls._closing(dataset)
+        arrays = []
+        for i in np.where(nonempty)[0]:
+            if constant[i] and not is_geom:
+                arrays.append(column[starts[i]])
+                continue
+            arr = column[starts[i]:data.offsets[i+1]]
+            if closing[i]:
+                arr = np.append(arr, arr[:1])
+            arrays.append(arr)
+        values = np.empty(len(arrays), dtype=object)
+        values[:] = arrays
+        return values
+
+    @classmethod
+    def isscalar(cls, dataset, dim, per_geom=False):
+        """
+        Tests if dimension is scalar in each geometry.
+        """
+        data = dataset.data
+        if not len(data):
+            return True
+        column, scalar = cls._column(dataset, dim)
+        if not scalar:
+            if not cls._constant(data, column).all():
+                return False
+            elif per_geom:
+                return True
+            column = column[data.offsets[:-1][data.lengths > 0]]
+        elif per_geom:
+            return True
+        return len(util.unique_array(column)) <= 1
+
+    @classmethod
+    def has_holes(cls, dataset):
+        return False
+
+    @classmethod
+    def holes(cls, dataset):
+        data = dataset.data
+        if not len(data) or not dataset.kdims:
+            return []
+        xs = data.vertex_values(dataset.kdims[0].name)
+        nans = np.isnan(xs.astype('float'))
+        counts = np.bincount(data.geometry_index()[nans], minlength=len(data))
+        return [[[]]*(n+1) for n in counts]
+
+    @classmethod
+    def geom_bounds(cls, dataset):
+        data = dataset.data
+        bounds = np.full((len(data), 4), np.NaN)
+        nonempty = data.lengths > 0
+        starts = data.offsets[:-1][nonempty]
+        for i, kd in enumerate(dataset.kdims[:2]):
+            column = data.vertex_values(kd.name).astype('float')
+            if len(starts):
+                bounds[nonempty, i] = np.fmin.reduceat(column, starts)
+                bounds[nonempty, i+2] = np.fmax.reduceat(column, starts)
+        return bounds
+
+    @classmethod
+    def spatial_token(cls, dataset):
+        data = dataset.data
+        return (data.offsets,) + tuple(data.columns.get(kd.name, data.scalars.get(kd.name))
+                                       for kd in dataset.kdims[:2])
+
+    @classmethod
+    def _contains_vertices(cls, dataset, index, geometry):
+        from .sindex import points_in_polygon
+        data = dataset.data.take(index)
+        xs, ys = (data.vertex_values(kd.name) for kd in dataset.kdims[:2])
+        inside = points_in_polygon(xs, ys, geometry[:, 0], geometry[:, 1])
+        counts = np.bincount(data.geometry_index()[inside], minlength=len(data))
+        return counts > 0
+
+    @classmethod
+    def _mask(cls, dataset, columns, selection):
+        """
+        Computes a boolean mask matching the selection on the supplied
+        columns by delegating to the columnar dictionary format.
+        """
+        from . import Dataset
+        dims = [dataset.get_dimension(d, strict=True) for d in selection]
+        ds = Dataset(OrderedDict((d.name, columns[d.name]) for d in dims),
+                     kdims=[], vdims=dims, datatype=['dictionary'])
+        return ds.interface.select_mask(ds, selection)
+
+    @classmethod
+    def select_mask(cls, dataset, selection):
+        """
+        Returns a boolean mask over the vertices of all geometries
+        matching the selection.
+        """
+        names = [dataset.get_dimension(d, strict=True).name for d in selection]
+        columns = {name: dataset.data.vertex_values(name) for name in names}
+        return cls._mask(dataset, columns, selection)
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        """
+        Applies the selection to the vertices of all geometries
+        dropping geometries which have no vertices left. Selections on
+        dimensions which are scalar per geometry are applied to whole
+        geometries. A boolean selection_mask may be supplied to select
+        whole geometries.
+        """
+        data = dataset.data
+        if selection_mask is not None:
+            data = data.take(np.where(selection_mask)[0])
+        if not selection or not len(data):
+            return data
+
+        scalar_sel, vertex_sel = {}, {}
+        for d, sel in selection.items():
+            name = dataset.get_dimension(d, strict=True).name
+            if name in data.scalars:
+                scalar_sel[d] = sel
+            else:
+                vertex_sel[d] = sel
+
+        if scalar_sel:
+            mask = cls._mask(dataset, data.scalars, scalar_sel)
+            data = data.take(np.where(mask)[0])
+        if vertex_sel:
+            mask = cls._mask(dataset, data.columns, vertex_sel)
+            data = data.filter(mask)
+        return data
+
+    @classmethod
+    def select_paths(cls, dataset, index):
+        """
+        Allows selecting paths with usual NumPy slicing index.
+        """
+        return dataset.data.take(np.atleast_1d(np.arange(len(dataset.data))[index]))
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        rows, cols = index
+        data = cls.select_paths(dataset, rows)
+        if cols == slice(None):
+            return data
+        elif isinstance(cols, slice):
+            dims = dataset.dimensions()[cols]
+        elif np.isscalar(cols):
+            dims = [dataset.get_dimension(cols)]
+        else:
+            dims = [dataset.get_dimension(d) for d in cols]
+        names = [d.name for d in dims]
+        columns = OrderedDict((k, v) for k, v in data.columns.items() if k in names)
+        scalars = OrderedDict((k, v) for k, v in data.scalars.items() if k in names)
+        return data.clone(columns, scalars=scalars)
+
+    @classmethod
+    def split(cls, dataset, start, end, datatype, **kwargs):
+        """
+        Splits the geometries into regular Datasets or tabular data
+        types, returning views into the packed columns where possible.
+        """
+        data = dataset.data
+        indexes = range(len(data))[start:end]
+        if datatype is None:
+            return [dataset.clone(data.take([i])) for i in indexes]
+        elif not len(indexes):
+            return []
+
+        dimensions = [dataset.get_dimension(d, strict=True)
+                      for d in kwargs.get('dimensions', dataset.dimensions())]
+        breaks = data.offsets[1:-1]
+        if datatype in ('columns', 'dictionary'):
+            geom_type = cls.geom_type(dataset)
+            splits = OrderedDict()
+            for d in dimensions:
+                column, scalar = cls._column(dataset, d)
+                splits[d.name] = column if scalar else np.split(column, breaks)
+            objs = []
+            for i in indexes:
+                obj = OrderedDict((k, v[i]) for k, v in splits.items())
+                if geom_type is not None:
+                    obj['geom_type'] = geom_type
+                objs.append(obj)
+            return objs
+        elif datatype == 'array':
+            array = np.column_stack([data.vertex_values(d.name) for d in dimensions])
+            arrays = np.split(array, breaks)
+            return [arrays[i] for i in indexes]
+        elif datatype == 'dataframe':
+            df = util.pd.DataFrame(OrderedDict((d.name, data.vertex_values(d.name))
+                                               for d in dimensions))
+            offsets = data.offsets
+            return [df.iloc[offsets[i]:offsets[i+1]] for i in indexes]
+        raise ValueError("%s datatype not support" % datatype)
+
+    @classmethod
+    def sort(cls, dataset, by=[], reverse=False):
+        arrays = [cls.values(dataset, d, False) for d in by]
+        if any(a.dtype == object for a in arrays):
+            raise ValueError('RaggedInterface can only sort by dimensions '
+                             'which are scalar in each geometry.')
+        sorting = util.arglexsort(arrays) if len(arrays) > 1 else arrays[0].argsort()
+        if reverse:
+            sorting = sorting[::-1]
+        return dataset.data.take(sorting)
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        # Get dimensions information
+        dimensions = [dataset.get_dimension(d) for d in dimensions]
+        kdims = [kdim for kdim in dataset.kdims if kdim not in dimensions]
+
+        # Update the kwargs appropriately for Element group types
+        group_kwargs = {}
+        group_type = list if group_type == 'raw' else group_type
+        if issubclass(group_type, Element):
+            group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs['kdims'] = kdims
+        group_kwargs.update(kwargs)
+
+        # Find the geometries matching each unique key
+        values = []
+        for d in dimensions:
+            if not cls.isscalar(dataset, d, True):
+                raise ValueError('RaggedInterface can only apply groupby '
+                                 'on scalar dimensions, %s dimension '
+                                 'is not scalar' % d)
+            column, scalar = cls._column(dataset, d)
+            if not scalar:
+                column = column[dataset.data.offsets[:-1].clip(max=len(column)-1)]
+            values.append(column)
+        groups = OrderedDict()
+        for i, key in enumerate(zip(*values)):
+            groups.setdefault(key, []).append(i)
+        grouped_data = [(key, group_type(dataset.data.take(index), **group_kwargs))
+                        for key, index in groups.items()]
+
+        if issubclass(container_type, NdMapping):
+            with item_check(False), sorted_context(False):
+                return container_type(grouped_data, kdims=dimensions)
+        else:
+            return container_type(grouped_data)
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        raise NotImplementedError('Aggregation currently not implemented')
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        raise NotImplementedError('Sampling operation on geometries not supported')
+
+    @classmethod
+    def reindex(cls, dataset, kdims=None, vdims=None):
+        names = [dataset.get_dimension(d).name for d in kdims+vdims]
+        data = dataset.data
+        columns = OrderedDict((k, v) for k, v in data.columns.items() if k in names)
+        scalars = OrderedDict((k, v) for k, v in data.scalars.items() if k in names)
+        return data.clone(columns, scalars=scalars)
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        data = dataset.data
+        rename = lambda k: dimensions[k].name if k in dimensions else k
+        columns = OrderedDict((rename(k), v) for k, v in data.columns.items())
+        scalars = OrderedDict((rename(k), v) for k, v in data.scalars.items())
+        return data.clone(columns, scalars=scalars)
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        data = dataset.data
+        if values is None or util.isscalar(values):
+            values = [values]*len(data)
+        elif not len(values) == len(data):
+            raise ValueError('Added dimension values must be scalar or '
+                             'match the length of the data.')
+        scalars = OrderedDict(data.scalars)
+        scalars[dimension_name(dimension)] = np.asarray(values)
+        return data.clone(scalars=scalars)
+
+
+Interface.register(RaggedInterface)
@@ -0,0 +1,173 @@
+"""
+Spatial indexing utilities used by the geometry interfaces to select
+geometries by their bounding boxes without scanning all of them and
+to test the candidates for exact intersection with a region.
+"""
+
+import numpy as np
+
+
+def hilbert_distance(x, y, p=16):
+    """
+    Computes the distance along a Hilbert curve of order p for integer
+    coordinates in the range [0, 2**p).
+    """
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    n = 2**p
+    d = np.zeros(x.shape, dtype=np.int64)
+    s = n // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx.astype(np.int64)) ^ ry.astype(np.int64))
+        # Rotate the quadrant
+        flip = ~ry & rx
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s //= 2
+    return d
+
+
+def points_in_polygon(xs, ys, px, py):
+    """
+    Returns a boolean mask of the points (xs, ys) which lie inside the
+    polygon defined by the vertices (px, py) using the even-odd rule.
+    """
+    xs, ys = np.asarray(xs, dtype='float'), np.asarray(ys, dtype='float')
+    px, py = np.asarray(px, dtype='float'), np.asarray(py, dtype='float')
+    inside = np.zeros(xs.shape, dtype=bool)
+    j = len(px) - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(len(px)):
+            crosses = (py[i] > ys) != (py[j] > ys)
+            xcross = (px[j]-px[i]) * (ys-py[i]) / (py[j]-py[i]) + px[i]
+            inside ^= crosses & (xs < xcross)
+            j = i
+    return inside
+
+
+def split_parts(xs, ys):
+    """
+    Splits NaN-separated coordinate arrays into a list of (xs, ys)
+    tuples, one for each part of a multi-geometry.
+    """
+    xs, ys = np.asarray(xs, dtype='float'), np.asarray(ys, dtype='float')
+    breaks = np.flatnonzero(np.isnan(xs) | np.isnan(ys))
+    starts = np.concatenate([[0], breaks+1])
+    ends = np.concatenate([breaks, [len(xs)]])
+    return [(xs[s:e], ys[s:e]) for s, e in zip(starts, ends) if e > s]
+
+
+def _edges(xs, ys, closed):
+    "Returns the start and end coordinates of the edges of a part"
+    if closed:
+        return xs, ys, np.roll(xs, -1), np.roll(ys, -1)
+    return xs[:-1], ys[:-1], xs[1:], ys[1:]
+
+
+def segments_intersect(a, b):
+    """
+    Returns whether any of the segments a intersect any of the
+    segments b, where each is a tuple of the (x0, y0, x1, y1) arrays
+    of the segment start and end coordinates. Touching and collinear
+    overlapping segments are considered to intersect.
+    """
+    ax0, ay0, ax1, ay1 = [np.asarray(v)[:, None] for v in a]
+    bx0, by0, bx1, by1 = [np.asarray(v)[None, :] for v in b]
+    def orientation(px, py, qx, qy, rx, ry):
+        return np.sign((qx-px)*(ry-py) - (qy-py)*(rx-px))
+    d1 = orientation(bx0, by0, bx1, by1, ax0, ay0)
+    d2 = orientation(bx0, by0, bx1, by1, ax1, ay1)
+    d3 = orientation(ax0, ay0, ax1, ay1, bx0, by0)
+    d4 = orientation(ax0, ay0, ax1, ay1, bx1, by1)
+    # Bounding box overlap resolves the collinear case
+    overlap = ((np.minimum(ax0, ax1) <= np.maximum(bx0, bx1)) &
+               (np.minimum(bx0, bx1) <= np.maximum(ax0, ax1)) &
+               (np.minimum(ay0, ay1) <= np.maximum(by0, by1)) &
+               (np.minimum(by0, by1) <= np.maximum(ay0, ay1)))
+    return bool(((d1*d2 <= 0) & (d3*d4 <= 0) & overlap).any())
+
+
+def geometry_intersects_polygon(parts, px, py, closed=False):
+    """
+    Returns whether a geometry intersects the polygon defined by the
+    vertices (px, py), i.e. whether one of its vertices lies inside
+    the polygon, one of its edges crosses the polygon boundary or, if
+    the geometry is closed, the polygon lies inside the geometry. The
+    geometry is declared as a list of (xs, ys) parts, which for closed
+    geometries are rings combined using the even-odd rule so that
+    holes may be supplied as additional rings.
+    """
+    px, py = np.asarray(px, dtype='float'), np.asarray(py, dtype='float')
+    for xs, ys in parts:
+        if points_in_polygon(xs, ys, px, py).any():
+            return True
+    boundary = _edges(px, py, True)
+    for xs, ys in parts:
+        if len(xs) > 1 and segments_intersect(_edges(xs, ys, closed), boundary):
+            return True
+    if not closed:
+        return False
+    inside = False
+    for xs, ys in parts:
+        inside ^= points_in_polygon(px[:1], py[:1], xs, ys)[0]
+    return bool(inside)
+
+
+class HilbertRtree(object):
+    """
+    A packed R-tree over a set of bounding boxes. The boxes are sorted
+    by the Hilbert distance of their centers and packed into nodes of
+    node_size entries, each level storing the bounding boxes of the
+    nodes below. The tree is built once and queried by descending only
+    into the nodes which intersect the query bounds.
+    """
+
+    def __init__(self, bounds, node_size=16, p=10):
+        bounds = np.asarray(bounds, dtype='float').reshape(-1, 4)
+        self.node_size = node_size
+        valid = np.where(np.isfinite(bounds).all(axis=1))[0]
+        bounds = bounds[valid]
+        if len(bounds):
+            cx = (bounds[:, 0] + bounds[:, 2]) / 2.
+            cy = (bounds[:, 1] + bounds[:, 3]) / 2.
+            scale = 2**p - 1
+            xs, ys = [(c - c.min()) / ((c.max() - c.min()) or 1) * scale
+                      for c in (cx, cy)]
+            order = np.argsort(hilbert_distance(xs, ys, p), kind='mergesort')
+        else:
+            order = np.array([], dtype=np.int64)
+        self._order = valid[order]
+        levels = [bounds[order]]
+        while len(levels[-1]) > node_size:
+            boxes = levels[-1]
+            starts = np.arange(0, len(boxes), node_size)
+            levels.append(np.column_stack([
+                np.minimum.reduceat(boxes[:, 0], starts),
+                np.minimum.reduceat(boxes[:, 1], starts),
+                np.maximum.reduceat(boxes[:, 2], starts),
+                np.maximum.reduceat(boxes[:, 3], starts)
+            ]))
+        self._levels = levels
+
+    def __len__(self):
+        return len(self._order)
+
+    def intersects(self, bounds):
+        """
+        Returns the sorted indexes of the boxes which intersect the
+        supplied (x0, y0, x1, y1) bounds.
+        """
+        x0, y0, x1, y1 = bounds
+        nodes = np.arange(len(self._levels[-1]))
+        for i, level in enumerate(self._levels[::-1]):
+            if i:
+                nodes = (nodes[:, None] * self.node_size +
+                         np.arange(self.node_size)).ravel()
+                nodes = nodes[nodes < len(level)]
+            boxes = level[nodes]
+            nodes = nodes[(boxes[:, 0] <= x1) & (boxes[:, 2] >= x0) &
+                          (boxes[:, 1] <= y1) & (boxes[:, 3] >= y0)]
+        return np.sort(self._order[nodes])
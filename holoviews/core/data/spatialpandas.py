@@ -142,16 +142,94 @@ class SpatialPandasInterface(MultiInterface):
         series = dataset.data[col]
         return [geom_to_holes(geom) for geom in series]
 
+    @classmethod
+    def geom_bounds(cls, dataset):
+        col = cls.geo_column(dataset.data)
+        return np.asarray(dataset.data[col].array.bounds)
+
+    @classmethod
+    def spatial_token(cls, dataset):
+        # Candidates are looked up in the spatial index of the
+        # geometry array, which spatialpandas keeps up to date
+        return ()
+
+    @classmethod
+    def _spatial_candidates(cls, dataset, bounds):
+        """
+        Uses the spatial index of the spatialpandas geometry array,
+        which is built once and cached on the array.
+        """
+        col = cls.geo_column(dataset.data)
+        mask = dataset.data[col].array.intersects_bounds(tuple(bounds))
+        return np.flatnonzero(mask)
+
+    @classmethod
+    def _selection_bounds(cls, dataset, xsel, ysel):
+        """
+        Converts range selections on the geometry dimensions into
+        (x0, y0, x1, y1) bounds, returning None if there is no range
+        selection on either dimension.
+        """
+        ranges = []
+        for sel in (xsel, ysel):
+            if isinstance(sel, slice):
+                sel = (sel.start, sel.stop)
+            ranges.append(sel if isinstance(sel, tuple) else (None, None))
+        if all(r == (None, None) for r in ranges):
+            return None
+        col = cls.geo_column(dataset.data)
+        total = dataset.data[col].total_bounds
+        (x0, x1), (y0, y1) = ranges
+        return (total[0] if x0 is None else x0, total[1] if y0 is None else y0,
+                total[2] if x1 is None else x1, total[3] if y1 is None else y1)
+
+    @classmethod
+    def _point_mask(cls, dataset, selection):
+        """
+        Returns a mask of the rows of a dataset of single points
+        matching the selections on the geometry dimensions.
+        """
+        mask = np.ones(len(dataset.data), dtype=bool)
+        for dim, k in selection.items():
+            values = cls.values(dataset, dim)
+            if isinstance(k, tuple):
+                k = slice(*k)
+            if isinstance(k, slice):
+                if k.start is not None:
+                    mask &= k.start <= values
+                if k.stop is not None:
+                    mask &= values < k.stop
+            elif isinstance(k, (set, list)):
+                mask &= np.isin(values, list(k))
+            else:
+                mask &= values == k
+        return mask
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
+        from spatialpandas.geometry import MultiPointDtype
+        from ...element import Path
         xdim, ydim = cls.geom_dims(dataset)
-        selection.pop(xdim.name, None)
-        selection.pop(ydim.name, None)
+        xsel = selection.pop(xdim.name, None)
+        ysel = selection.pop(ydim.name, None)
         df = dataset.data
-        if not selection:
+        bounds, point_sel = None, {}
+        if len(df) and isinstance(dataset, Path):
+            # Selects the geometries intersecting the bounds
+            bounds = cls._selection_bounds(dataset, xsel, ysel)
+        elif len(df) and cls.geom_type(dataset) == 'Point' and not isinstance(
+                df[cls.geo_column(df)].dtype, MultiPointDtype):
+            # Selects the points inside the ranges
+            point_sel = {d.name: sel for d, sel in ((xdim, xsel), (ydim, ysel))
+                         if sel is not None}
+        if not selection and bounds is None and not point_sel:
             return df
         elif selection_mask is None:
             selection_mask = cls.select_mask(dataset, selection)
+        if bounds is not None:
+            selection_mask = selection_mask & cls.spatial_mask(dataset, bounds)
+        if point_sel:
+            selection_mask = selection_mask & cls._point_mask(dataset, point_sel)
         indexed = cls.indexed(dataset, selection)
         df = df.iloc[selection_mask]
         if indexed and len(df) == 1 and len(dataset.vdims) == 1:
@@ -10,7 +10,7 @@ from ..dimension import Dimension, asdim, dimension_name
 from ..ndmapping import NdMapping, item_check, sorted_context
 from ..element import Element
 from .grid import GridInterface
-from .interface import Interface, DataError, dask_array_module
+from .interface import Interface, DataError, dask_array_module, dask_reduction
 
 
 class XArrayInterface(GridInterface):
@@ -247,6 +247,10 @@ class XArrayInterface(GridInterface):
     @classmethod
     def range(cls, dataset, dimension):
         dim = dataset.get_dimension(dimension, strict=True).name
+        if dim in dataset.vdims:
+            ranges = cls.dask_ranges(dataset)
+            if dim in ranges:
+                return ranges[dim]
         if dataset._binned and dimension in dataset.kdims:
             data = cls.coords(dataset, dim, edges=True)
             if data.dtype.kind == 'M':
@@ -303,10 +307,19 @@ class XArrayInterface(GridInterface):
                     v = v.to_dataframe().reset_index()
                 data.append((k, group_type(v, **group_kwargs)))
         else:
-            unique_iters = [cls.values(dataset, d, False) for d in group_by]
-            indexes = zip(*util.cartesian_product(unique_iters))
-            for k in indexes:
-                sel = dataset.data.sel(**dict(zip(group_by, k)))
+            # Select groups by integer position, avoiding index lookups
+            unique_iters, positions = [], []
+            for d in group_by:
+                coords = np.atleast_1d(dataset.data[d].data)
+                index = np.arange(len(coords))
+                if len(coords) > 1 and np.all(coords[1:] < coords[:-1]):
+                    coords, index = coords[::-1], index[::-1]
+                unique_iters.append(coords)
+                positions.append(index)
+            indexes = zip(zip(*util.cartesian_product(unique_iters)),
+                          zip(*util.cartesian_product(positions)))
+            for k, index in indexes:
+                sel = dataset.data.isel(**dict(zip(group_by, index)))
                 if drop_dim:
                     sel = sel.to_dataframe().reset_index()
                 data.append((k, group_type(sel, **group_kwargs)))
@@ -336,7 +349,7 @@ class XArrayInterface(GridInterface):
             return data.values if isinstance(data, xr.DataArray) else data
 
         data = np.atleast_1d(dataset.data[dim].data)
-        if ordered and data.shape and np.all(data[1:] < data[:-1]):
+        if ordered and data.shape and cls.descending(dataset, dim):
             data = data[::-1]
         shape = cls.shape(dataset, True)
 
@@ -389,9 +402,15 @@ class XArrayInterface(GridInterface):
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
         reduce_dims = [d.name for d in dataset.kdims if d not in dimensions]
+        function = dask_reduction(function)
         return dataset.data.reduce(function, dim=reduce_dims, **kwargs), []
 
 
+    @classmethod
+    def persist(cls, dataset):
+        return dataset.data.persist()
+
+
     @classmethod
     def unpack_scalar(cls, dataset, data):
         """
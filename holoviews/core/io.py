@@ -15,20 +15,29 @@ Archives: A collection of HoloViews objects that are first collected
 from __future__ import absolute_import
 
 import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
+import json, tempfile, importlib
+import datetime as dt
 from collections import defaultdict
 
 from io import BytesIO
 from hashlib import sha256
 
+try:
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+except ImportError:
+    ThreadPoolExecutor, ProcessPoolExecutor = None, None
+
+import numpy as np
 import param
 from param.parameterized import bothmethod
 
-from .dimension import LabelledData
+from .data import Dataset
+from .dimension import Dimension, LabelledData
 from .element import Collator, Element
 from .overlay import Overlay, Layout
 from .ndmapping import OrderedDict, NdMapping, UniformNdMapping
 from .options import Store
-from .util import unique_iterator, group_sanitizer, label_sanitizer
+from .util import basestring, unique_iterator, group_sanitizer, label_sanitizer
 
 
 def sanitizer(name, replacements=[(':','_'), ('/','_'), ('\\','_')]):
@@ -518,6 +527,21 @@ def simple_name_generator(obj):
 
 
 
+def _export_entries(exporters, obj):
+    """
+    Render an object through each of the supplied exporters returning
+    a list of (data, info) tuples. Defined at the module level so it
+    may be dispatched to a process pool.
+    """
+    entries = []
+    for exporter in exporters:
+        rendered = exporter(obj)
+        if rendered is None: continue
+        entries.append(rendered)
+    return entries
+
+
+
 class FileArchive(Archive):
     """
     A file archive stores files on disk, either unpacked in a
@@ -597,6 +621,24 @@ class FileArchive(Archive):
        Flushed the contents of the archive after export.
        """)
 
+    batch = param.Boolean(default=False, doc="""
+       Whether to defer rendering of added objects until export. In
+       batch mode objects are queued by add and rendered concurrently
+       on export, identical objects are only rendered once and, when
+       packing into a zip or tar file, members are written as soon as
+       they have been rendered.""")
+
+    executor = param.ObjectSelector(default='auto', objects=['auto', 'thread', 'process'], doc="""
+       The type of worker pool used to render objects in batch mode.
+       Since the matplotlib backend is not thread-safe 'auto' uses
+       processes if any of the exporters renders with matplotlib and
+       threads otherwise. When using processes the exporters and
+       objects must be picklable.""")
+
+    max_workers = param.Integer(default=None, bounds=(1, None), doc="""
+       The maximum number of workers used to render objects in batch
+       mode. If None the executor default is used.""")
+
 
     ffields = {'type', 'group', 'label', 'obj', 'SHA', 'timestamp', 'dimensions'}
     efields = {'timestamp'}
@@ -615,6 +657,8 @@ class FileArchive(Archive):
         super(FileArchive, self).__init__(**params)
         #  Items with key: (basename,ext) and value: (data, info)
         self._files = OrderedDict()
+        # Objects queued in batch mode as (obj, filename, info) tuples
+        self._pending = []
         self._validate_formatters()
 
 
@@ -673,12 +717,13 @@ class FileArchive(Archive):
 
         self._validate_formatters()
 
+        if data is None and self.batch:
+            self._pending.append((obj, filename, info))
+            return
+
         entries = []
         if data is None:
-            for exporter in self.exporters:
-                rendered = exporter(obj)
-                if rendered is None: continue
-                (data, new_info) = rendered
+            for (data, new_info) in _export_entries(self.exporters, obj):
                 info = dict(info, **new_info)
                 entries.append((data, info))
         else:
@@ -688,6 +733,63 @@ class FileArchive(Archive):
             self._add_content(obj, data, info, filename=filename)
 
 
+    def _content_hash(self, obj):
+        """
+        Hash of the pickled object (including its custom options) used
+        to render identical objects only once in batch mode.
+        """
+        try:
+            return sha256(Store.dumps(obj, protocol=2)).hexdigest()
+        except Exception:
+            return id(obj)
+
+
+    def _make_executor(self):
+        executor = self.executor
+        if executor == 'auto':
+            backends = [getattr(e, 'backend', None) for e in self.exporters]
+            executor = 'process' if 'matplotlib' in backends else 'thread'
+        if executor == 'process':
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+
+    def _render_pending(self):
+        """
+        Renders all objects queued in batch mode concurrently, adding
+        their contents to the archive in the order they were added and
+        yielding each new file entry as soon as it is available.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        hashes = [self._content_hash(obj) for obj, _, _ in pending]
+        executor = None if ThreadPoolExecutor is None else self._make_executor()
+        results = OrderedDict()
+        for key, (obj, _, _) in zip(hashes, pending):
+            if key in results:
+                continue
+            elif executor is None:
+                results[key] = _export_entries(self.exporters, obj)
+            else:
+                results[key] = executor.submit(_export_entries, self.exporters, obj)
+
+        try:
+            for key, (obj, filename, info) in zip(hashes, pending):
+                entries = results[key]
+                if executor is not None:
+                    entries = entries.result()
+                for (data, new_info) in entries:
+                    info = dict(info, **new_info)
+                    fkey = self._compute_filename(obj, info, filename=filename)
+                    self._files[fkey] = (data, info)
+                    yield fkey, (data, info)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
     def _add_content(self, obj, data, info, filename=None):
         (unique_key, ext) = self._compute_filename(obj, info, filename=filename)
         self._files[(unique_key, ext)] = (data, info)
@@ -810,9 +912,26 @@ class FileArchive(Archive):
 
         info = dict(info, timestamp=tstamp)
         export_name = self._format(self.export_name, info)
+        root = os.path.abspath(self.root)
+
+        # Stream rendered batch entries directly into zip/tar archives
+        expected = len(self) + len(self._pending) * len(self.exporters)
+        if self._pending and self.pack and expected > 1:
+            files = itertools.chain(list(self._files.items()), self._render_pending())
+            files = (((self._format(base, info), ext), val)
+                     for ((base, ext), val) in files)
+            if self.archive_format == 'zip':
+                self._zip_archive(export_name, files, root)
+            elif self.archive_format == 'tar':
+                self._tar_archive(export_name, files, root)
+            if self.flush_archive:
+                self._files = OrderedDict()
+            return
+
+        for _ in self._render_pending():
+            pass
         files = [((self._format(base, info), ext), val)
                  for ((base, ext), val) in self._files.items()]
-        root = os.path.abspath(self.root)
         # Make directory and populate if multiple files and not packed
         if len(self) > 1 and not self.pack:
             self._directory_archive(export_name, files, root)
@@ -854,3 +973,293 @@ class FileArchive(Archive):
     def listing(self):
         "Return a list of filename entries currently in the archive"
         return ['.'.join([f,ext]) if ext else f for (f,ext) in self._files.keys()]
+
+
+
+class OperationCache(param.Parameterized):
+    """
+    OperationCache is an on-disk, content-addressed cache for the
+    results of deterministic Operations. Entries are keyed on a hash
+    of the input element data and the operation parameters, so the
+    cache may be shared between kernels or server processes on the
+    same host.
+
+    Results are stored as npz files containing the dimension values
+    and a JSON description of the element, which avoids pickle
+    entirely. Only Dataset results whose values can be stored as
+    non-object arrays are cached, other results are simply recomputed.
+    """
+
+    path = param.String(default=None, allow_None=True, doc="""
+        Directory the cache entries are stored in. Defaults to a
+        holoviews_cache directory in the system temp directory.""")
+
+    max_size = param.Integer(default=2**30, bounds=(0, None), doc="""
+        Maximum total size of the cache in bytes. Once exceeded the
+        least recently used entries are evicted.""")
+
+    # Operation parameters which do not affect the result
+    _ignored_params = ['name', 'dynamic', 'streams', 'link_inputs', 'disk_cache']
+
+    def __init__(self, **params):
+        super(OperationCache, self).__init__(**params)
+        if self.path is None:
+            self.path = os.path.join(tempfile.gettempdir(), 'holoviews_cache')
+
+    def key(self, operation, element):
+        """
+        Returns the hash identifying the result of applying the
+        operation to the element or None if the inputs cannot be
+        hashed deterministically.
+        """
+        values = dict(operation.param.get_param_values())
+        values.update(operation.p.items())
+        params = [(k, v) for k, v in sorted(values.items())
+                  if k not in self._ignored_params]
+        try:
+            token = '|'.join([self._token(type(operation)),
+                              self._token(element), self._token(params)])
+        except ValueError:
+            return None
+        return sha256(token.encode('utf-8')).hexdigest()
+
+    def load(self, key):
+        """
+        Returns the cached element for the key or None if there is
+        no valid entry.
+        """
+        path = os.path.join(self.path, key+'.npz')
+        if not os.path.isfile(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as f:
+                arrays = {k: f[k] for k in f.files}
+            element = self._deserialize(arrays)
+            os.utime(path, None)
+        except Exception:
+            return None
+        return element
+
+    def store(self, key, element):
+        """
+        Stores the element under the supplied key, returning whether
+        the element could be cached.
+        """
+        arrays = self._serialize(element)
+        if arrays is None:
+            return False
+        if not os.path.isdir(self.path):
+            try:
+                os.makedirs(self.path)
+            except OSError:
+                if not os.path.isdir(self.path):
+                    raise
+        # Write to a temporary file first so concurrent readers never
+        # see partially written entries
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            getattr(os, 'replace', os.rename)(tmp, os.path.join(self.path, key+'.npz'))
+        except Exception:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache is
+        smaller than max_size.
+        """
+        entries = []
+        for f in os.listdir(self.path):
+            if not f.endswith('.npz'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, f))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, f))
+        total = sum(size for _, size, _ in entries)
+        for _, size, f in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.path, f))
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        "Removes all entries from the cache."
+        if not os.path.isdir(self.path):
+            return
+        for f in os.listdir(self.path):
+            if f.endswith('.npz'):
+                try:
+                    os.remove(os.path.join(self.path, f))
+                except OSError:
+                    pass
+
+    @classmethod
+    def _values(cls, element):
+        "Returns the dimension values of an element in storable form."
+        gridded = element.interface.gridded
+        values = []
+        for d in element.dimensions():
+            if gridded and d in element.kdims:
+                vals = element.dimension_values(d, expanded=False)
+            else:
+                vals = element.dimension_values(d, flat=not gridded)
+            values.append(np.asarray(vals))
+        return values
+
+    @classmethod
+    def _token(cls, obj):
+        """
+        Returns a string token uniquely and deterministically
+        identifying the object, raising a ValueError if no such
+        token can be generated.
+        """
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.kind == 'O':
+                return 'object:%s' % cls._token(obj.tolist())
+            digest = sha256(np.ascontiguousarray(obj).reshape(-1).view(np.uint8)).hexdigest()
+            return 'array:%s:%s:%s' % (obj.dtype.str, obj.shape, digest)
+        elif isinstance(obj, Dataset):
+            params = [(k, v) for k, v in obj.param.get_param_values()
+                      if k not in ('name', 'datatype', 'kdims', 'vdims')]
+            tokens = [cls._token(type(obj)), cls._token(params),
+                      cls._token(obj.dimensions()),
+                      cls._token(cls._values(obj))]
+            nodes = getattr(obj, 'nodes', None)
+            if isinstance(nodes, Dataset):
+                tokens.append(cls._token(nodes))
+            return 'element:%s' % ':'.join(tokens)
+        elif isinstance(obj, (list, tuple)):
+            return '(%s)' % ','.join(cls._token(o) for o in obj)
+        elif isinstance(obj, dict):
+            return '{%s}' % ','.join('%s:%s' % (cls._token(k), cls._token(v))
+                                     for k, v in sorted(obj.items(), key=lambda x: repr(x[0])))
+        elif obj is None or isinstance(obj, (bool, int, float, basestring, np.generic,
+                                             dt.datetime, dt.date, dt.timedelta)):
+            return repr(obj)
+        elif isinstance(obj, Dimension):
+            return '%s%s' % (cls._token(type(obj)), cls._token(obj.param.get_param_values()))
+        elif isinstance(obj, param.Parameterized):
+            values = [(k, v) for k, v in obj.param.get_param_values() if k != 'name']
+            return '%s%s' % (cls._token(type(obj)), cls._token(values))
+        elif isinstance(obj, type) or callable(obj):
+            name = getattr(obj, '__qualname__', getattr(obj, '__name__', None))
+            if name is None or '<' in name:
+                raise ValueError('Cannot generate a token for %r' % obj)
+            module = getattr(obj, '__module__', None) or type(obj).__module__
+            return '%s.%s' % (module, name)
+        elif hasattr(obj, '__dict__'):
+            return '%s%s' % (cls._token(type(obj)), cls._token(vars(obj)))
+        token = repr(obj)
+        if ' at 0x' in token:
+            raise ValueError('Cannot generate a token for %r' % obj)
+        return token
+
+    # Element parameters which are serialized separately
+    _element_params = ['name', 'datatype', 'kdims', 'vdims', 'group', 'label', 'bounds']
+
+    @classmethod
+    def _encode(cls, value):
+        """
+        Encodes a parameter value as JSON compatible data preserving
+        tuples, raising a ValueError if the value cannot be encoded.
+        """
+        if isinstance(value, tuple):
+            return {'__tuple__': [cls._encode(v) for v in value]}
+        elif isinstance(value, list):
+            return [cls._encode(v) for v in value]
+        elif isinstance(value, np.generic):
+            return cls._encode(value.item())
+        elif value is None or isinstance(value, (bool, int, float, basestring)):
+            return value
+        raise ValueError('Cannot encode %r' % value)
+
+    @classmethod
+    def _decode(cls, value):
+        "Decodes a parameter value encoded by _encode."
+        if isinstance(value, dict) and '__tuple__' in value:
+            return tuple(cls._decode(v) for v in value['__tuple__'])
+        elif isinstance(value, list):
+            return [cls._decode(v) for v in value]
+        return value
+
+    @classmethod
+    def _dimension_spec(cls, dim):
+        spec = {k: cls._encode(v) for k, v in dim.param.get_param_values(onlychanged=True)}
+        spec['name'] = dim.name
+        return spec
+
+    @classmethod
+    def _serialize(cls, element):
+        """
+        Converts an element into a dictionary of arrays, returning
+        None if the element cannot be stored or would not be restored
+        exactly.
+        """
+        eltype = type(element)
+        if not isinstance(element, Dataset) or not eltype.__module__.startswith('holoviews.'):
+            return None
+        values = cls._values(element)
+        if any(vals.dtype.kind == 'O' for vals in values):
+            return None
+        try:
+            params = {k: cls._encode(v) for k, v in
+                      element.param.get_param_values(onlychanged=True)
+                      if k not in cls._element_params}
+            meta = {'module': eltype.__module__, 'type': eltype.__name__,
+                    'group': element.group, 'label': element.label,
+                    'datatype': element.interface.datatype, 'params': params,
+                    'kdims': [cls._dimension_spec(d) for d in element.kdims],
+                    'vdims': [cls._dimension_spec(d) for d in element.vdims]}
+            bounds = getattr(element, 'bounds', None)
+            if hasattr(bounds, 'lbrt'):
+                meta['bounds'] = cls._encode(bounds.lbrt())
+            arrays = {'__meta__': np.array(json.dumps(meta))}
+        except (TypeError, ValueError):
+            return None
+        for i, vals in enumerate(values):
+            arrays['dim_%d' % i] = vals
+
+        # Only cache elements which round-trip exactly
+        try:
+            restored = cls._deserialize(arrays)
+            if (restored.interface is not element.interface or
+                cls._token(restored) != cls._token(element)):
+                return None
+        except Exception:
+            return None
+        return arrays
+
+    @classmethod
+    def _deserialize(cls, arrays):
+        "Reconstructs an element from a dictionary of arrays."
+        meta = json.loads(str(arrays['__meta__']))
+        if not meta['module'].startswith('holoviews.'):
+            raise ValueError('Can only restore HoloViews elements.')
+        eltype = getattr(importlib.import_module(meta['module']), meta['type'])
+        if not (isinstance(eltype, type) and issubclass(eltype, Dataset)):
+            raise ValueError('Can only restore HoloViews elements.')
+        dims = {}
+        for group in ('kdims', 'vdims'):
+            dims[group] = []
+            for spec in meta[group]:
+                spec = {k: cls._decode(v) for k, v in spec.items()}
+                dims[group].append(Dimension(spec.pop('name'), **spec))
+        ndims = len(dims['kdims']) + len(dims['vdims'])
+        data = tuple(arrays['dim_%d' % i] for i in range(ndims))
+        params = {k: cls._decode(v) for k, v in meta.get('params', {}).items()}
+        params.update(dims, group=meta['group'], label=meta['label'])
+        if 'datatype' in meta:
+            params['datatype'] = [meta['datatype']]
+        if 'bounds' in meta:
+            params['bounds'] = tuple(cls._decode(meta['bounds']))
+        return eltype(data, **params)
@@ -4,6 +4,9 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
+import operator
+import warnings
+
 from itertools import cycle
 from operator import itemgetter
 import numpy as np
@@ -55,6 +58,23 @@ class sorted_context(object):
 
 
 
+def _compare(op, column, value):
+    """
+    Applies a comparison operator between a key column and a value
+    returning a boolean mask or None if the comparison is invalid.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            result = np.asarray(op(column, value))
+    except Exception:
+        return None
+    if result.shape != column.shape or result.dtype.kind != 'b':
+        return None
+    return result
+
+
+
 class MultiDimensionalMapping(Dimensioned):
     """
     An MultiDimensionalMapping is a Dimensioned mapping (like a
@@ -94,6 +114,9 @@ class MultiDimensionalMapping(Dimensioned):
     _deep_indexable = False
     _check_items = True
 
+    # Cached columnar index of the keys
+    _key_index = None
+
     def __init__(self, initial_items=None, kdims=None, **params):
         if isinstance(initial_items, MultiDimensionalMapping):
             params = dict(util.get_param_values(initial_items), **dict(params))
@@ -244,9 +267,41 @@ class MultiDimensionalMapping(Dimensioned):
         return data
 
 
+    def _key_columns(self):
+        """
+        Returns a columnar index of the keys as a tuple of the key
+        values and a numpy array for each key dimension. Numeric key
+        values are stored as typed arrays and all other values as
+        object arrays. The index is cached until the keys change.
+        """
+        keys = list(self.data.keys())
+        if self._key_index is not None and self._key_index[0] == keys:
+            return self._key_index[1:]
+        values = list(zip(*keys)) if keys else [()]*self.ndims
+        columns = []
+        for vals in values:
+            column = np.array(vals)
+            if column.dtype.kind not in 'biuf' or column.ndim != 1:
+                column = np.empty(len(vals), dtype=object)
+                column[:] = vals
+            columns.append(column)
+        self._key_index = (keys, values, columns)
+        return values, columns
+
+
     def _resort(self):
-        self.data = OrderedDict(dimension_sort(self.data, self.kdims, self.vdims,
-                                               range(self.ndims)))
+        order = None
+        if len(self.data) and self.ndims and not any(d.values for d in self.kdims):
+            _, columns = self._key_columns()
+            if all(c.dtype.kind in 'biu' or (c.dtype.kind == 'f' and not np.isnan(c).any())
+                   for c in columns):
+                order = np.lexsort(columns[::-1])
+        if order is None:
+            self.data = OrderedDict(dimension_sort(self.data, self.kdims, self.vdims,
+                                                   range(self.ndims)))
+        else:
+            items = list(self.data.items())
+            self.data = OrderedDict([items[i] for i in order])
 
 
     def clone(self, data=None, shared_data=True, *args, **overrides):
@@ -393,7 +448,8 @@ class MultiDimensionalMapping(Dimensioned):
         """
         dimension = self.get_dimension(dimension, strict=True)
         if dimension in self.kdims:
-            return np.array([k[self.get_dimension_index(dimension)] for k in self.data.keys()])
+            values, _ = self._key_columns()
+            return np.array(values[self.get_dimension_index(dimension)])
         if dimension in self.dimensions():
             values = [el.dimension_values(dimension, expanded, flat) for el in self
                       if dimension in el.dimensions()]
@@ -578,6 +634,12 @@ class MultiDimensionalMapping(Dimensioned):
     def __len__(self):
         return len(self.data)
 
+    def __getstate__(self):
+        "Drops the cached key index when pickling"
+        state = super(MultiDimensionalMapping, self).__getstate__()
+        state.pop('_key_index', None)
+        return state
+
     ######################
     #    Deprecations    #
     ######################
@@ -660,13 +722,18 @@ class NdMapping(MultiDimensionalMapping):
                for el in map_slice):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
-            conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
-            for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
-                values = dim.values
-                items = [(k, v) for k, v in items
-                         if condition(values.index(k[cidx])
-                                      if values else k[cidx])]
+            mask = self._slice_mask(map_slice)
+            if mask is None:
+                conditions = self._generate_conditions(map_slice)
+                items = self.data.items()
+                for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
+                    values = dim.values
+                    items = [(k, v) for k, v in items
+                             if condition(values.index(k[cidx])
+                                          if values else k[cidx])]
+            else:
+                items = list(self.data.items())
+                items = [items[i] for i in np.flatnonzero(mask)]
             sliced_items = []
             for k, v in items:
                 val_slice = self._dataslice(v, data_slice)
@@ -678,6 +745,46 @@ class NdMapping(MultiDimensionalMapping):
                 return self.clone(sliced_items)
 
 
+    def _slice_mask(self, map_slice):
+        """
+        Computes a boolean mask of the keys selected by the map_slice
+        using the columnar key index. Returns None if the slice cannot
+        be evaluated vectorized, e.g. if a dimension declares explicit
+        values or the keys cannot be compared to the slice values.
+        """
+        if any(dim.values for dim in self.kdims):
+            return None
+        values, columns = self._key_columns()
+        mask = np.ones(len(self), dtype=bool)
+        for vals, column, dim_slice in zip(values, columns, map_slice):
+            if dim_slice is Ellipsis:
+                continue
+            elif isinstance(dim_slice, slice):
+                selected = mask
+                if dim_slice.start is not None:
+                    selected = _compare(operator.ge, column, dim_slice.start)
+                if dim_slice.stop is not None and selected is not None:
+                    upto = _compare(operator.lt, column, dim_slice.stop)
+                    selected = None if upto is None else selected & upto
+            elif isinstance(dim_slice, (set, list)):
+                selected = np.zeros(len(self), dtype=bool)
+                for value in dim_slice:
+                    matches = _compare(operator.eq, column, value)
+                    if matches is None:
+                        return None
+                    selected |= matches
+            elif callable(dim_slice):
+                selected = np.array([bool(dim_slice(v)) for v in vals], dtype=bool)
+            elif isinstance(dim_slice, tuple):
+                return None
+            else:
+                selected = _compare(operator.eq, column, dim_slice)
+            if selected is None:
+                return None
+            mask = mask & selected
+        return mask
+
+
     def _expand_slice(self, indices):
         """
         Expands slices containing steps into a list.
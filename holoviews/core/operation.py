@@ -5,6 +5,7 @@ the purposes of analysis or visualization.
 import param
 from .dimension import ViewableElement
 from .element import Element
+from .io import OperationCache
 from .layout import Layout
 from .overlay import NdOverlay, Overlay
 from .spaces import Callable, HoloMap
@@ -61,6 +62,12 @@ class Operation(param.ParameterizedFunction):
         List of streams that are applied if dynamic=True, allowing
         for dynamic interaction with the plot.""")
 
+    disk_cache = param.ClassSelector(default=None, class_=OperationCache, doc="""
+        Optional OperationCache used to persist the results of the
+        operation on disk. Results are keyed on the input data and
+        the operation parameters, so this should only be enabled
+        for deterministic operations.""")
+
     # Hooks to allow external libraries to extend existing operations.
     # Preprocessor hooks should accept the operation and input element
     # and return a dictionary of data which will be made available to
@@ -126,7 +133,13 @@ class Operation(param.ParameterizedFunction):
 
         element_pipeline = getattr(element, '_pipeline', None)
 
-        ret = self._process(element, key)
+        cache = getattr(self.p, 'disk_cache', None)
+        cache_key = None if cache is None else cache.key(self, element)
+        ret = None if cache_key is None else cache.load(cache_key)
+        if ret is None:
+            ret = self._process(element, key)
+            if cache_key is not None:
+                cache.store(cache_key, ret)
         for hook in self._postprocess_hooks:
             ret = hook(self, ret, **kwargs)
 
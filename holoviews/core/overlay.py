@@ -34,6 +34,8 @@ class Overlayable(object):
             callback._is_overlay = True
             return other.clone(shared_data=False, callback=callback,
                                streams=dimensioned_streams(other))
+        elif type(other).__name__ == 'LazyHoloMap':
+            return other.__mul__(self, reverse=True)
         if isinstance(other, UniformNdMapping) and not isinstance(other, CompositeOverlay):
             items = [(k, self * v) for (k, v) in other.items()]
             return other.clone(items)
@@ -14,7 +14,9 @@ import param
 
 from . import traversal, util
 from .accessors import Opts, Redim
-from .dimension import OrderedDict, Dimension, ViewableElement
+from .dimension import (
+    OrderedDict, Dimension, Dimensioned, ViewableElement, dimension_name
+)
 from .layout import Layout, AdjointLayout, NdLayout, Empty
 from .ndmapping import UniformNdMapping, NdMapping, item_check
 from .overlay import Overlay, CompositeOverlay, NdOverlay, Overlayable
@@ -585,6 +587,294 @@ class HoloMap(UniformNdMapping, Overlayable):
                 return histmaps[0]
 
 
+class _ThunkCache(object):
+    """
+    Least-recently-used cache of the values of evaluated thunks,
+    holding at most size values.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._values = OrderedDict()
+
+    def evaluate(self, thunk):
+        key = id(thunk)
+        if key in self._values:
+            entry = self._values.pop(key)
+        else:
+            entry = (thunk, thunk.fn())
+        self._values[key] = entry
+        while len(self._values) > max(self.size, 1):
+            self._values.popitem(last=False)
+        return entry[1]
+
+
+class _Thunk(object):
+    """
+    A deferred value computed by calling fn without arguments. If a
+    _ThunkCache is supplied the value is cached until it is evicted.
+    """
+
+    __slots__ = ['fn', 'cache']
+
+    def __init__(self, fn, cache=None):
+        self.fn = fn
+        self.cache = cache
+
+    def __call__(self):
+        if self.cache is None:
+            return self.fn()
+        return self.cache.evaluate(self)
+
+    def __getitem__(self, indices):
+        return _Thunk(lambda: self()[indices], self.cache)
+
+
+class _LazyOrderedDict(OrderedDict):
+    """
+    OrderedDict which evaluates _Thunk values when they are accessed.
+    Within the deferred context the raw thunks are returned instead,
+    which allows filtering and reordering the items without
+    evaluating them.
+    """
+
+    _deferred = False
+
+    @contextmanager
+    def deferred(self):
+        deferred = self._deferred
+        self._deferred = True
+        try:
+            yield
+        finally:
+            self._deferred = deferred
+
+    def _evaluate(self, value):
+        if isinstance(value, _Thunk) and not self._deferred:
+            return value()
+        return value
+
+    def raw_items(self):
+        return list(OrderedDict.items(self))
+
+    def __getitem__(self, key):
+        return self._evaluate(OrderedDict.__getitem__(self, key))
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        return self._evaluate(OrderedDict.pop(self, key, *default))
+
+    def values(self):
+        return (self._evaluate(v) for v in OrderedDict.values(self))
+
+    def items(self):
+        return ((k, self._evaluate(v)) for k, v in OrderedDict.items(self))
+
+    def copy(self):
+        return type(self)(self.raw_items())
+
+    itervalues = values
+    iteritems = items
+
+
+class LazyHoloMap(HoloMap):
+    """
+    A LazyHoloMap is a HoloMap whose values may be supplied as
+    callables returning the element for each key. The callables are
+    only evaluated when a value is accessed and the most recently
+    accessed values are cached, which keeps the memory footprint
+    bounded for very large parameter sweeps.
+
+    Keys, slicing and dimension_values along the key dimensions do
+    not require evaluating any values and the range of value
+    dimensions may be declared up front via the ranges parameter.
+    Mapping functions, applying options and overlaying an element
+    are deferred until a value is evaluated. When displayed, on its
+    own or in a layout, a LazyHoloMap is converted to a DynamicMap so
+    that only the frames which are shown are evaluated.
+    """
+
+    cache_size = param.Integer(default=100, bounds=(1, None), doc="""
+        The number of evaluated values to keep in memory.""")
+
+    ranges = param.Dict(default={}, doc="""
+        Dictionary mapping from dimension name to a (lower, upper)
+        tuple, used instead of evaluating every value to compute the
+        range along a dimension.""")
+
+    def __init__(self, initial_items=None, kdims=None, group=None, label=None, **params):
+        if isinstance(initial_items, LazyHoloMap):
+            params = dict(util.get_param_values(initial_items), **params)
+            initial_items = initial_items.data
+        if isinstance(initial_items, _LazyOrderedDict):
+            initial_items = initial_items.raw_items()
+        elif isinstance(initial_items, dict):
+            initial_items = list(initial_items.items())
+        cache = _ThunkCache(params.get('cache_size', type(self).cache_size))
+        if isinstance(initial_items, list):
+            initial_items = [(k, self._defer(v, cache)) for k, v in initial_items]
+        super(LazyHoloMap, self).__init__(initial_items, kdims, group, label, **params)
+        if not isinstance(self.data, _LazyOrderedDict):
+            self.data = _LazyOrderedDict(self.data)
+
+    @classmethod
+    def _defer(cls, value, cache):
+        if callable(value) and not isinstance(value, (Dimensioned, _Thunk)):
+            return _Thunk(value, cache)
+        return value
+
+    def clone(self, data=None, shared_data=True, new_type=None, link=True,
+              *args, **overrides):
+        if new_type is not None and not issubclass(new_type, LazyHoloMap):
+            return super(LazyHoloMap, self).clone(data, shared_data, new_type,
+                                                  link, *args, **overrides)
+        # Resolving a group or label inherited from the values would
+        # evaluate a value, the clone inherits them from its own values
+        with self.data.deferred():
+            return super(LazyHoloMap, self).clone(data, shared_data, new_type,
+                                                  link, *args, **overrides)
+
+    def _item_check(self, dim_vals, data):
+        if not isinstance(data, _Thunk):
+            return super(LazyHoloMap, self)._item_check(dim_vals, data)
+        elif self._check_items and len(dim_vals) != self.ndims:
+            raise KeyError('The data contains keys of length %d, but the kdims '
+                           'only declare %d dimensions.' % (len(dim_vals), self.ndims))
+
+    def _resort(self):
+        if isinstance(self.data, _LazyOrderedDict):
+            with self.data.deferred():
+                super(LazyHoloMap, self)._resort()
+        else:
+            super(LazyHoloMap, self)._resort()
+        if not isinstance(self.data, _LazyOrderedDict):
+            self.data = _LazyOrderedDict(self.data)
+
+    @property
+    def last(self):
+        "Returns the item highest data item along the map dimensions."
+        return self.data[list(self.data.keys())[-1]] if len(self) else None
+
+    @property
+    def type(self):
+        "The type of elements stored in the mapping."
+        if self._type is None and len(self):
+            self._type = type(self.data[next(iter(self.data.keys()))])
+        return self._type
+
+    @property
+    def ddims(self):
+        "The list of deep dimensions, looked up on the first value only"
+        if not len(self):
+            return []
+        return self.data[next(iter(self.data.keys()))].dimensions()
+
+    def get_dimension(self, dimension, default=None, strict=False):
+        # Resolve key dimensions without evaluating any values
+        if isinstance(dimension, (util.basestring, Dimension)):
+            name = dimension_name(dimension)
+            for kd in self.kdims:
+                if name in (kd.name, kd.label, util.dimension_sanitizer(kd.name)):
+                    return kd
+        return super(LazyHoloMap, self).get_dimension(dimension, default, strict)
+
+    def _dataslice(self, data, indices):
+        if isinstance(data, _Thunk):
+            return data[indices] if indices else data
+        return super(LazyHoloMap, self)._dataslice(data, indices)
+
+    def __getitem__(self, key):
+        with self.data.deferred():
+            item = super(LazyHoloMap, self).__getitem__(key)
+        return item() if isinstance(item, _Thunk) else item
+
+    def map(self, map_fn, specs=None, clone=True):
+        """Map a function to all objects matching the specs
+
+        Applies the map function to each value when it is evaluated
+        rather than evaluating all values up front. See
+        Dimensioned.map for the full documentation.
+        """
+        if specs is not None and not isinstance(specs, (list, set, tuple)):
+            specs = [specs]
+        mapped = self._map_values(lambda v: v.map(map_fn, specs, clone), clone)
+        if specs is None or any(self.matches(spec) for spec in specs):
+            mapped = map_fn(mapped)
+        return mapped
+
+    def _map_values(self, fn, clone=True):
+        """
+        Applies the function to each value when it is evaluated,
+        returning a clone or updating the LazyHoloMap inplace.
+        """
+        cache = _ThunkCache(self.cache_size)
+        items = []
+        for k, v in self.data.raw_items():
+            if isinstance(v, _Thunk):
+                v = _Thunk(lambda v=v: fn(v()), cache)
+            else:
+                v = fn(v)
+            items.append((k, v))
+        if clone:
+            return self.clone(items)
+        self.data = _LazyOrderedDict(items)
+        return self
+
+    def options(self, *args, **kwargs):
+        """Applies simplified option definition returning a new object
+
+        Applies the options to each value when it is evaluated. See
+        HoloMap.options for the full documentation.
+        """
+        return self._map_values(lambda v: v.options(*args, **kwargs))
+
+    def __mul__(self, other, reverse=False):
+        """Overlays items in the object with another object
+
+        Overlaying a LazyHoloMap with an element overlays each value
+        when it is evaluated, while overlaying it with another HoloMap
+        evaluates all values. See HoloMap.__mul__ for the full
+        documentation.
+        """
+        if (isinstance(other, HoloMap) or not isinstance(other, self.data_type)
+            or isinstance(other, Layout)):
+            return super(LazyHoloMap, self).__mul__(other, reverse)
+        return self._map_values(lambda v: other * v if reverse else v * other)
+
+    def range(self, dimension, data_range=True, dimension_range=True):
+        if isinstance(dimension, int):
+            dimension = self.get_dimension(dimension)
+        name = dimension_name(dimension) if dimension is not None else None
+        if not data_range or name not in self.ranges:
+            return super(LazyHoloMap, self).range(dimension, data_range, dimension_range)
+        # Looking up a value dimension by name would evaluate a value,
+        # so only key dimensions and supplied Dimensions are resolved
+        if isinstance(dimension, Dimension):
+            dim = dimension
+        else:
+            dim = self.get_dimension(name) if name in self.kdims else None
+        lower, upper = self.ranges[name]
+        if dim is None or not dimension_range:
+            return lower, upper
+        return util.dimension_range(lower, upper, dim.range, dim.soft_range)
+
+    def to_dynamic(self):
+        """
+        Returns a DynamicMap which looks up the frames of the
+        LazyHoloMap by key so that only the displayed frames are
+        evaluated.
+        """
+        kdims = [kd.clone(values=list(util.unique_iterator(self.dimension_values(kd))))
+                 for kd in self.kdims]
+        dmap = DynamicMap(lambda *key: self[key], kdims=kdims,
+                          cache_size=self.cache_size)
+        ranges = {d: r for d, r in self.ranges.items()
+                  if d not in self.dimensions('key', label='name')}
+        return dmap.redim.range(**ranges) if ranges else dmap
+
+
 class Callable(param.Parameterized):
     """
     Callable allows wrapping callbacks on one or more DynamicMaps
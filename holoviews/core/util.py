@@ -1114,9 +1114,19 @@ def unique_array(arr):
     if not len(arr):
         return np.asarray(arr)
     elif pd:
-        if isinstance(arr, np.ndarray) and arr.dtype.kind not in 'MO':
+        if isinstance(arr, (pd.Series, pd.Index)):
+            arr = arr.values
+        if isinstance(arr, pd.Categorical):
+            # Deduplicates the integer codes rather than the values
+            return np.asarray(pd.unique(arr))
+        elif isinstance(arr, np.ndarray) and arr.dtype.kind == 'M':
+            return pd.unique(arr.astype('datetime64[ns]'))
+        elif isinstance(arr, np.ndarray) and arr.dtype.kind != 'O':
             # Avoid expensive unpacking if not potentially datetime
             return pd.unique(arr)
+        elif isinstance(arr, np.ndarray):
+            # Deduplicate first so only unique values are unpacked
+            arr = pd.unique(arr)
 
         values = []
         for v in arr:
@@ -1678,16 +1688,6 @@ def get_unique_keys(ndmapping, dimensions):
                            for key in ndmapping.data.keys())
 
 
-def unpack_group(group, getter):
-    for k, v in group.iterrows():
-        obj = v.values[0]
-        key = getter(k)
-        if hasattr(obj, 'kdims'):
-            yield (key, obj)
-        else:
-            yield (wrap_tuple(key), obj)
-
-
 def capitalize(string):
     """
     Capitalizes the first letter of a string.
@@ -1761,22 +1761,38 @@ class ndmapping_groupby(param.ParameterizedFunction):
         else:
             idims = [dim for dim in ndmapping.kdims if dim not in dimensions]
 
-        all_dims = [d.name for d in ndmapping.kdims]
         inds = [ndmapping.get_dimension_index(dim) for dim in idims]
         getter = operator.itemgetter(*inds) if inds else lambda x: tuple()
-
-        multi_index = pd.MultiIndex.from_tuples(ndmapping.keys(), names=all_dims)
-        df = pd.DataFrame(list(map(wrap_tuple, ndmapping.values())), index=multi_index)
-
-        # TODO: Look at sort here
         kwargs = dict(dict(get_param_values(ndmapping), kdims=idims), sort=sort, **kwargs)
-        groups = ((wrap_tuple(k), group_type(OrderedDict(unpack_group(group, getter)), **kwargs))
-                   for k, group in df.groupby(level=[d.name for d in dimensions], sort=sort))
-
-        if sort:
-            selects = list(get_unique_keys(ndmapping, dimensions))
-            groups = sorted(groups, key=lambda x: selects.index(x[0]))
 
+        keys = list(ndmapping.data.keys())
+        values = list(ndmapping.data.values())
+        if not keys:
+            return container_type([], kdims=dimensions, sort=sort)
+
+        # Factorize the key columns of the grouped dimensions into
+        # integer group codes numbered in order of first appearance
+        columns = list(zip(*keys))
+        gdims = [ndmapping.get_dimension_index(dim) for dim in dimensions]
+        gcodes = np.zeros(len(keys), dtype='int64')
+        for idx in gdims:
+            column = np.empty(len(keys), dtype=object)
+            column[:] = columns[idx]
+            codes, uniques = pd.factorize(column)
+            gcodes = gcodes * (len(uniques)+1) + (codes+1)
+            gcodes = pd.factorize(gcodes)[0]
+
+        # Split the stably sorted key indices into the groups
+        order = np.argsort(gcodes, kind='mergesort')
+        counts = np.bincount(gcodes)
+        groups = []
+        for indices in np.split(order, np.cumsum(counts)[:-1]):
+            group_key = tuple(keys[indices[0]][idx] for idx in gdims)
+            items = []
+            for i in indices:
+                key, obj = getter(keys[i]), values[i]
+                items.append((key if hasattr(obj, 'kdims') else wrap_tuple(key), obj))
+            groups.append((group_key, group_type(OrderedDict(items), **kwargs)))
         return container_type(groups, kdims=dimensions, sort=sort)
 
     @param.parameterized.bothmethod
@@ -9,9 +9,10 @@ import numpy as np
 
 import param
 from ..core import Dataset
-from ..core.data import MultiInterface
+from ..core.data import MultiInterface, RaggedInterface
 from ..core.dimension import Dimension, asdim
 from ..core.util import OrderedDict, disable_constant
+from ..streams import BoundsXY
 from .geom import Geometry
 
 
@@ -55,7 +56,9 @@ class Path(Geometry):
 
     group = param.String(default="Path", constant=True)
 
-    datatype = param.ObjectSelector(default=['multitabular', 'spatialpandas'])
+    datatype = param.ObjectSelector(default=['multitabular', 'spatialpandas', 'ragged'])
+
+    _selection_streams = (BoundsXY,)
 
     def __init__(self, data, kdims=None, vdims=None, **params):
         if isinstance(data, tuple) and len(data) == 2:
@@ -83,6 +86,9 @@ class Path(Geometry):
 
 
     def __getitem__(self, key):
+        if getattr(getattr(key, 'dtype', None), 'kind', None) == 'b':
+            # Boolean masks select whole geometries
+            return super(Path, self).__getitem__(key)
         if key in self.dimensions(): return self.dimension_values(key)
         if not isinstance(key, tuple) or len(key) == 1:
             key = (key, slice(None))
@@ -141,6 +147,10 @@ class Path(Geometry):
             Returns an Dimensioned object containing the selected data
             or a scalar if a single value was selected
         """
+        if self.interface is RaggedInterface:
+            # Selections on the vertices are applied by the interface
+            return super(Path, self).select(selection_expr, selection_specs,
+                                            **selection)
         xdim, ydim = self.kdims[:2]
         x_range = selection.pop(xdim.name, None)
         y_range = selection.pop(ydim.name, None)
@@ -152,6 +162,50 @@ class Path(Geometry):
         y_range = y_range if isinstance(y_range, slice) else slice(None)
         return sel[x_range, y_range]
 
+    def spatial_select(self, bounds=None, geometry=None):
+        """Selects the geometries intersecting a region
+
+        Selects whole geometries which intersect the supplied bounds
+        or polygon, i.e. which have a vertex inside the region, an
+        edge crossing its boundary or, for polygons, which contain
+        the region. Candidate geometries are looked up in a spatial
+        index which is built on the first selection and reused for
+        subsequent selections on the same data.
+
+        Args:
+            bounds: Tuple of the (x0, y0, x1, y1) bounds to select
+            geometry: Polygon to select declared as an array of
+                x- and y-coordinates
+
+        Returns:
+            Clone of the element containing the selected geometries
+        """
+        if not self.interface.multi:
+            raise ValueError('Spatial selection is only supported on '
+                             'multi-geometry interfaces.')
+        mask = self.interface.spatial_mask(self, bounds, geometry)
+        return self.iloc[np.flatnonzero(mask)]
+
+    def _get_selection_expr_for_stream_value(self, **kwargs):
+        from ..util.transform import dim
+
+        if not kwargs.get('bounds', None):
+            return None, None
+
+        x0, y0, x1, y1 = kwargs['bounds']
+        # Handle invert_xaxis/invert_yaxis
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+
+        xdim, ydim = self.kdims[:2]
+        if self.opts.get('plot').kwargs.get('invert_axes', False):
+            x0, y0, x1, y1 = y0, x0, y1, x1
+
+        bbox = {xdim.name: (x0, x1), ydim.name: (y0, y1)}
+        selection_expr = dim(xdim).spatial_select(
+            dim(ydim), bounds=(x0, y0, x1, y1))
+        return selection_expr, bbox
+
     def split(self, start=None, end=None, datatype=None, **kwargs):
         """
         The split method allows splitting a Path type into a list of
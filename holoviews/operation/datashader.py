@@ -1,6 +1,7 @@
 from __future__ import absolute_import, division
 
 from collections import Callable, Iterable
+from contextlib import contextmanager
 import warnings
 
 import param
@@ -10,6 +11,7 @@ import xarray as xr
 import datashader as ds
 import datashader.reductions as rd
 import datashader.transfer_functions as tf
+import dask
 import dask.dataframe as dd
 
 from param.parameterized import bothmethod
@@ -25,7 +27,7 @@ from ..core import (Operation, Element, Dimension, NdOverlay,
 from ..core.data import PandasInterface, XArrayInterface, DaskInterface
 from ..core.util import (
     LooseVersion, basestring, cftime_types, cftime_to_timestamp,
-    datetime_types, dt_to_int, get_param_values, max_range)
+    datetime_types, dt_to_int, get_param_values, max_range, unique_iterator)
 from ..element import (Image, Path, Curve, RGB, Graph, TriMesh,
                        QuadMesh, Contours, Spikes, Area, Spread,
                        Segments, Scatter, Points, Polygons)
@@ -217,6 +219,12 @@ class AggregationOperation(ResamplingOperation):
         no column is defined the first value dimension of the element
         will be used. May also be defined as a string.""")
 
+    scheduler = param.Parameter(default=None, doc="""
+        The dask scheduler used to compute aggregates of dask backed
+        data, e.g. 'threads', 'processes', 'synchronous' or a
+        distributed Client. By default the globally configured
+        scheduler is used.""")
+
     _agg_methods = {
         'any':   rd.any,
         'count': rd.count,
@@ -261,6 +269,18 @@ class AggregationOperation(ResamplingOperation):
             agg = type(agg)(field)
         return agg
 
+    @contextmanager
+    def _dask_scheduler(self):
+        """
+        Context manager which computes any dask graphs with the
+        configured scheduler.
+        """
+        if self.p.scheduler is None:
+            yield
+        else:
+            with dask.config.set(scheduler=self.p.scheduler):
+                yield
+
     def _empty_agg(self, element, x, y, width, height, xs, ys, agg_fn, **params):
         x = x.name if x else 'x'
         y = y.name if x else 'y'
@@ -323,13 +343,31 @@ class aggregate(AggregationOperation):
     """
 
 
+    @classmethod
+    def _nan_separator(cls, df):
+        """
+        Returns a single row of NaNs matching the columns of the
+        supplied dataframe, used to separate concatenated paths. For
+        dask dataframes the row is built from the metadata so that no
+        partitions have to be computed.
+        """
+        meta = df._meta if isinstance(df, dd.DataFrame) else df
+        empty = pd.DataFrame({c: [np.NaN] for c in meta.columns},
+                             columns=meta.columns)
+        if isinstance(df, dd.DataFrame):
+            return dd.from_pandas(empty, npartitions=1)
+        return empty
+
     @classmethod
     def get_agg_data(cls, obj, category=None):
         """
         Reduces any Overlay or NdOverlay of Elements into a single
-        xarray Dataset that can be aggregated.
+        xarray Dataset that can be aggregated. Dask dataframes are
+        concatenated lazily so the aggregation can be distributed
+        across partitions.
         """
         paths = []
+        categories = {}
         if isinstance(obj, Graph):
             obj = obj.edgepaths
         kdims = list(obj.kdims)
@@ -337,8 +375,12 @@ class aggregate(AggregationOperation):
         dims = obj.dimensions()[:2]
         if isinstance(obj, Path):
             glyph = 'line'
-            for p in obj.split(datatype='dataframe'):
-                paths.append(p)
+            if obj.interface.datatype == 'ragged':
+                # Packed geometries are already NaN separated
+                paths.append(obj.dframe())
+            else:
+                for p in obj.split(datatype='dataframe'):
+                    paths.append(p)
         elif isinstance(obj, CompositeOverlay):
             element = None
             for key, el in obj.data.items():
@@ -348,6 +390,11 @@ class aggregate(AggregationOperation):
                 if isinstance(obj, NdOverlay):
                     df = df.assign(**dict(zip(obj.dimensions('key', True), key)))
                 paths.append(df)
+            if isinstance(obj, NdOverlay):
+                # Declare categories up front so dask does not have
+                # to compute them when aggregating by category
+                for i, kd in enumerate(obj.kdims):
+                    categories[kd.name] = list(unique_iterator(k[i] for k in obj.data))
             if element is None:
                 dims = None
             else:
@@ -363,21 +410,22 @@ class aggregate(AggregationOperation):
             x, y = dims
 
         if len(paths) > 1:
+            if any(isinstance(path, dd.DataFrame) for path in paths):
+                paths = [p if isinstance(p, dd.DataFrame) else dd.from_pandas(p, npartitions=1)
+                         for p in paths]
             if glyph == 'line':
-                path = paths[0][:1]
-                if isinstance(path, dd.DataFrame):
-                    path = path.compute()
-                empty = path.copy()
-                empty.iloc[0, :] = (np.NaN,) * empty.shape[1]
+                empty = cls._nan_separator(paths[0])
                 paths = [elem for p in paths for elem in (p, empty)][:-1]
-            if all(isinstance(path, dd.DataFrame) for path in paths):
+            if isinstance(paths[0], dd.DataFrame):
                 df = dd.concat(paths)
             else:
-                paths = [p.compute() if isinstance(p, dd.DataFrame) else p for p in paths]
                 df = pd.concat(paths)
         else:
             df = paths[0] if paths else pd.DataFrame([], columns=[x.name, y.name])
-        if category and df[category].dtype.name != 'category':
+        if category in categories:
+            dtype = pd.api.types.CategoricalDtype(categories[category])
+            df[category] = df[category].astype(dtype)
+        elif category and df[category].dtype.name != 'category':
             df[category] = df[category].astype('category')
 
         is_dask = isinstance(df, dd.DataFrame)
@@ -432,7 +480,8 @@ class aggregate(AggregationOperation):
                         x_range=x_range, y_range=y_range)
 
         dfdata = PandasInterface.as_dframe(data)
-        agg = getattr(cvs, glyph)(dfdata, x.name, y.name, agg_fn)
+        with self._dask_scheduler():
+            agg = getattr(cvs, glyph)(dfdata, x.name, y.name, agg_fn)
         if 'x_axis' in agg.coords and 'y_axis' in agg.coords:
             agg = agg.rename({'x_axis': x, 'y_axis': y})
         if xtype == 'datetime':
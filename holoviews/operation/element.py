@@ -11,7 +11,7 @@ from param import _is_number
 
 from ..core import (Operation, NdOverlay, Overlay, GridMatrix,
                     HoloMap, Dataset, Element, Collator, Dimension)
-from ..core.data import ArrayInterface, DictInterface, default_datatype
+from ..core.data import ArrayInterface, DictInterface, ImageInterface, default_datatype
 from ..core.util import (group_sanitizer, label_sanitizer, pd,
                          basestring, datetime_types, isfinite, dt_to_int,
                          isdatetime, is_dask_array)
@@ -19,7 +19,7 @@ from ..element.chart import Histogram, Scatter
 from ..element.raster import Image, RGB
 from ..element.path import Contours, Polygons
 from ..element.util import categorical_aggregate2d # noqa (API import)
-from ..streams import RangeXY
+from ..streams import RangeXY, RangeX, PlotSize
 
 column_interfaces = [ArrayInterface, DictInterface]
 if pd:
@@ -170,11 +170,53 @@ class chain(Operation):
        A list of Operations (or Operation instances)
        that are applied on the input from left to right..""")
 
+    @classmethod
+    def _fusable(cls, operation):
+        """
+        Whether an operation may be fused, i.e. defines an array-level
+        implementation and has no hooks or caches that expect elements.
+        """
+        return (hasattr(operation, '_process_array') and not operation._preprocess_hooks
+                and not operation._postprocess_hooks and operation.disk_cache is None)
+
+    @classmethod
+    def _fusable_input(cls, element):
+        return (type(element) is Image and element.interface is ImageInterface
+                and len(element.vdims) == 1)
+
+    def _fuse(self, element, operations):
+        """
+        Applies a sequence of array-level operations directly to the
+        array of an Image, constructing only the final Image rather
+        than an intermediate element for each operation.
+        """
+        array = element.data
+        # Matches the parameters passed by element.clone
+        params = dict(element.param.get_param_values(), id=element.id)
+        params.pop('name', None)
+        for operation in operations:
+            p = param.ParamOverrides(operation, {'input_ranges': self.p.input_ranges})
+            array = operation._process_array(array, params.get('vdims', Image.vdims)[0], p)
+            params = operation._fused_params(params, p)
+        return Image(array, **params)
+
     def _process(self, view, key=None):
         processed = view
-        for operation in self.p.operations:
-            processed = operation.process_element(processed, key,
-                                                  input_ranges=self.p.input_ranges)
+        fused = []
+        for operation in self.p.operations+[None]:
+            if operation is not None and self._fusable(operation) and (fused or self._fusable_input(processed)):
+                fused.append(operation)
+                continue
+            if len(fused) > 1:
+                processed = self._fuse(processed, fused)
+            else:
+                for op in fused:
+                    processed = op.process_element(processed, key,
+                                                   input_ranges=self.p.input_ranges)
+            fused = []
+            if operation is not None:
+                processed = operation.process_element(processed, key,
+                                                      input_ranges=self.p.input_ranges)
 
         if not self.p.group:
             return processed
@@ -212,9 +254,14 @@ class transform(Operation):
        Image to the data in the output Image. By default, acts as
        the identity function such that the output matches the input.""")
 
+    def _process_array(self, array, vdim, p):
+        return array if not p.operator else p.operator(array)
+
+    def _fused_params(self, params, p):
+        return dict(params, group=p.group)
+
     def _process(self, img, key=None):
-        processed = (img.data if not self.p.operator
-                     else self.p.operator(img.data))
+        processed = self._process_array(img.data, img.vdims[0], self.p)
         return img.clone(processed, group=self.p.group)
 
 
@@ -344,16 +391,18 @@ class threshold(Operation):
     group = param.String(default='Threshold', doc="""
        The group assigned to the thresholded output.""")
 
+    def _process_array(self, array, vdim, p):
+        return np.where(array > p.level, float(p.high), float(p.low))
+
+    def _fused_params(self, params, p):
+        return dict(params, group=p.group)
+
     def _process(self, matrix, key=None):
 
         if not isinstance(matrix, Image):
             raise TypeError("The threshold operation requires a Image as input.")
 
-        arr = matrix.data
-        high = np.ones(arr.shape) * self.p.high
-        low = np.ones(arr.shape) * self.p.low
-        thresholded = np.where(arr > self.p.level, high, low)
-
+        thresholded = self._process_array(matrix.data, matrix.vdims[0], self.p)
         return matrix.clone(thresholded, group=self.p.group)
 
 
@@ -371,15 +420,7 @@ class gradient(Operation):
     group = param.String(default='Gradient', doc="""
     The group assigned to the output gradient matrix.""")
 
-    def _process(self, matrix, key=None):
-
-        if len(matrix.vdims) != 1:
-            raise ValueError("Input matrix to gradient operation must "
-                             "have single value dimension.")
-
-        matrix_dim = matrix.vdims[0]
-
-        data = np.flipud(matrix.dimension_values(matrix_dim, flat=False))
+    def _process_array(self, data, matrix_dim, p):
         r, c = data.shape
 
         if  matrix_dim.cyclic and (None in matrix_dim.range):
@@ -404,7 +445,21 @@ class gradient(Operation):
             dx = np.where(np.abs(dx_negatives)<dx, dx_negatives, dx)
             dy = np.where(np.abs(dy_negatives)<dy, dy_negatives, dy)
 
-        return Image(np.sqrt(dx * dx + dy * dy), bounds=matrix.bounds, group=self.p.group)
+        return np.sqrt(dx * dx + dy * dy)
+
+    def _fused_params(self, params, p):
+        return dict(bounds=params['bounds'], group=p.group)
+
+    def _process(self, matrix, key=None):
+
+        if len(matrix.vdims) != 1:
+            raise ValueError("Input matrix to gradient operation must "
+                             "have single value dimension.")
+
+        matrix_dim = matrix.vdims[0]
+        data = np.flipud(matrix.dimension_values(matrix_dim, flat=False))
+        return Image(self._process_array(data, matrix_dim, self.p), bounds=matrix.bounds,
+                     group=self.p.group)
 
 
 
@@ -775,6 +830,145 @@ class decimate(Operation):
         return element.map(self._process_layer, Element)
 
 
+class downsample1d(Operation):
+    """
+    Downsamples a Curve to the number of samples required to represent
+    it faithfully at the width of the plot. Unlike decimate, which
+    picks random rows, the supported algorithms preserve the visual
+    shape of the curve:
+
+      * lttb   : Largest-Triangle-Three-Buckets selects the sample in
+                 each bucket which forms the largest triangle with the
+                 previously selected sample and the average of the next
+                 bucket.
+      * minmax : Selects the minimum and maximum sample in each bucket,
+                 preserving all peaks.
+
+    The curve is assumed to be sorted along the x-axis, which allows
+    restricting it to the x_range without copying the whole element.
+    By default the operation returns a DynamicMap with PlotSize and
+    RangeX streams so the curve is downsampled to the current
+    viewport.
+    """
+
+    algorithm = param.ObjectSelector(default='lttb', objects=['lttb', 'minmax'], doc="""
+        The algorithm used to select the samples.""")
+
+    dynamic = param.Boolean(default=True, doc="""
+       Enables dynamic processing by default.""")
+
+    link_inputs = param.Boolean(default=True, doc="""
+         By default, the link_inputs parameter is set to True so that
+         when applying downsample1d, backends that support linked
+         streams update RangeX streams on the inputs of the
+         operation.""")
+
+    height = param.Integer(default=400, doc="""
+       The height of the plot in pixels, unused by the operation but
+       declared for the PlotSize stream.""")
+
+    width = param.Integer(default=400, doc="""
+       The width of the plot in pixels, the curve is downsampled to
+       two samples per pixel.""")
+
+    scale = param.Number(default=1.0, doc="""
+       The scale factor applied to the plot size by the PlotSize
+       stream, unused by the operation since the width is already
+       scaled.""")
+
+    x_range = param.Tuple(default=None, length=2, doc="""
+       The x_range as a tuple of min and max x-value. Auto-ranges
+       if set to None.""")
+
+    streams = param.List(default=[PlotSize, RangeX], doc="""
+        List of streams that are applied if dynamic=True, allowing
+        for dynamic interaction with the plot.""")
+
+    @classmethod
+    def _lttb(cls, x, y, n_out):
+        """
+        Returns the indexes of the samples selected by the
+        Largest-Triangle-Three-Buckets algorithm.
+        """
+        n = len(x)
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        edges = np.linspace(1, n-1, n_out-1).astype(np.int64)
+        index = np.empty(n_out, dtype=np.int64)
+        index[0], index[-1] = 0, n-1
+        a = 0
+        for i in range(n_out-2):
+            start, end = edges[i], edges[i+1]
+            if i == n_out-3:
+                avg_x, avg_y = x[n-1], y[n-1]
+            else:
+                nend = edges[i+2]
+                avg_x, avg_y = x[end:nend].mean(), np.nanmean(y[end:nend])
+            area = np.abs((x[a]-avg_x)*(y[start:end]-y[a]) -
+                          (x[a]-x[start:end])*(avg_y-y[a]))
+            area[np.isnan(area)] = -1
+            a = start + np.argmax(area)
+            index[i+1] = a
+        return index
+
+    @classmethod
+    def _minmax(cls, y, n_out):
+        """
+        Returns the sorted indexes of the minimum and maximum samples
+        in each of n_out/2 equally sized buckets.
+        """
+        n = len(y)
+        nbuckets = n_out // 2
+        if n_out >= n or nbuckets < 1:
+            return np.arange(n)
+        size = n // nbuckets
+        m = nbuckets * size
+        blocks = y[:m].reshape(nbuckets, size)
+        offsets = np.arange(nbuckets) * size
+        with np.errstate(invalid='ignore'):
+            filled = np.where(np.isnan(blocks), np.inf, blocks)
+            mins = offsets + np.argmin(filled, axis=1)
+            filled = np.where(np.isnan(blocks), -np.inf, blocks)
+            maxs = offsets + np.argmax(filled, axis=1)
+        index = [mins, maxs, [0, n-1]]
+        if m < n:
+            rest = y[m:]
+            index.append(m + np.array([np.nanargmin(rest), np.nanargmax(rest)])
+                         if not np.isnan(rest).all() else [m])
+        return np.unique(np.concatenate(index))
+
+    def _process_layer(self, element, key=None):
+        if not isinstance(element, Dataset):
+            raise ValueError("Cannot downsample non-Dataset types.")
+        xs = element.dimension_values(0)
+        if len(xs) == 0:
+            return element
+        ys = element.dimension_values(1)
+        if isdatetime(xs):
+            xs = xs.astype('datetime64[ns]').astype('int64')
+        start, end = 0, len(xs)
+        if self.p.x_range:
+            x0, x1 = [dt_to_int(v, 'ns') if isinstance(v, datetime_types) else v
+                      for v in self.p.x_range]
+            # Include the adjacent samples so the line reaches the edges
+            start = max(np.searchsorted(xs, x0, side='left') - 1, 0)
+            end = min(np.searchsorted(xs, x1, side='right') + 1, len(xs))
+        xs, ys = xs[start:end].astype('float64'), ys[start:end]
+        if ys.dtype.kind not in 'f':
+            ys = ys.astype('float64')
+        n_out = self.p.width * 2
+        if self.p.algorithm == 'lttb':
+            index = self._lttb(xs, ys, n_out)
+        else:
+            index = self._minmax(ys, n_out)
+        if start == 0 and end == len(element) and len(index) == len(element):
+            return element
+        return element.iloc[index + start]
+
+    def _process(self, element, key=None):
+        return element.map(self._process_layer, Element)
+
+
 class interpolate_curve(Operation):
     """
     Resamples a Curve using the defined interpolation method, e.g.
@@ -1,3 +1,5 @@
+from itertools import product
+
 import param
 import numpy as np
 
@@ -6,6 +8,7 @@ from ..core.operation import Operation
 from ..core.util import basestring, cartesian_product, isfinite
 from ..element import (Curve, Area, Image, Distribution, Bivariate,
                        Contours, Polygons)
+from ..element.stats import StatisticsElement
 
 from .element import contours
 
@@ -20,6 +23,145 @@ def _kde_support(bin_range, bw, gridsize, cut, clip):
     return np.linspace(kmin, kmax, gridsize)
 
 
+# Number of samples above which the 'auto' KDE method uses binning
+_binned_threshold = 10000
+
+
+def _binned_kde(kde, axes, bins, truncate=5):
+    """
+    Approximates the density of a scipy gaussian_kde on the regular
+    grid defined by the supplied axes. The (weighted) samples are
+    linearly binned onto a grid of the supplied number of bins along
+    each axis, convolved with the kernel truncated at the supplied
+    number of standard deviations using an FFT and then interpolated
+    onto the evaluation grid.
+    """
+    from scipy.signal import fftconvolve
+
+    data, ndim = kde.dataset, len(axes)
+    weights = getattr(kde, 'weights', None)
+    if weights is None:
+        weights = np.full(data.shape[1], 1./data.shape[1])
+
+    # Linear binning of the samples onto a grid spanning data and axes
+    lo = np.array([min(d.min(), a.min()) for d, a in zip(data, axes)], dtype=float)
+    hi = np.array([max(d.max(), a.max()) for d, a in zip(data, axes)], dtype=float)
+    hi = np.where(hi > lo, hi, lo+1)
+    shape = (bins,)*ndim
+    delta = (hi-lo)/(bins-1)
+    pos = (data-lo[:, None])/delta[:, None]
+    index = np.clip(np.floor(pos).astype(int), 0, bins-2)
+    frac = pos-index
+    grid = np.zeros(bins**ndim)
+    for corner in product([0, 1], repeat=ndim):
+        cweights = weights*np.prod([f if c else 1-f for f, c in zip(frac, corner)], axis=0)
+        flat = np.ravel_multi_index(tuple(i+c for i, c in zip(index, corner)), shape)
+        grid += np.bincount(flat, cweights, minlength=grid.size)
+    grid = grid.reshape(shape)
+
+    # Convolve with the Gaussian kernel sampled at the grid spacing
+    covariance = np.atleast_2d(kde.covariance)
+    sigma = np.sqrt(np.diag(covariance))
+    extent = np.minimum(np.ceil(truncate*sigma/delta), bins-1).astype(int)
+    offsets = np.meshgrid(*(np.arange(-e, e+1)*d for e, d in zip(extent, delta)),
+                          indexing='ij')
+    points = np.vstack([o.ravel() for o in offsets])
+    quad = np.sum(points*np.linalg.inv(covariance).dot(points), axis=0)
+    norm = np.sqrt((2*np.pi)**ndim*np.linalg.det(covariance))
+    kernel = (np.exp(-0.5*quad)/norm).reshape(offsets[0].shape)
+    density = np.clip(fftconvolve(grid, kernel, mode='same'), 0, None)/weights.sum()
+
+    # Multilinear interpolation onto the evaluation axes
+    for axis, (a, l, d) in enumerate(zip(axes, lo, delta)):
+        p = (a-l)/d
+        i = np.clip(np.floor(p).astype(int), 0, bins-2)
+        f = (p-i).reshape([-1 if ax == axis else 1 for ax in range(ndim)])
+        density = np.take(density, i, axis)*(1-f) + np.take(density, i+1, axis)*f
+    return density
+
+
+def _evaluate_kde(kde, axes, method='exact', bins=None):
+    """
+    Evaluates a scipy gaussian_kde on the regular grid defined by the
+    supplied axes, either exactly or using the binned approximation.
+    """
+    if method == 'auto':
+        method = 'binned' if kde.n > _binned_threshold else 'exact'
+    if method == 'binned':
+        bins = bins or (1024 if len(axes) == 1 else 256)
+        return _binned_kde(kde, axes, bins)
+    elif len(axes) == 1:
+        return kde.evaluate(axes[0])
+    grid = cartesian_product(axes, False)
+    positions = np.vstack([g.ravel() for g in grid])
+    return np.reshape(kde(positions).T, grid[0].shape)
+
+
+def _kde_weights(element, dimension):
+    """
+    Returns the weights of each sample held along the supplied
+    dimension or None if no weights dimension was supplied.
+    """
+    if dimension is None:
+        return None
+    dimension = element.get_dimension(dimension, strict=True)
+    if isinstance(element, StatisticsElement) and dimension in element.vdims:
+        raise ValueError("%s element does not hold data for its value dimension, "
+                         "weights must be supplied as a dimension of a Dataset."
+                         % type(element).__name__)
+    return element.dimension_values(dimension)
+
+
+def _gaussian_kde(data, weights=None):
+    from scipy import stats
+    if weights is None:
+        return stats.gaussian_kde(data)
+    return stats.gaussian_kde(data, weights=weights)
+
+
+def _univariate_kde(data, bin_range, bandwidth=None, cut=3, n_samples=100,
+                    clip=(None, None), fixed_range=False, weights=None,
+                    method='auto', bins=None):
+    """
+    Computes a 1D kernel density estimate of the finite values in
+    data, returning the sample positions and densities or None if
+    the KDE could not be computed. Allows computing the KDE of many
+    groups of values without constructing an Element for each.
+    """
+    from scipy.linalg import LinAlgError
+
+    if bin_range == (0, 0) or any(not isfinite(r) for r in bin_range):
+        bin_range = (0, 1)
+    elif bin_range[0] == bin_range[1]:
+        bin_range = (bin_range[0]-0.5, bin_range[1]+0.5)
+
+    if len(data):
+        mask = isfinite(data)
+        if weights is not None:
+            mask &= isfinite(weights)
+            weights = weights[mask]
+        data = data[mask]
+    else:
+        data = []
+    if len(data) > 1:
+        try:
+            kde = _gaussian_kde(data, weights)
+        except LinAlgError:
+            return None
+        if bandwidth:
+            kde.set_bandwidth(bandwidth)
+        bw = kde.scotts_factor() * data.std(ddof=1)
+        if fixed_range:
+            xs = np.linspace(bin_range[0], bin_range[1], n_samples)
+        else:
+            xs = _kde_support(bin_range, bw, n_samples, cut, clip)
+        ys = _evaluate_kde(kde, [xs], method, bins)
+    else:
+        xs = np.linspace(bin_range[0], bin_range[1], n_samples)
+        ys = np.full_like(xs, 0)
+    return xs, ys
+
+
 class univariate_kde(Operation):
     """
     Computes a 1D kernel density estimate (KDE) along the supplied
@@ -56,6 +198,23 @@ class univariate_kde(Operation):
     groupby = param.ClassSelector(default=None, class_=(basestring, Dimension), doc="""
       Defines a dimension to group the Histogram returning an NdOverlay of Histograms.""")
 
+    method = param.ObjectSelector(default='auto', objects=['auto', 'exact', 'binned'], doc="""
+        Method used to evaluate the KDE. The 'exact' method sums the
+        kernels of all samples at each evaluation point, while the
+        'binned' method linearly bins the samples and convolves them
+        with the kernel using an FFT, which scales to many millions
+        of samples. The 'auto' method uses binning for more than
+        10,000 samples.""")
+
+    bins = param.Integer(default=1024, bounds=(2, None), doc="""
+        Number of bins used by the binned method, controlling the
+        accuracy of the approximation.""")
+
+    weights = param.ClassSelector(default=None, class_=(basestring, Dimension), doc="""
+        Dimension containing weights for each sample. Distribution
+        elements only hold the sampled values, so weights must be
+        supplied as a dimension of a Dataset or other element.""")
+
     def _process(self, element, key=None):
         if self.p.groupby:
             if not isinstance(element, Dataset):
@@ -65,8 +224,7 @@ class univariate_kde(Operation):
             return grouped.map(self._process, Dataset)
 
         try:
-            from scipy import stats
-            from scipy.linalg import LinAlgError
+            import scipy # noqa
         except ImportError:
             raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
 
@@ -93,32 +251,16 @@ class univariate_kde(Operation):
             vdims = [Dimension(vdim_name, label='Density')]
 
         data = element.dimension_values(selected_dim)
+        weights = _kde_weights(element, self.p.weights)
         bin_range = self.p.bin_range or element.range(selected_dim)
-        if bin_range == (0, 0) or any(not isfinite(r) for r in bin_range):
-            bin_range = (0, 1)
-        elif bin_range[0] == bin_range[1]:
-            bin_range = (bin_range[0]-0.5, bin_range[1]+0.5)
-
         element_type = Area if self.p.filled else Curve
-        data = data[isfinite(data)] if len(data) else []
-        if len(data) > 1:
-            try:
-                kde = stats.gaussian_kde(data)
-            except LinAlgError:
-                return element_type([], selected_dim, vdims, **params)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
-            if self.p.bin_range:
-                xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
-            else:
-                xs = _kde_support(bin_range, bw, self.p.n_samples, self.p.cut, selected_dim.range)
-            ys = kde.evaluate(xs)
-        else:
-            xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
-            ys = np.full_like(xs, 0)
-
-        return element_type((xs, ys), kdims=[selected_dim], vdims=vdims, **params)
+        kde = _univariate_kde(data, bin_range, self.p.bandwidth, self.p.cut,
+                              self.p.n_samples, selected_dim.range,
+                              bool(self.p.bin_range), weights, self.p.method,
+                              self.p.bins)
+        if kde is None:
+            return element_type([], selected_dim, vdims, **params)
+        return element_type(kde, kdims=[selected_dim], vdims=vdims, **params)
 
 
 
@@ -166,9 +308,26 @@ class bivariate_kde(Operation):
        The x_range as a tuple of min and max y-value. Auto-ranges
        if set to None.""")
 
+    method = param.ObjectSelector(default='auto', objects=['auto', 'exact', 'binned'], doc="""
+        Method used to evaluate the KDE. The 'exact' method sums the
+        kernels of all samples at each evaluation point, while the
+        'binned' method linearly bins the samples and convolves them
+        with the kernel using an FFT, which scales to many millions
+        of samples. The 'auto' method uses binning for more than
+        10,000 samples.""")
+
+    bins = param.Integer(default=256, bounds=(2, None), doc="""
+        Number of bins along each axis used by the binned method,
+        controlling the accuracy of the approximation.""")
+
+    weights = param.ClassSelector(default=None, class_=(basestring, Dimension), doc="""
+        Dimension containing weights for each sample. Bivariate
+        elements only hold the sampled values, so weights must be
+        supplied as a dimension of a Dataset or other element.""")
+
     def _process(self, element, key=None):
         try:
-            from scipy import stats
+            import scipy # noqa
         except ImportError:
             raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
 
@@ -197,9 +356,17 @@ class bivariate_kde(Operation):
         elif ymin == ymax:
             ymin, ymax = ymin-0.5, ymax+0.5
 
-        data = data[:, isfinite(data).min(axis=0)] if data.shape[1] > 1 else np.empty((2, 0))
+        weights = _kde_weights(element, self.p.weights)
+        if data.shape[1] > 1:
+            mask = isfinite(data).min(axis=0)
+            if weights is not None:
+                mask &= isfinite(weights)
+                weights = weights[mask]
+            data = data[:, mask]
+        else:
+            data = np.empty((2, 0))
         if data.shape[1] > 1:
-            kde = stats.gaussian_kde(data)
+            kde = _gaussian_kde(data, weights)
             if self.p.bandwidth:
                 kde.set_bandwidth(self.p.bandwidth)
             bw = kde.scotts_factor() * data.std(ddof=1)
@@ -211,9 +378,7 @@ class bivariate_kde(Operation):
                 ys = np.linspace(ymin, ymax, self.p.n_samples)
             else:
                 ys = _kde_support((ymin, ymax), bw, self.p.n_samples, self.p.cut, ydim.range)
-            xx, yy = cartesian_product([xs, ys], False)
-            positions = np.vstack([xx.ravel(), yy.ravel()])
-            f = np.reshape(kde(positions).T, xx.shape)
+            f = _evaluate_kde(kde, [xs, ys], self.p.method, self.p.bins)
         elif self.p.contours:
             eltype = Polygons if self.p.filled else Contours
             return eltype([], kdims=[xdim, ydim], vdims=[vdim])
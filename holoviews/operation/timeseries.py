@@ -8,7 +8,100 @@ from ..core.util import pandas_version
 from ..element import Scatter
 
 
-class RollingBase(param.Parameterized):
+class IncrementalBase(param.Parameterized):
+    """
+    Parameters and state shared by operations which can be updated
+    incrementally when applied to data accumulated by a Buffer stream.
+    """
+
+    incremental = param.Boolean(default=False, doc="""
+        Whether to update the result incrementally when the operation
+        is repeatedly applied to a growing timeseries, e.g. one
+        accumulated by a Buffer stream. The operation then keeps its
+        previous result and only processes new rows along with the
+        rows required as context to compute them. Assumes the data is
+        sorted along the x-axis and that rows are only appended or
+        dropped from the start. Results for rows dropped from the
+        start are retained rather than recomputed.""")
+
+    def _process_incremental(self, element, df, xdim, compute, split, layer=()):
+        """
+        Computes the result of an operation on a dataframe, reusing
+        the result from the previous call if the data only extends
+        the previously processed data.
+
+        The compute function computes the output dataframe given an
+        input dataframe, while the split function is given the sorted
+        x-values and the number of previously processed rows and
+        returns the index of the first row required to recompute the
+        result, the x-value from which the previous output is
+        replaced (None to replace from the start of the recomputed
+        output) and the x-value before which previous output is
+        dropped. If there are no rows to recompute the returned index
+        should be the number of rows and if split returns None the
+        full result is recomputed.
+
+        Returns the output dataframe and a tuple of the previous
+        output length and the number of replaced and new rows, which
+        allows plotting backends to stream the update. If the result
+        was recomputed the delta is None. The state is tracked
+        separately for each layer, identified by the path of keys
+        leading to the element within an overlay, and is only reused
+        if the row hashes of the rows overlapping the previously
+        processed data are unchanged.
+        """
+        states = self.__dict__.setdefault('_stream_states', {})
+        key = (type(element).__name__, layer, tuple(element.dimensions(label='name')))
+        xs = df[xdim].values
+        hashes = pd.util.hash_pandas_object(df, index=False).values
+        state = states.get(key)
+        region = None
+        if state is not None and len(xs):
+            last_x, previous, previous_hashes = state
+            n = np.searchsorted(xs, last_x, 'right')
+            if (n and xs[n-1] == last_x and (xs[n:] > xs[n-1:-1]).all() and
+                n <= len(previous_hashes) and
+                (previous_hashes[-n:] == hashes[:n]).all()):
+                region = split(xs, n)
+
+        if region is None:
+            out, delta = compute(df), None
+        else:
+            start, replace_from, keep_from = region
+            result = compute(df.iloc[start:]) if start < len(xs) else previous.iloc[:0]
+            if replace_from is None and len(result):
+                replace_from = result[xdim].values[0]
+            trimmed = previous[previous[xdim].values >= keep_from]
+            if replace_from is None:
+                kept, new = trimmed, result
+            else:
+                kept = trimmed[trimmed[xdim].values < replace_from]
+                new = result[result[xdim].values >= replace_from]
+            replaced = len(trimmed) - len(kept)
+            out = pd.concat([kept, new], ignore_index=True)
+            delta = (len(previous), replaced, len(new)-replaced) if len(new) >= replaced else None
+
+        if len(xs):
+            states[key] = (xs[-1], out, hashes)
+        else:
+            states.pop(key, None)
+        return out, delta
+
+    def _map_layers(self, element, fn, layer=()):
+        """
+        Applies the function to each Element in the supplied object,
+        passing along the path of keys identifying the layer so that
+        incremental state is not shared between layers.
+        """
+        if element._deep_indexable:
+            mapped = element.clone(shared_data=False)
+            for k, v in element.items():
+                mapped[k] = self._map_layers(v, fn, layer+(k,))
+            return mapped
+        return fn(element, layer) if isinstance(element, Element) else element
+
+
+class RollingBase(IncrementalBase):
     """
     Parameters shared between `rolling` and `rolling_outlier_std`.
     """
@@ -44,9 +137,7 @@ class rolling(Operation,RollingBase):
     function = param.Callable(default=np.mean, doc="""
         The function to apply over the rolling window.""")
 
-    def _process_layer(self, element, key=None):
-        xdim = element.kdims[0].name
-        df = PandasInterface.as_dframe(element)
+    def _roll(self, df, xdim):
         df = df.set_index(xdim).rolling(win_type=self.p.window_type,
                                         **self._roll_kwargs())
         if self.p.window_type is None:
@@ -60,13 +151,32 @@ class rolling(Operation,RollingBase):
             else:
                 raise ValueError("Rolling window function only supports "
                                  "mean and sum when custom window_type is supplied")
-        return element.clone(rolled.reset_index())
+        return rolled.reset_index()
+
+    def _split(self, xs, n):
+        # Centered windows change once future rows are available
+        window = self.p.rolling_window
+        replace = max(0, n-window) if self.p.center else n
+        if replace == len(xs):
+            return len(xs), None, xs[0]
+        return max(0, replace-window), xs[replace], xs[0]
+
+    def _process_layer(self, element, layer=()):
+        xdim = element.kdims[0].name
+        df = PandasInterface.as_dframe(element)
+        if not self.p.incremental:
+            return element.clone(self._roll(df, xdim))
+        rolled, delta = self._process_incremental(
+            element, df, xdim, lambda df: self._roll(df, xdim), self._split, layer)
+        processed = element.clone(rolled)
+        processed._stream_delta = delta
+        return processed
 
     def _process(self, element, key=None):
-        return element.map(self._process_layer, Element)
+        return self._map_layers(element, self._process_layer)
 
 
-class resample(Operation):
+class resample(Operation, IncrementalBase):
     """
     Resamples a timeseries of dates with a frequency and function.
     """
@@ -83,16 +193,47 @@ class resample(Operation):
     rule = param.String(default='D', doc="""
         A string representing the time interval over which to apply the resampling""")
 
-    def _process_layer(self, element, key=None):
-        df = PandasInterface.as_dframe(element)
-        xdim = element.kdims[0].name
+    def _resample(self, df, xdim):
         resample_kwargs = {'rule': self.p.rule, 'label': self.p.label,
                            'closed': self.p.closed}
         df = df.set_index(xdim).resample(**resample_kwargs)
-        return element.clone(df.apply(self.p.function).reset_index())
+        return df.apply(self.p.function).reset_index()
+
+    def _bin_start(self, x, freq):
+        x = pd.Timestamp(x)
+        if self.p.closed == 'right':
+            return x.ceil(freq) - freq
+        return x.floor(freq)
+
+    def _split(self, xs, n):
+        # Only fixed frequencies which evenly divide a day produce
+        # bins independent of the start of the data
+        try:
+            freq = pd.Timedelta(pd.tseries.frequencies.to_offset(self.p.rule))
+        except ValueError:
+            return None
+        if xs.dtype.kind != 'M' or pd.Timedelta(days=1) % freq:
+            return None
+        last = self._bin_start(xs[n-1], freq).to_datetime64()
+        side = 'right' if self.p.closed == 'right' else 'left'
+        first = self._bin_start(xs[0], freq)
+        if self.p.label != 'left':
+            first += freq
+        return np.searchsorted(xs, last, side), None, first.to_datetime64()
+
+    def _process_layer(self, element, layer=()):
+        df = PandasInterface.as_dframe(element)
+        xdim = element.kdims[0].name
+        if not self.p.incremental:
+            return element.clone(self._resample(df, xdim))
+        resampled, delta = self._process_incremental(
+            element, df, xdim, lambda df: self._resample(df, xdim), self._split, layer)
+        processed = element.clone(resampled)
+        processed._stream_delta = delta
+        return processed
 
     def _process(self, element, key=None):
-        return element.map(self._process_layer, Element)
+        return self._map_layers(element, self._process_layer)
 
 
 class rolling_outlier_std(Operation, RollingBase):
@@ -110,9 +251,7 @@ class rolling_outlier_std(Operation, RollingBase):
     sigma = param.Number(default=2.0, doc="""
         Minimum sigma before a value is considered an outlier.""")
 
-    def _process_layer(self, element, key=None):
-        ys = element.dimension_values(1)
-
+    def _outliers(self, ys):
         # Calculate the variation in the distribution of the residual
         avg = pd.Series(ys).rolling(**self._roll_kwargs()).mean()
         residual = ys - avg
@@ -120,8 +259,27 @@ class rolling_outlier_std(Operation, RollingBase):
 
         # Get indices of outliers
         with np.errstate(invalid='ignore'):
-            outliers = (np.abs(residual) > std * self.p.sigma).values
-        return element[outliers].clone(new_type=Scatter)
+            return (np.abs(residual) > std * self.p.sigma).values
+
+    def _split(self, xs, n):
+        # The residual std depends on rows up to two windows away
+        window = self.p.rolling_window
+        replace = max(0, n-2*window) if self.p.center else n
+        if replace == len(xs):
+            return len(xs), None, xs[0]
+        return max(0, replace-2*window), xs[replace], xs[0]
+
+    def _process_layer(self, element, layer=()):
+        if not self.p.incremental:
+            outliers = self._outliers(element.dimension_values(1))
+            return element[outliers].clone(new_type=Scatter)
+        xdim, ydim = (d.name for d in element.dimensions()[:2])
+        df = PandasInterface.as_dframe(element)
+        outliers, delta = self._process_incremental(
+            element, df, xdim, lambda df: df[self._outliers(df[ydim].values)], self._split, layer)
+        processed = element.clone(outliers, new_type=Scatter)
+        processed._stream_delta = delta
+        return processed
 
     def _process(self, element, key=None):
-        return element.map(self._process_layer, Element)
+        return self._map_layers(element, self._process_layer)
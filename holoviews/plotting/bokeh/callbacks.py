@@ -1,7 +1,14 @@
 from __future__ import absolute_import, division, unicode_literals
 
+import time
+
 from collections import defaultdict
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 import param
 import numpy as np
 from bokeh.models import (
@@ -105,6 +112,16 @@ class MessageCallback(object):
         self._queue = []
 
 
+    def _stream_timeout(self, default):
+        """
+        Returns the longest timeout declared on the attached streams
+        or the supplied default if none was declared.
+        """
+        timeouts = [s.timeout for s in self.streams
+                    if getattr(s, 'timeout', None) is not None]
+        return max(timeouts) if timeouts else default
+
+
     def _filter_msg(self, msg, ids):
         """
         Filter event values that do not originate from the plotting
@@ -259,7 +276,7 @@ class CustomJSCallback(MessageCallback):
             plot_id = self.plot.id or 'PLACEHOLDER_PLOT_ID'
         self_callback = self.js_callback.format(comm_id=self.comm.id,
                                                 timeout=self.timeout,
-                                                debounce=self.debounce,
+                                                debounce=self._stream_timeout(self.debounce),
                                                 plot_id=plot_id)
 
         attributes = self.attributes_js(self.attributes)
@@ -295,11 +312,28 @@ class ServerCallback(MessageCallback):
     resolves the requested attributes on the Python end and then hands
     the msg off to the general on_msg handler, which will update the
     Stream(s) attached to the callback.
+
+    When the executor option of the plot is set to 'thread' and the
+    plot is served by a bokeh server, the msg is handled on a worker
+    thread so that slow DynamicMap callbacks do not block the event
+    loop. Only one msg per callback is in flight at any time; events
+    received in the meantime are coalesced and only the latest model
+    state is processed once the pending msg has completed. The worker
+    thread only updates the streams and evaluates the new frame, the
+    bokeh models are updated on the event loop in a next tick
+    callback, so the event loop never waits on a worker thread.
     """
 
+    # Maximum number of worker threads shared by all server callbacks
+    max_workers = 4
+
+    _executor = None
+
     def __init__(self, plot, streams, source, **params):
         super(ServerCallback, self).__init__(plot, streams, source, **params)
         self._active = False
+        self._last_event = 0
+        self._latency = 0
 
 
     @classmethod
@@ -326,18 +360,94 @@ class ServerCallback(MessageCallback):
         return {'id': model.ref['id'], 'value': resolved}
 
 
+    @classmethod
+    def _get_executor(cls):
+        if ServerCallback._executor is None:
+            ServerCallback._executor = ThreadPoolExecutor(max_workers=cls.max_workers)
+        return ServerCallback._executor
+
+
+    @property
+    def policy(self):
+        """
+        The throttling policy and timeout (in milliseconds) declared
+        on the attached streams, picking the most conservative policy
+        and the longest timeout.
+        """
+        policies = [getattr(s, 'policy', 'throttle') for s in self.streams]
+        timeout = self._stream_timeout(50)
+        for policy in ('adaptive', 'debounce'):
+            if policy in policies:
+                return policy, timeout
+        return 'throttle', timeout
+
+
+    def _delay(self):
+        """
+        Returns the delay in milliseconds before queued events may be
+        processed again.
+        """
+        policy, timeout = self.policy
+        if policy == 'adaptive':
+            return max(timeout, int(self._latency))
+        elif policy == 'debounce':
+            elapsed = (time.time()-self._last_event)*1000
+            return max(timeout-int(elapsed), 0)
+        return timeout
+
+
+    def _schedule(self, callback, delay=None):
+        delay = self._delay() if delay is None else delay
+        if self.plot.document.session_context:
+            self.plot.document.add_timeout_callback(callback, delay)
+        else:
+            PeriodicCallback(callback=callback, period=max(delay, 1), count=1).start()
+
+
+    def _handle_msgs(self, msgs):
+        start = time.time()
+        try:
+            for msg in msgs:
+                self.on_msg(msg)
+        finally:
+            self._latency = (time.time()-start)*1000
+
+
+    def _dispatch(self, msgs, callback):
+        """
+        Hands the msgs to on_msg and reschedules the callback once
+        they have been handled, offloading them to a worker thread
+        if an executor has been requested.
+        """
+        document = self.plot.document
+        if (self.plot.executor != 'thread' or ThreadPoolExecutor is None or
+            document is None or document.session_context is None):
+            try:
+                self._handle_msgs(msgs)
+            finally:
+                self._schedule(callback)
+            return
+
+        def done(future):
+            document.add_next_tick_callback(lambda: self._schedule(callback))
+            exception = future.exception()
+            if exception is not None:
+                self.plot.param.warning('Server callback raised an exception: %s'
+                                        % exception)
+
+        self._get_executor().submit(self._handle_msgs, msgs).add_done_callback(done)
+
+
     def on_change(self, attr, old, new):
         """
         Process change events adding timeout to process multiple concerted
         value change at once rather than firing off multiple plot updates.
         """
         self._queue.append((attr, old, new))
+        self._last_event = time.time()
         if not self._active and self.plot.document:
             self._active = True
-            if self.plot.document.session_context:
-                self.plot.document.add_timeout_callback(self.process_on_change, 50)
-            else:
-                PeriodicCallback(callback=self.process_on_change, period=50, count=1).start()
+            self._schedule(self.process_on_change, self.policy[1])
 
 
     def on_event(self, event):
@@ -346,12 +456,22 @@ class ServerCallback(MessageCallback):
         value change at once rather than firing off multiple plot updates.
         """
         self._queue.append((event))
+        self._last_event = time.time()
         if not self._active and self.plot.document:
             self._active = True
-            if self.plot.document.session_context:
-                self.plot.document.add_timeout_callback(self.process_on_event, 50)
-            else:
-                PeriodicCallback(callback=self.process_on_event, period=50, count=1).start()
+            self._schedule(self.process_on_event, self.policy[1])
+
+
+    def _debounced(self, callback):
+        """
+        Reschedules the callback if events are still being debounced.
+        """
+        if self.policy[0] != 'debounce':
+            return False
+        delay = self._delay()
+        if delay:
+            self._schedule(callback, delay)
+        return bool(delay)
 
 
     def process_on_event(self):
@@ -361,29 +481,30 @@ class ServerCallback(MessageCallback):
         if not self._queue:
             self._active = False
             return
+        elif self._debounced(self.process_on_event):
+            return
         # Get unique event types in the queue
         events = list(OrderedDict([(event.event_name, event)
                                    for event in self._queue]).values())
         self._queue = []
 
         # Process event types
+        msgs = []
         for event in events:
             msg = {}
             for attr, path in self.attributes.items():
                 model_obj = self.plot_handles.get(self.models[0])
                 msg[attr] = self.resolve_attr_spec(path, event, model_obj)
-            self.on_msg(msg)
-
-        if self.plot.document.session_context:
-            self.plot.document.add_timeout_callback(self.process_on_event, 50)
-        else:
-            PeriodicCallback(callback=self.process_on_event, period=50, count=1).start()
+            msgs.append(msg)
+        self._dispatch(msgs, self.process_on_event)
 
 
     def process_on_change(self):
         if not self._queue:
             self._active = False
             return
+        elif self._debounced(self.process_on_change):
+            return
         self._queue = []
 
         msg = {}
@@ -396,13 +517,7 @@ class ServerCallback(MessageCallback):
                 obj_handle = attr_path[0]
             cb_obj = self.plot_handles.get(obj_handle)
             msg[attr] = self.resolve_attr_spec(path, cb_obj)
-
-        self.on_msg(msg)
-
-        if self.plot.document.session_context:
-            self.plot.document.add_timeout_callback(self.process_on_change, 50)
-        else:
-            PeriodicCallback(callback=self.process_on_change, period=100, count=1).start()
+        self._dispatch([msg], self.process_on_change)
 
 
     def set_server_callback(self, handle):
@@ -20,7 +20,11 @@ from ...element import Bars
 from ...operation import interpolate_curve
 from ...util.transform import dim
 from ..mixins import AreaMixin, SpikesMixin
-from ..util import compute_sizes, get_min_distance, get_axis_padding
+from ..util import (
+    attach_downsample_stream, compute_sizes, downsample_curve,
+    get_min_distance, get_axis_padding
+)
+from .callbacks import RangeXYCallback
 from .element import ElementPlot, ColorbarPlot, LegendPlot
 from .styles import (expand_batched_style, line_properties, fill_properties,
                      mpl_to_bokeh, rgb2hex)
@@ -323,6 +327,12 @@ class VectorFieldPlot(ColorbarPlot):
 
 class CurvePlot(ElementPlot):
 
+    downsample = param.ObjectSelector(default=None, objects=[None, 'lttb', 'minmax'], doc="""
+        Whether to downsample the curve to two samples per pixel of
+        the plot width using the 'lttb' (Largest-Triangle-Three-Buckets)
+        or 'minmax' algorithm of the downsample1d operation. The curve
+        is resampled whenever the visible range of the plot changes.""")
+
     interpolation = param.ObjectSelector(objects=['linear', 'steps-mid',
                                                   'steps-pre', 'steps-post'],
                                          default='linear', doc="""
@@ -336,6 +346,17 @@ class CurvePlot(ElementPlot):
     _plot_methods = dict(single='line', batched='multi_line')
     _batched_style_opts = line_properties
 
+    def __init__(self, element, plot=None, **params):
+        super(CurvePlot, self).__init__(element, plot, **params)
+        if self.downsample:
+            stream = attach_downsample_stream(self, RangeXYCallback)
+            # Resampled data changes with the viewport
+            self.static = False
+            if stream is not None and not self.top_level:
+                # Overlaid plots are refreshed in place and must push
+                # the updated data source themselves
+                stream.add_subscriber(lambda **kwargs: self.push(), 2)
+
     def get_data(self, element, ranges, style):
         xidx, yidx = (1, 0) if self.invert_axes else (0, 1)
         x = element.get_dimension(xidx).name
@@ -343,6 +364,10 @@ class CurvePlot(ElementPlot):
         if self.static_source and not self.batched:
             return {}, dict(x=x, y=y), style
 
+        if self.downsample:
+            size = self.height if self.invert_axes else self.width
+            frame = self.frame_height if self.invert_axes else self.frame_width
+            element = downsample_curve(self, element, frame or size or 400)
         if 'steps' in self.interpolation:
             element = interpolate_curve(element, interpolation=self.interpolation)
         data = {x: element.dimension_values(xidx),
@@ -37,10 +37,11 @@ from .styles import (
     rgba_tuple, text_properties, validate)
 from .tabular import TablePlot
 from .util import (
-    TOOL_TYPES, bokeh_version, date_to_integer, decode_bytes, get_tab_title,
+    TOOL_TYPES, bokeh_version, date_to_integer, decode_bytes, downcast_array,
+    get_tab_title,
     glyph_order, py2js_tickformatter, recursive_model_update,
     theme_attr_json, cds_column_replace, hold_policy, match_dim_specs,
-    compute_layout_properties, wrap_formatter)
+    compute_layout_properties, wrap_formatter, columns_equal)
 
 
 
@@ -145,6 +146,29 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         Whether to invert the share axes across plots
         for linked panning and zooming.""")
 
+    shared_frame_data = param.Boolean(default=False, doc="""
+        Whether to omit data columns which are identical to the
+        initial frame in all frames of a HoloMap when updating the
+        plot. Since only the columns which change are then sent for
+        each frame this can considerably reduce the size of embedded
+        (static HTML) exports. Only columns holding the values of a
+        dimension are considered, they are compared against the
+        data of all frames once when the plot is first updated.""")
+
+    downcast = param.Boolean(default=False, doc="""
+        Whether to cast numeric data columns to narrower dtypes before
+        sending them to the browser when this loses no precision.
+        Integers are cast to uint8 or int32 and floats to float32,
+        reducing the size of the binary buffers bokeh serializes.
+        Columns of streaming plots are only cast if a dtype is
+        declared in transport_dtypes.""")
+
+    transport_dtypes = param.Dict(default={}, doc="""
+        Dictionary mapping dimension or data source column names to
+        the dtype the column is cast to before it is sent to the
+        browser, e.g. {'x': 'float32'}, regardless of the precision
+        that is lost.""")
+
     default_tools = param.List(default=['save', 'pan', 'wheel_zoom',
                                         'box_zoom', 'reset'],
         doc="A list of plugin tools to use on the plot.")
@@ -1295,6 +1319,60 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         return plot
 
 
+    def _postprocess_data(self, data):
+        """
+        Casts numeric columns to the declared transport dtypes or
+        losslessly downcasts them if enabled, ensuring that numeric
+        buffers are contiguous so they are serialized in binary form.
+        """
+        data = super(ElementPlot, self)._postprocess_data(data)
+        dtypes = dict(self.transport_dtypes)
+        dtypes.update({util.dimension_sanitizer(k): v for k, v in
+                       self.transport_dtypes.items()})
+        downcast = self.downcast and not self.streaming
+        for k, values in data.items():
+            dtype = dtypes.get(k)
+            if dtype is None and not downcast:
+                if isinstance(values, np.ndarray):
+                    data[k] = downcast_array(values, values.dtype)
+            elif isinstance(values, list):
+                data[k] = [downcast_array(v, dtype) for v in values]
+            else:
+                data[k] = downcast_array(values, dtype)
+        return data
+
+
+    def _data_sources(self):
+        """
+        Returns the list of data sources updated by the plot.
+        """
+        return [self.handles['source']] if 'source' in self.handles else []
+
+
+    def _compute_shared_columns(self):
+        """
+        Computes the data source columns which hold the values of a
+        dimension that are identical to the data of the initial frame
+        across all frames of the HoloMap. The columns are compared
+        against the element data directly, so no frame is rendered.
+        Since the frames of an embedded HoloMap may be displayed in
+        any order only columns shared by all frames may be omitted
+        from updates.
+        """
+        if isinstance(self.hmap, DynamicMap) or self.batched or len(self.hmap) < 2:
+            return {}
+        elements = list(self.hmap.data.values())
+        dims = {util.dimension_sanitizer(d.name): d for d in elements[0].dimensions()}
+        shared = {}
+        for source in self._data_sources():
+            shared[source.ref['id']] = {
+                col for col, values in source.data.items() if col in dims and
+                all(el.get_dimension(dims[col]) is not None and
+                    columns_equal(values, el.dimension_values(dims[col]))
+                    for el in elements)}
+        return shared
+
+
     def _update_glyphs(self, element, ranges, style):
         plot = self.handles['plot']
         glyph = self.handles.get('glyph')
@@ -1309,6 +1387,8 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             current_id = element._plot_id
         self.handles['previous_id'] = current_id
         self.static_source = (self.dynamic and (current_id == previous_id))
+        if self.shared_frame_data and self._shared_columns is None:
+            self._shared_columns = self._compute_shared_columns()
         if self.batched:
             data, mapping, style = self.get_batched_data(element, ranges)
         else:
@@ -1493,6 +1573,8 @@ class CompositeElementPlot(ElementPlot):
             current_id = element._plot_id
         self.handles['previous_id'] = current_id
         self.static_source = (self.dynamic and (current_id == previous_id))
+        if self.shared_frame_data and self._shared_columns is None:
+            self._shared_columns = self._compute_shared_columns()
         data, mapping, style = self.get_data(element, ranges, style)
 
         keys = glyph_order(dict(data, **mapping), self._draw_order)
@@ -1515,6 +1597,11 @@ class CompositeElementPlot(ElementPlot):
                 self._update_datasource(source, gdata)
 
 
+    def _data_sources(self):
+        return [source for key, source in self.handles.items()
+                if key.endswith('_source')]
+
+
     def _init_glyph(self, plot, mapping, properties, key):
         """
         Returns a Bokeh glyph object.
@@ -10,6 +10,7 @@ from ...element import Polygons
 from ...util.transform import dim
 from .callbacks import PolyDrawCallback, PolyEditCallback
 from .element import ColorbarPlot, LegendPlot
+from .selection import BokehOverlaySelectionDisplay
 from .styles import (expand_batched_style, line_properties, fill_properties,
                      mpl_to_bokeh, validate)
 from .util import bokeh_version, multi_polygons_data
@@ -31,6 +32,8 @@ class PathPlot(LegendPlot, ColorbarPlot):
     _mapping = dict(xs='xs', ys='ys')
     _batched_style_opts = line_properties
 
+    selection_display = BokehOverlaySelectionDisplay()
+
     def _hover_opts(self, element):
         cdim = element.get_dimension(self.color_index)
         if self.batched:
@@ -43,6 +43,12 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
     plotting interface for Bokeh based plots.
     """
 
+    executor = param.ObjectSelector(default=None, objects=[None, 'thread'], doc="""
+        Whether to handle events from a bokeh server on a worker
+        thread, so that slow DynamicMap callbacks do not block the
+        server event loop. The plot updates are still applied on the
+        event loop.""")
+
     shared_datasource = param.Boolean(default=True, doc="""
         Whether Elements drawing the data from the same object should
         share their Bokeh data source allowing for linked brushing
@@ -84,6 +90,9 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
 
     selection_display = NoOpSelectionDisplay()
 
+    # Data columns shared by all frames indexed by data source id
+    _shared_columns = None
+
     @property
     def id(self):
         return self.root.ref['id'] if self.root else None
@@ -147,11 +156,43 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
                 source.stream(data, stream.length)
             return
 
+        delta = getattr(self.current_frame, '_stream_delta', None)
+        if delta and self._stream_data and not empty and self._stream_delta(source, data, delta):
+            return
+
+        shared = (self._shared_columns or {}).get(source.ref['id'])
+        if shared:
+            data = {k: v for k, v in data.items() if k not in shared}
+            if not data:
+                return
+
         if cds_column_replace(source, data):
             source.data = data
         else:
             source.data.update(data)
 
+    def _stream_delta(self, source, data, delta):
+        """
+        Applies an incremental update emitted by an operation (e.g. an
+        incremental rolling window), patching the recomputed rows and
+        streaming the new rows instead of replacing the data source.
+        Returns whether the update could be applied.
+        """
+        previous, replaced, new = delta
+        if set(data) != set(source.data):
+            return False
+        lengths = set(len(v) for v in source.data.values())
+        length = len(list(data.values())[0])
+        if lengths != {previous} or (not new and length != previous):
+            return False
+        if replaced:
+            end = length - new
+            source.patch({k: [(slice(previous-replaced, previous), v[end-replaced:end])]
+                          for k, v in data.items()})
+        if new:
+            source.stream({k: v[length-new:] for k, v in data.items()}, length)
+        return True
+
     def _update_callbacks(self, plot):
         """
         Iterates over all subplots and updates existing CustomJS
@@ -3,19 +3,46 @@ from __future__ import absolute_import, division, unicode_literals
 import numpy as np
 import param
 
-from bokeh.models import DatetimeAxis, CustomJSHover
+from bokeh.models import DatetimeAxis, CustomJSHover, LinearColorMapper
 
 from ...core.util import cartesian_product, dimension_sanitizer, isfinite
 from ...element import Raster
 from .element import ElementPlot, ColorbarPlot
 from .styles import line_properties, fill_properties, mpl_to_bokeh
-from .util import colormesh
+from .util import colormesh, downsample_image, quantize_image
+
+
+def frame_shape(plot):
+    """
+    Returns the (height, width) in pixels available to an image in
+    the plot or None if the plot is sized responsively.
+    """
+    if plot.responsive:
+        return None
+    height = plot.frame_height or plot.height
+    width = plot.frame_width or plot.width
+    if height is None and width is None:
+        return None
+    return (height, width)
 
 
 class RasterPlot(ColorbarPlot):
 
     clipping_colors = param.Dict(default={'NaN': 'transparent'})
 
+    downsample_image = param.Boolean(default=False, doc="""
+        Whether to downsample images with more pixels than the plot
+        frame by averaging, before sending them to the browser. Since
+        the image is not resampled when zooming this is best suited
+        to images which are not already rasterized to the viewport.""")
+
+    quantize = param.Boolean(default=False, doc="""
+        Whether to send images as uint8 or uint16 indexes into the
+        colormap palette instead of the raw values, which renders the
+        same colors while reducing the size of the data sent to the
+        browser. Only applies to linear colormapping without low and
+        high clipping colors and when hover is disabled.""")
+
     show_legend = param.Boolean(default=False, doc="""
         Whether to show legend for the plot.""")
 
@@ -96,6 +123,7 @@ class RasterPlot(ColorbarPlot):
             b, t = t, b
         data = dict(x=[l], y=[b], dw=[dw], dh=[dh])
 
+        shape = frame_shape(self) if self.downsample_image else None
         for i, vdim in enumerate(element.vdims, 2):
             if i > 2 and 'hover' not in self.handles:
                 break
@@ -107,6 +135,10 @@ class RasterPlot(ColorbarPlot):
             if ((self.invert_axes and not type(element) is Raster) or
                 (not self.invert_axes and type(element) is Raster)):
                 img = img.T
+            if shape:
+                img = downsample_image(img, shape)
+            if i == 2 and self.quantize and 'hover' not in self.handles:
+                img = self._quantize(img, style)
             if self.invert_xaxis:
                 img = img[:, ::-1]
             if self.invert_yaxis:
@@ -116,10 +148,35 @@ class RasterPlot(ColorbarPlot):
 
         return (data, mapping, style)
 
+    def _quantize(self, img, style):
+        """
+        Replaces the image with indexes into the colormap palette and
+        the color mapper of the glyph with one mapping the indexes
+        onto the same colors.
+        """
+        quantized = quantize_image(img, style['color_mapper'])
+        if quantized is None:
+            return img
+        img, opts = quantized
+        mapper = self.handles.get('index_mapper')
+        if mapper is None:
+            mapper = LinearColorMapper(**opts)
+            self.handles['index_mapper'] = mapper
+        else:
+            mapper.update(**opts)
+        style['color_mapper'] = mapper
+        return img
+
 
 
 class RGBPlot(ElementPlot):
 
+    downsample_image = param.Boolean(default=False, doc="""
+        Whether to downsample images with more pixels than the plot
+        frame by averaging, before sending them to the browser. Since
+        the image is not resampled when zooming this is best suited
+        to images which are not already rasterized to the viewport.""")
+
     style_opts = ['alpha', 'visible']
 
     _nonvectorized_styles = style_opts
@@ -150,11 +207,16 @@ class RGBPlot(ElementPlot):
                                    'floats or [0..255] for integers).')
                 img = np.clip(img, 0, 255)
 
-            if img.dtype.name != 'uint8':
-                img = img.astype(np.uint8)
             if img.shape[2] == 3: # alpha channel not included
-                alpha = np.full(img.shape[:2], 255, dtype='uint8')
+                alpha = np.full(img.shape[:2], 255, dtype=img.dtype)
                 img = np.dstack([img, alpha])
+            shape = frame_shape(self) if self.downsample_image else None
+            if shape:
+                if self.invert_axes:
+                    shape = shape[::-1]
+                img = np.round(downsample_image(img, shape))
+            if img.dtype.name != 'uint8':
+                img = img.astype(np.uint8)
             N, M, _ = img.shape
             #convert image NxM dtype=uint32
             if not img.flags['C_CONTIGUOUS']:
@@ -194,6 +256,21 @@ class QuadMeshPlot(ColorbarPlot):
 
     clipping_colors = param.Dict(default={'NaN': 'transparent'})
 
+    image_rendering = param.Boolean(default=True, doc="""
+        Whether to render QuadMeshes on a regular or rectilinear grid
+        using a single image glyph instead of individual quads. Axes
+        with non-uniform spacing are resampled onto a uniform grid
+        fine enough to resolve the narrowest cell. Falls back to quads
+        when that grid exceeds the max_oversampling budget, when hover
+        is enabled so that the hover information refers to individual
+        cells, on log axes and when the cell outlines are visible.""")
+
+    max_oversampling = param.Number(default=16, bounds=(1, None), doc="""
+        Maximum ratio between the number of pixels of the uniform grid
+        a rectilinear QuadMesh is resampled onto and its number of
+        cells. QuadMeshes which require a finer grid to resolve their
+        narrowest cells are rendered using quads instead.""")
+
     show_legend = param.Boolean(default=False, doc="""
         Whether to show legend for the plot.""")
 
@@ -203,24 +280,123 @@ class QuadMeshPlot(ColorbarPlot):
 
     _plot_methods = dict(single='quad')
 
+    _image_properties = ['source', 'visible', 'name', 'level', 'global_alpha',
+                         'color_mapper', 'legend', 'legend_label']
+
+    def _use_image(self, element, irregular, style):
+        """
+        Whether the element can be rendered using an image glyph.
+        """
+        if (irregular or not self.image_rendering or self.logx or self.logy
+            or 'hover' in self.handles
+            or 'glyph' in self.handles and 'image' not in self.handles['glyph'].properties()):
+            return False
+        # Image glyphs cannot draw the outline of each cell
+        line_alpha = style.get('line_alpha', style.get('alpha', 1))
+        if (line_alpha and style.get('line_width', 1) and
+            style.get('line_color', 'black') is not None):
+            return False
+        if not all(element.interface.dtype(element, kd).kind in 'uif'
+                   for kd in element.kdims):
+            return False
+        elif 'glyph' in self.handles:
+            # An existing image glyph cannot be replaced by quads
+            return True
+        x, y = element.kdims[::-1] if self.invert_axes else element.kdims
+        xc, yc = (element.interface.coords(element, x, edges=True, ordered=True),
+                  element.interface.coords(element, y, edges=True, ordered=True))
+        ncells = max((len(xc)-1) * (len(yc)-1), 1)
+        return self._samples(xc) * self._samples(yc) <= self.max_oversampling * ncells
+
+    def _samples(self, edges):
+        """
+        Returns the number of samples of a uniform grid spanning the
+        edges which resolves the narrowest cell.
+        """
+        widths = np.diff(edges)
+        if len(widths) < 2 or np.allclose(widths, widths[0], rtol=1e-6):
+            return len(widths)
+        return int(np.ceil((edges[-1] - edges[0]) / widths.min()))
+
+    def _resample_index(self, edges, samples):
+        """
+        Returns the index of the cell sampled by each of the samples
+        of a uniform grid spanning the edges or None if the edges are
+        already uniformly spaced.
+        """
+        widths = np.diff(edges)
+        if len(widths) < 2 or np.allclose(widths, widths[0], rtol=1e-6):
+            return None
+        span = edges[-1] - edges[0]
+        centers = edges[0] + (np.arange(samples) + 0.5) * (span / samples)
+        return np.clip(np.searchsorted(edges, centers, side='right') - 1,
+                       0, len(widths) - 1)
+
+    def _get_image_data(self, element, x, y, z, ranges, style):
+        """
+        Samples a regular or rectilinear QuadMesh onto a uniform image
+        avoiding the construction of a quad for each cell.
+        """
+        xc, yc = (element.interface.coords(element, x, edges=True, ordered=True),
+                  element.interface.coords(element, y, edges=True, ordered=True))
+        img = element.dimension_values(z, flat=False)
+        if self.invert_axes:
+            img = img.T
+        nx, ny = self._samples(xc), self._samples(yc)
+        budget = self.max_oversampling * max((len(xc)-1) * (len(yc)-1), 1)
+        if nx * ny > budget:
+            # Only reached when updating an existing image glyph, which
+            # cannot be replaced, so the resolution is reduced instead
+            scale = np.sqrt(budget / float(nx * ny))
+            nx, ny = max(int(nx*scale), 1), max(int(ny*scale), 1)
+        xindex, yindex = self._resample_index(xc, nx), self._resample_index(yc, ny)
+        if xindex is not None:
+            img = img[:, xindex]
+        if yindex is not None:
+            img = img[yindex]
+        if img.dtype.kind == 'b':
+            img = img.astype(np.int8)
+        if 0 in img.shape:
+            img = np.array([[np.NaN]])
+
+        l, r, b, t = xc[0], xc[-1], yc[0], yc[-1]
+        dh, dw = t-b, r-l
+        if self.invert_xaxis:
+            l, r = r, l
+            img = img[:, ::-1]
+        if self.invert_yaxis:
+            b, t = t, b
+            img = img[::-1]
+        return dict(x=[l], y=[b], dw=[dw], dh=[dh], image=[img])
+
     def get_data(self, element, ranges, style):
         x, y, z = element.dimensions()[:3]
 
         if self.invert_axes: x, y = y, x
         cmapper = self._get_colormapper(z, element, ranges, style)
-        cmapper = {'field': z.name, 'transform': cmapper}
 
         irregular = (element.interface.irregular(element, x) or
                      element.interface.irregular(element, y))
-        if irregular:
+        image = self._use_image(element, irregular, style)
+        if image:
+            mapping = dict(image='image', x='x', y='y', dw='dw', dh='dh')
+            style['color_mapper'] = cmapper
+            alpha = style.get('fill_alpha', style.get('alpha'))
+            if alpha is not None:
+                style['global_alpha'] = alpha
+        elif irregular:
+            cmapper = {'field': z.name, 'transform': cmapper}
             mapping = dict(xs='xs', ys='ys', fill_color=cmapper)
         else:
+            cmapper = {'field': z.name, 'transform': cmapper}
             mapping = {'left': 'left', 'right': 'right',
                        'fill_color': cmapper,
                        'top': 'top', 'bottom': 'bottom'}
 
         if self.static_source:
             return {}, mapping, style
+        elif image:
+            return self._get_image_data(element, x, y, z, ranges, style), mapping, style
 
         x, y = dimension_sanitizer(x.name), dimension_sanitizer(y.name)
 
@@ -231,26 +407,15 @@ class QuadMeshPlot(ColorbarPlot):
             X, Y = [element.interface.coords(element, d, expanded=True, edges=True)
                     for d in dims]
             X, Y = colormesh(X, Y)
+            X, Y = X[:, :-1], Y[:, :-1]
             zvals = zdata.T.flatten() if self.invert_axes else zdata.flatten()
-            XS, YS = [], []
-            mask = []
-            xc, yc = [], []
-            for xs, ys, zval in zip(X, Y, zvals):
-                xs, ys = xs[:-1], ys[:-1]
-                if isfinite(zval) and all(isfinite(xs)) and all(isfinite(ys)):
-                    XS.append(list(xs))
-                    YS.append(list(ys))
-                    mask.append(True)
-                    if 'hover' in self.handles:
-                        xc.append(xs.mean())
-                        yc.append(ys.mean())
-                else:
-                    mask.append(False)
-
-            data = {'xs': XS, 'ys': YS, z.name: zvals[np.array(mask)]}
+            mask = (isfinite(zvals) & isfinite(X).all(axis=1) &
+                    isfinite(Y).all(axis=1))
+            X, Y = X[mask], Y[mask]
+            data = {'xs': list(X), 'ys': list(Y), z.name: zvals[mask]}
             if 'hover' in self.handles:
-                data[x] = np.array(xc)
-                data[y] = np.array(yc)
+                data[x] = X.mean(axis=1)
+                data[y] = Y.mean(axis=1)
         else:
             xc, yc = (element.interface.coords(element, x, edges=True, ordered=True),
                       element.interface.coords(element, y, edges=True, ordered=True))
@@ -279,8 +444,13 @@ class QuadMeshPlot(ColorbarPlot):
         Returns a Bokeh glyph object.
         """
         properties = mpl_to_bokeh(properties)
+        if 'image' in mapping:
+            properties = {k: v for k, v in properties.items()
+                          if k in self._image_properties}
         properties = dict(properties, **mapping)
-        if 'xs' in mapping:
+        if 'image' in mapping:
+            renderer = plot.image(**properties)
+        elif 'xs' in mapping:
             renderer = plot.patches(**properties)
         else:
             renderer = plot.quad(**properties)
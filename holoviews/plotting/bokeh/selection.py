@@ -7,9 +7,9 @@ class BokehOverlaySelectionDisplay(OverlaySelectionDisplay):
     Overlay selection display subclass for use with bokeh backend
     """
     def _build_element_layer(
-            self, element, layer_color, selection_expr=True
+            self, element, layer_color, selection_expr=True, mask_cache=None
     ):
-        element, visible = self._select(element, selection_expr)
+        element, visible = self._select(element, selection_expr, mask_cache)
 
         backend_options = Store.options(backend='bokeh')
         style_options = backend_options[(type(element).name,)]['style']
@@ -1,7 +1,6 @@
 from __future__ import absolute_import, division, unicode_literals
 
 from collections import defaultdict
-from functools import partial
 
 import param
 import numpy as np
@@ -10,14 +9,14 @@ from bokeh.models import FactorRange, Circle, VBar, HBar
 
 from .selection import BokehOverlaySelectionDisplay
 from ...core.dimension import Dimension, Dimensioned
-from ...core.ndmapping import sorted_context
 from ...core.util import (basestring, dimension_sanitizer, wrap_tuple,
-                          unique_iterator, isfinite)
-from ...operation.stats import univariate_kde
+                          unique_iterator, isfinite, dimension_range)
+from ...operation.stats import _univariate_kde
 from .chart import AreaPlot
 from .element import CompositeElementPlot, ColorbarPlot, LegendPlot
 from .path import PolygonPlot
 from .styles import fill_properties, line_properties
+from ..util import grouped_values, grouped_box_stats
 from .util import bokeh_version, decode_bytes
 
 
@@ -122,7 +121,7 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         if not element.kdims:
             xfactors, yfactors = [element.label], []
         else:
-            factors = [key for key in element.groupby(element.kdims).data.keys()]
+            factors = grouped_values(element)[0]
             if element.ndims > 1:
                 factors = sorted(factors)
             factors = [tuple(d.pprint_value(k) for d, k in zip(element.kdims, key))
@@ -136,27 +135,9 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
             return
         super(BoxWhiskerPlot, self)._postprocess_hover(renderer, source)
 
-    def _box_stats(self, vals):
-        vals = vals[isfinite(vals)]
-
-        if len(vals):
-            q1, q2, q3 = (np.percentile(vals, q=q)
-                          for q in range(25, 100, 25))
-            iqr = q3 - q1
-            upper = vals[vals <= q3 + 1.5*iqr].max()
-            lower = vals[vals >= q1 - 1.5*iqr].min()
-        else:
-            q1, q2, q3 = 0, 0, 0
-            upper, lower = 0, 0
-        outliers = vals[(vals > upper) | (vals < lower)]
-        return q1, q2, q3, upper, lower, outliers
-
     def get_data(self, element, ranges, style):
-        if element.kdims:
-            with sorted_context(False):
-                groups = element.groupby(element.kdims).data
-        else:
-            groups = dict([(element.label, element)])
+        keys, values, offsets = grouped_values(element)
+        stats = grouped_box_stats(values, offsets)
         vdim = dimension_sanitizer(element.vdims[0].name)
 
         # Define CDS data
@@ -189,14 +170,14 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
             cdim, cidx = None, None
 
         factors = []
-        for key, g in groups.items():
+        for i, key in enumerate(keys):
             # Compute group label
             if element.kdims:
                 label = tuple(d.pprint_value(v) for d, v in zip(element.kdims, key))
                 if len(label) == 1:
                     label = label[0]
             else:
-                label = key
+                label = key[0]
             hover = 'hover' in self.handles
 
             # Add color factor
@@ -205,9 +186,10 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
             else:
                 factors.append(label)
 
-            # Compute statistics
-            vals = g.dimension_values(g.vdims[0])
-            q1, q2, q3, upper, lower, outliers = self._box_stats(vals)
+            # Look up statistics
+            q1, q2, q3, upper, lower = (stat[i] for stat in stats[:5])
+            group = slice(offsets[i], offsets[i+1])
+            outliers = values[group][stats[5][group]]
 
             # Add to CDS data
             for data in [r1_data, r2_data]:
@@ -337,18 +319,24 @@ class ViolinPlot(BoxWhiskerPlot):
                    for glyph in ('box', 'violin', 'stats', 'median')] +
                   ['cmap', 'box_cmap', 'violin_cmap'])
 
-    _stat_fns = [partial(np.percentile, q=q) for q in [25, 50, 75]]
-
     selection_display = BokehOverlaySelectionDisplay(color_prop='violin_fill_color')
 
-    def _kde_data(self, el, key, **kwargs):
-        vdim = el.vdims[0]
-        values = el.dimension_values(vdim)
+    def _kde_data(self, element, values, key, stats, **kwargs):
+        vdim = element.vdims[0]
         if self.clip:
             vdim = vdim(range=self.clip)
-            el = el.clone(vdims=[vdim])
-        kde = univariate_kde(el, dimension=vdim.name, **kwargs)
-        xs, ys = (kde.dimension_values(i) for i in range(2))
+        finite = values[isfinite(values)]
+        if all(isfinite(r) for r in vdim.range):
+            bin_range = vdim.range
+        else:
+            lower, upper = ((finite.min(), finite.max()) if len(finite)
+                            else (np.NaN, np.NaN))
+            bin_range = dimension_range(lower, upper, vdim.range, vdim.soft_range)
+        kde = _univariate_kde(values, bin_range, clip=vdim.range, **kwargs)
+        if kde is None:
+            xs, ys = np.array([]), np.array([])
+        else:
+            xs, ys = kde
         mask = isfinite(ys) & (ys>0) # Mask out non-finite and zero values
         xs, ys = xs[mask], ys[mask]
         ys = (ys/ys.max())*(self.violin_width/2.) if len(ys) else []
@@ -357,14 +345,12 @@ class ViolinPlot(BoxWhiskerPlot):
         kde =  {'ys': xs, 'xs': ys}
 
         bars, segments, scatter = defaultdict(list), defaultdict(list), {}
-        values = el.dimension_values(vdim)
-        values = values[isfinite(values)]
+        values = finite
         if not len(values):
             pass
         elif self.inner == 'quartiles':
             if len(xs):
-                for stat_fn in self._stat_fns:
-                    stat = stat_fn(values)
+                for stat in stats[:3]:
                     sidx = np.argmin(np.abs(xs-stat))
                     sx, sy = xs[sidx], ys[sidx]
                     segments['x'].append(sx)
@@ -380,7 +366,7 @@ class ViolinPlot(BoxWhiskerPlot):
                     segments['y1'].append(sy)
         elif self.inner == 'box':
             xpos = key+(0,)
-            q1, q2, q3, upper, lower, _ = self._box_stats(values)
+            q1, q2, q3, upper, lower = stats
             segments['x'].append(xpos)
             segments['y0'].append(lower)
             segments['y1'].append(upper)
@@ -393,11 +379,8 @@ class ViolinPlot(BoxWhiskerPlot):
 
 
     def get_data(self, element, ranges, style):
-        if element.kdims:
-            with sorted_context(False):
-                groups = element.groupby(element.kdims).data
-        else:
-            groups = dict([((element.label,), element)])
+        keys, values, offsets = grouped_values(element)
+        stats = grouped_box_stats(values, offsets)[:5]
 
         # Define glyph-data mapping
         if self.invert_axes:
@@ -424,9 +407,15 @@ class ViolinPlot(BoxWhiskerPlot):
         kwargs = {'bandwidth': self.bandwidth, 'cut': self.cut}
         mapping, data = {}, {}
         patches_data, seg_data, bar_data, scatter_data = (defaultdict(list) for i in range(4))
-        for i, (key, g) in enumerate(groups.items()):
+        # Box statistics are computed for all groups at once, the KDE
+        # is still estimated per group since its bandwidth and support
+        # depend on the values of each group
+        for i, key in enumerate(keys):
             key = decode_bytes(key)
-            kde, segs, bars, scatter = self._kde_data(g, key, **kwargs)
+            group_stats = tuple(stat[i] for stat in stats)
+            group = values[offsets[i]:offsets[i+1]]
+            kde, segs, bars, scatter = self._kde_data(element, group, key,
+                                                      group_stats, **kwargs)
             for k, v in segs.items():
                 seg_data[k] += v
             for k, v in bars.items():
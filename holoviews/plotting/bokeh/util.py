@@ -21,6 +21,7 @@ from bokeh.layouts import WidgetBox, Row, Column
 from bokeh.models import tools
 from bokeh.models import Model, ToolbarBox, FactorRange, Range1d, Plot, Spacer, CustomJS, GridBox
 from bokeh.models.formatters import FuncTickFormatter, TickFormatter, PrintfTickFormatter
+from bokeh.models.mappers import LinearColorMapper
 from bokeh.models.widgets import DataTable, Tabs, Div
 from bokeh.plotting import Figure
 from bokeh.themes.theme import Theme
@@ -110,6 +111,81 @@ def decode_bytes(array):
     return decoded
 
 
+def downcast_array(array, dtype=None):
+    """
+    Casts a numeric array to a narrower dtype to reduce the size of
+    the binary buffer sent to the browser. If a dtype is supplied the
+    array is cast to it unconditionally, otherwise integers are cast
+    to uint8 or int32 and floats to float32 only if no precision is
+    lost. Numeric arrays are always returned C-contiguous.
+    """
+    if not isinstance(array, np.ndarray) or array.dtype.kind not in 'iuf':
+        return array
+    elif dtype is not None or not len(array):
+        return np.ascontiguousarray(array, dtype=dtype)
+    kind, itemsize = array.dtype.kind, array.dtype.itemsize
+    if kind in 'iu' and itemsize > 1:
+        low, high = array.min(), array.max()
+        if low >= 0 and high <= 255:
+            dtype = np.uint8
+        elif itemsize > 4 and low >= -2**31 and high < 2**31:
+            dtype = np.int32
+    elif kind == 'f' and itemsize > 4:
+        cast = array.astype(np.float32)
+        with np.errstate(invalid='ignore', over='ignore'):
+            if ((cast == array) | np.isnan(array)).all():
+                return np.ascontiguousarray(cast)
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
+def downsample_image(img, shape):
+    """
+    Downsamples a 2D image, or a 3D image with channels along the last
+    axis, so that it does not exceed the supplied (height, width) by
+    averaging the pixels falling into each output pixel and ignoring
+    NaNs. Since the output pixels evenly partition the input the
+    extent covered by the image is unchanged.
+    """
+    for axis, size in enumerate(shape):
+        n = img.shape[axis]
+        if size is None or n <= size:
+            continue
+        if img.dtype.kind != 'f':
+            img = img.astype('float64')
+        starts = (np.arange(size) * n) // size
+        valid = ~np.isnan(img)
+        sums = np.add.reduceat(np.where(valid, img, 0), starts, axis=axis)
+        counts = np.add.reduceat(valid, starts, axis=axis)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            img = sums / counts
+    return img
+
+
+def quantize_image(img, cmapper):
+    """
+    Converts a scalar image into uint8 or uint16 indexes into the
+    palette of a LinearColorMapper, returning the indexes and the
+    options of a LinearColorMapper which maps them onto the same
+    colors. Index zero is reserved for NaNs. Returns None if the
+    color mapper cannot be reproduced exactly, e.g. if it declares
+    low or high clipping colors.
+    """
+    if (type(cmapper) is not LinearColorMapper or cmapper.low_color is not None
+        or cmapper.high_color is not None or cmapper.low is None or cmapper.high is None
+        or cmapper.low >= cmapper.high):
+        return None
+    ncolors = len(cmapper.palette)
+    dtype = np.uint8 if ncolors < 255 else np.uint16
+    low, high = cmapper.low, cmapper.high
+    with np.errstate(invalid='ignore'):
+        codes = np.floor((img - low) / (high - low) * ncolors)
+        codes = np.clip(codes, 0, ncolors-1) + 1
+    codes[np.isnan(img)] = 0
+    mapper = dict(palette=cmapper.palette, low=0.5, high=ncolors+0.5,
+                  low_color=cmapper.nan_color)
+    return codes.astype(dtype), mapper
+
+
 def layout_padding(plots, renderer):
     """
     Pads Nones in a list of lists of plots with empty plots.
@@ -641,6 +717,22 @@ def cds_column_replace(source, data):
     return bool(untouched and current_length and new_length and current_length[0] != new_length[0])
 
 
+def columns_equal(old, new):
+    """
+    Determine whether two data source columns contain identical
+    values. NaNs are treated as unequal so columns containing NaNs
+    are always considered to have changed.
+    """
+    if old is new:
+        return True
+    elif len(old) != len(new):
+        return False
+    try:
+        return bool(np.array_equal(np.asarray(old), np.asarray(new)))
+    except Exception:
+        return False
+
+
 @contextmanager
 def hold_policy(document, policy, server=False):
     """
@@ -22,7 +22,9 @@ from ...operation import interpolate_curve
 from ...util.transform import dim
 from ..plot import PlotSelector
 from ..mixins import AreaMixin, SpikesMixin
-from ..util import compute_sizes, get_sideplot_ranges, get_min_distance
+from ..util import (
+    compute_sizes, downsample_curve, get_sideplot_ranges, get_min_distance
+)
 from .element import ElementPlot, ColorbarPlot, LegendPlot
 from .path  import PathPlot
 from .plot import AdjoinedPlot, mpl_rc_context
@@ -51,6 +53,13 @@ class CurvePlot(ChartPlot):
         Whether to let matplotlib automatically compute tick marks
         or to allow the user to control tick marks.""")
 
+    downsample = param.ObjectSelector(default=None, objects=[None, 'lttb', 'minmax'], doc="""
+        Whether to downsample the curve to two samples per pixel of
+        the plot width using the 'lttb' (Largest-Triangle-Three-Buckets)
+        or 'minmax' algorithm of the downsample1d operation. Only the
+        range declared by the axis limits or reported by an attached
+        RangeX or RangeXY stream is downsampled.""")
+
     interpolation = param.ObjectSelector(objects=['linear', 'steps-mid',
                                                   'steps-pre', 'steps-post'],
                                          default='linear', doc="""
@@ -78,6 +87,11 @@ class CurvePlot(ChartPlot):
         with abbreviated_exception():
             style = self._apply_transforms(element, ranges, style)
 
+        if self.downsample:
+            ax = self.handles.get('axis')
+            bbox = ax.get_window_extent() if ax else None
+            size = (bbox.height if self.invert_axes else bbox.width) if bbox else 400
+            element = downsample_curve(self, element, size)
         if 'steps' in self.interpolation:
             element = interpolate_curve(element, interpolation=self.interpolation)
         xs = element.dimension_values(0)
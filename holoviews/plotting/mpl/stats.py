@@ -3,7 +3,7 @@ from __future__ import absolute_import, division, unicode_literals
 import param
 import numpy as np
 
-from ...core.ndmapping import sorted_context
+from ..util import grouped_values
 from .chart import AreaPlot, ChartPlot
 from .path import PolygonPlot
 from .plot import AdjoinedPlot
@@ -69,19 +69,14 @@ class BoxPlot(ChartPlot):
         )
 
     def get_data(self, element, ranges, style):
-        if element.kdims:
-            with sorted_context(False):
-                groups = element.groupby(element.kdims).data.items()
-        else:
-            groups = [(element.label, element)]
-
+        keys, values, offsets = grouped_values(element)
         data, labels = [], []
-        for key, group in groups:
+        for i, key in enumerate(keys):
             if element.kdims:
                 label = ','.join([d.pprint_value(v) for d, v in zip(element.kdims, key)])
             else:
-                label = key
-            data.append(group[group.vdims[0]])
+                label = key[0]
+            data.append(values[offsets[i]:offsets[i+1]])
             labels.append(label)
         style['labels'] = labels
         style = {k: v for k, v in style.items()
@@ -188,20 +183,15 @@ class ViolinPlot(BoxPlot):
         return artists
 
     def get_data(self, element, ranges, style):
-        if element.kdims:
-            with sorted_context(False):
-                groups = element.groupby(element.kdims).data.items()
-        else:
-            groups = [(element.label, element)]
-
+        keys, values, offsets = grouped_values(element)
         data, labels, colors = [], [], []
         elstyle = self.lookup_options(element, 'style')
-        for i, (key, group) in enumerate(groups):
+        for i, key in enumerate(keys):
             if element.kdims:
                 label = ','.join([d.pprint_value(v) for d, v in zip(element.kdims, key)])
             else:
-                label = key
-            data.append(group[group.vdims[0]])
+                label = key[0]
+            data.append(values[offsets[i]:offsets[i+1]])
             labels.append(label)
             colors.append(elstyle[i].get('facecolors', 'blue'))
         style['positions'] = list(range(len(data)))
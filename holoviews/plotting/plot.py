@@ -196,6 +196,12 @@ class Plot(param.Parameterized):
                 self._triggering += [s for p in self.traverse(lambda x: x, [Plot])
                                      for s in p.streams if s._triggering]
                 if self.document.session_context:
+                    if thread_id != state._thread_id:
+                        try:
+                            self._prefetch_frame()
+                        except Exception:
+                            self._triggering = []
+                            raise
                     self.document.add_next_tick_callback(self.refresh)
                     return
 
@@ -204,15 +210,7 @@ class Plot(param.Parameterized):
             s._triggering = True
         try:
             traverse_setter(self, '_force', True)
-            key = self.current_key if self.current_key else self.keys[0]
-            dim_streams = [stream for stream in self.streams
-                           if any(c in self.dimensions for c in stream.contents)]
-            stream_params = stream_parameters(dim_streams)
-            key = tuple(None if d in stream_params else k
-                        for d, k in zip(self.dimensions, key))
-            stream_key = util.wrap_tuple_streams(key, self.dimensions, self.streams)
-
-            self._trigger_refresh(stream_key)
+            self._trigger_refresh(self._refresh_key())
             if self.top_level:
                 self.push()
         except Exception as e:
@@ -224,6 +222,41 @@ class Plot(param.Parameterized):
             self._triggering = []
 
 
+    def _refresh_key(self):
+        "Returns the key a refresh event should be rendered at"
+        key = self.current_key if self.current_key else self.keys[0]
+        dim_streams = [stream for stream in self.streams
+                       if any(c in self.dimensions for c in stream.contents)]
+        stream_params = stream_parameters(dim_streams)
+        key = tuple(None if d in stream_params else k
+                    for d, k in zip(self.dimensions, key))
+        return util.wrap_tuple_streams(key, self.dimensions, self.streams)
+
+
+    def _prefetch_frame(self):
+        """
+        Evaluates the DynamicMap callback for a refresh triggered
+        outside the server event loop in the calling thread. The
+        result is memoized on the Callable so the scheduled refresh
+        only has to update the bokeh models on the event loop. The
+        DynamicMap cache and the plot state are only modified by the
+        refresh on the event loop, which therefore never waits on the
+        calling thread. Any exception is raised in the calling thread
+        and the refresh is not scheduled.
+        """
+        hmap = getattr(self, 'hmap', None)
+        if not isinstance(hmap, DynamicMap) or any(
+                s.transient for s in self._triggering):
+            return
+        key_map = dict(zip([d.name for d in self.dimensions], self._refresh_key()))
+        key = tuple(key_map[kd.name] for kd in hmap.kdims if kd.name in key_map)
+        try:
+            hmap._execute_callback(*key)
+        except KeyError:
+            # Keys outside the declared bounds are not rendered
+            pass
+
+
     def _trigger_refresh(self, key):
         "Triggers update to a plot on a refresh event"
         # Update if not top-level, batched or an ElementPlot
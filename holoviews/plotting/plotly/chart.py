@@ -9,7 +9,8 @@ from ...core import util
 from ...element import Bars
 from ...operation import interpolate_curve
 from ..mixins import AreaMixin
-from ..util import get_axis_padding
+from ..util import attach_downsample_stream, downsample_curve, get_axis_padding
+from .callbacks import RangeXYCallback
 from .element import ElementPlot, ColorbarPlot
 
 
@@ -64,6 +65,12 @@ class ScatterPlot(ChartPlot, ColorbarPlot):
 
 class CurvePlot(ChartPlot, ColorbarPlot):
 
+    downsample = param.ObjectSelector(default=None, objects=[None, 'lttb', 'minmax'], doc="""
+        Whether to downsample the curve to two samples per pixel of
+        the plot width using the 'lttb' (Largest-Triangle-Three-Buckets)
+        or 'minmax' algorithm of the downsample1d operation. The curve
+        is resampled whenever the visible range of the plot changes.""")
+
     interpolation = param.ObjectSelector(objects=['linear', 'steps-mid',
                                                   'steps-pre', 'steps-post'],
                                          default='linear', doc="""
@@ -79,7 +86,15 @@ class CurvePlot(ChartPlot, ColorbarPlot):
 
     _style_key = 'line'
 
+    def __init__(self, element, plot=None, **params):
+        super(CurvePlot, self).__init__(element, plot, **params)
+        if self.downsample and self.top_level:
+            attach_downsample_stream(self, RangeXYCallback)
+
     def get_data(self, element, ranges, style):
+        if self.downsample:
+            size = self.height if self.invert_axes else self.width
+            element = downsample_curve(self, element, size or 400)
         if 'steps' in self.interpolation:
             element = interpolate_curve(element, interpolation=self.interpolation)
         return super(CurvePlot, self).get_data(element, ranges, style)
@@ -8,9 +8,9 @@ class PlotlyOverlaySelectionDisplay(OverlaySelectionDisplay):
     Overlay selection display subclass for use with plotly backend
     """
     def _build_element_layer(
-            self, element, layer_color, selection_expr=True
+            self, element, layer_color, selection_expr=True, mask_cache=None
     ):
-        element, visible = self._select(element, selection_expr)
+        element, visible = self._select(element, selection_expr, mask_cache)
 
         backend_options = Store.options(backend='plotly')
         style_options = backend_options[(type(element).name,)]['style']
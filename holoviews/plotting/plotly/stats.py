@@ -2,6 +2,8 @@ from __future__ import absolute_import, division, unicode_literals
 
 import param
 
+from ...core.util import OrderedDict, dimension_sort
+from ..util import grouped_values
 from .selection import PlotlyOverlaySelectionDisplay
 from .chart import ChartPlot
 from .element import ElementPlot, ColorbarPlot
@@ -79,18 +81,18 @@ class MultiDistributionPlot(ElementPlot):
         return element.kdims, element.vdims[0]
 
     def get_data(self, element, ranges, style):
-        if element.kdims:
-            groups = element.groupby(element.kdims).items()
-        else:
-            groups = [(element.label, element)]
+        keys, values, offsets = grouped_values(element)
         plots = []
         axis = 'x' if self.invert_axes else 'y'
-        for key, group in groups:
+        # Sort the groups like element.groupby, supporting mixed types
+        # and the categorical order of the key dimensions
+        groups = OrderedDict((key, i) for i, key in enumerate(keys))
+        for key, i in dimension_sort(groups, element.kdims, [], range(element.ndims)):
             if element.kdims:
                 label = ','.join([d.pprint_value(v) for d, v in zip(element.kdims, key)])
             else:
-                label = key
-            data = {axis: group.dimension_values(group.vdims[0]), 'name': label}
+                label = key[0]
+            data = {axis: values[offsets[i]:offsets[i+1]], 'name': label}
             plots.append(data)
         return plots
 
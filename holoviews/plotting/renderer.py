@@ -28,7 +28,7 @@ from ..core.io import Exporter
 from ..core.options import Store, StoreOptions, SkipRendering, Compositor
 from ..core.util import unbound_dimensions
 from . import Plot
-from .util import displayable, collate, initialize_dynamic
+from .util import displayable, collate, initialize_dynamic, lazy_to_dynamic
 
 from param.parameterized import bothmethod
 
@@ -190,6 +190,9 @@ class Renderer(Exporter):
         """
         Given a HoloViews Viewable return a corresponding plot instance.
         """
+        # Display LazyHoloMaps dynamically, evaluating only shown frames
+        obj = lazy_to_dynamic(obj)
+
         if isinstance(obj, DynamicMap) and obj.unbounded:
             dims = ', '.join('%r' % dim for dim in obj.unbounded)
             msg = ('DynamicMap cannot be displayed without explicit indexing '
@@ -10,15 +10,15 @@ from collections import defaultdict, namedtuple
 import numpy as np
 import param
 
-from ..core import (HoloMap, DynamicMap, CompositeOverlay, Layout,
-                    Overlay, GridSpace, NdLayout, NdOverlay)
+from ..core import (HoloMap, DynamicMap, LazyHoloMap, CompositeOverlay, Layout,
+                    AdjointLayout, Overlay, GridSpace, NdLayout, NdOverlay)
 from ..core.options import Cycle
 from ..core.ndmapping import item_check
 from ..core.spaces import get_nested_streams
 from ..core.util import (match_spec, wrap_tuple, basestring, get_overlay_spec,
                          unique_iterator, closest_match, is_number, isfinite,
-                         python2sort, disable_constant, arraylike_types)
-from ..streams import LinkedStream
+                         python2sort, disable_constant, arraylike_types, pd)
+from ..streams import LinkedStream, RangeX, RangeY, RangeXY
 from ..util.transform import dim
 
 
@@ -250,6 +250,21 @@ def initialize_dynamic(obj):
             dmap[dmap._initial_key()]
 
 
+def lazy_to_dynamic(obj):
+    """
+    Converts LazyHoloMaps, including those nested in layouts, to
+    DynamicMaps so that only the displayed frames are evaluated.
+    """
+    if isinstance(obj, LazyHoloMap):
+        return obj.to_dynamic()
+    elif not isinstance(obj, (Layout, AdjointLayout, NdLayout, GridSpace)):
+        return obj
+    items = [(k, lazy_to_dynamic(v)) for k, v in obj.data.items()]
+    if all(v is obj.data[k] for k, v in items):
+        return obj
+    return obj.clone(items)
+
+
 def get_plot_frame(map_obj, key_map, cached=False):
     """Returns the current frame in a mapping given a key mapping.
 
@@ -1026,6 +1041,46 @@ def _get_min_distance_numpy(element):
     return 0
 
 
+def attach_downsample_stream(plot, callback):
+    """
+    Attaches a RangeXY stream to a plot with the downsample option
+    enabled, which refreshes the plot whenever the viewport changes so
+    that the curve is resampled at the visible range. The callback is
+    the backend specific RangeXY callback class. No stream is attached
+    if the plotted object already declares a range stream.
+    """
+    if any(isinstance(s, (RangeX, RangeY, RangeXY)) for s in plot.streams):
+        return None
+    stream = RangeXY()
+    plot.callbacks.append(callback(plot, [stream], None))
+    stream.add_subscriber(plot.refresh)
+    return stream
+
+
+def downsample_curve(plot, element, width):
+    """
+    Applies the downsample1d operation to a Curve using the algorithm
+    declared by the downsample option of the plot, restricting it to
+    the visible range reported by any range stream attached to the
+    plot or otherwise the declared axis limits.
+    """
+    from ..operation.element import downsample1d
+    if plot.invert_axes:
+        stream_types, attr, lim = (RangeY, RangeXY), 'y_range', plot.ylim
+    else:
+        stream_types, attr, lim = (RangeX, RangeXY), 'x_range', plot.xlim
+    streams = list(plot.streams)
+    streams += [s for cb in getattr(plot, 'callbacks', []) for s in cb.streams]
+    x_range = None
+    for stream in streams:
+        if isinstance(stream, stream_types) and getattr(stream, attr) is not None:
+            x_range = getattr(stream, attr)
+    if x_range is None and all(isfinite(v) for v in lim):
+        x_range = lim
+    return downsample1d(element, algorithm=plot.downsample, width=int(width),
+                        x_range=x_range, dynamic=False)
+
+
 def get_min_distance(element):
     """
     Gets the minimum sampling distance of the x- and y-coordinates
@@ -1060,6 +1115,117 @@ def get_directed_graph_paths(element, arrow_length):
     return arrows
 
 
+def _factorize(values):
+    """
+    Returns integer codes and unique values in order of appearance,
+    with missing values assigned a code of -1 if pandas is available.
+    """
+    if pd is not None:
+        codes, uniques = pd.factorize(values)
+        return codes, np.asarray(uniques)
+    uniques, index, codes = np.unique(values, return_index=True, return_inverse=True)
+    order = np.argsort(index)
+    return np.argsort(order)[codes], uniques[order]
+
+
+def grouped_values(element, dimension=None):
+    """
+    Groups the values of a dimension (by default the first value
+    dimension) of a statistical element by the unique combinations of
+    its key dimensions, in order of appearance. Unlike element.groupby
+    no Element is constructed per group and the values are only
+    sorted once, preserving their original order within each group.
+    Dask backed columns are computed together in a single pass.
+
+    Returns a list of group keys, the grouped values and an array of
+    offsets delimiting each group, i.e. group i corresponds to
+    values[offsets[i]:offsets[i+1]].
+    """
+    dimension = element.get_dimension(dimension or element.vdims[0])
+    dims = element.kdims+[dimension]
+    if getattr(element.interface, 'datatype', None) == 'dask':
+        import dask
+        columns = dask.compute(*(element.interface.values(element, d, compute=False)
+                                 for d in dims))
+        columns = [np.asarray(c) for c in columns]
+    else:
+        columns = [element.dimension_values(d) for d in dims]
+    values = columns[-1]
+    if not element.kdims:
+        return [(element.label,)], values, np.array([0, len(values)])
+
+    codes, uniques = [], []
+    for column in columns[:-1]:
+        dcodes, duniques = _factorize(column)
+        codes.append(dcodes)
+        uniques.append(duniques)
+    valid = np.logical_and.reduce([c >= 0 for c in codes])
+    if not valid.all():
+        codes = [c[valid] for c in codes]
+        values = values[valid]
+    shape = tuple(max(len(u), 1) for u in uniques)
+    combined = np.ravel_multi_index(codes, shape) if len(values) else np.array([], dtype=int)
+    group_ids, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    group_codes = np.argsort(order)[inverse]
+    sort_index = np.argsort(group_codes, kind='mergesort')
+    counts = np.bincount(group_codes, minlength=len(group_ids))
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    indexes = np.unravel_index(group_ids[order], shape)
+    keys = [tuple(u[i] for u, i in zip(uniques, idx)) for idx in zip(*indexes)]
+    return keys, values[sort_index], offsets
+
+
+def _lerp(a, b, t):
+    "Linear interpolation matching the numpy percentile implementation"
+    diff = b - a
+    return np.where(t >= 0.5, b - diff*(1-t), a + diff*t)
+
+
+def grouped_box_stats(values, offsets):
+    """
+    Computes box-whisker statistics for grouped values as returned by
+    grouped_values, vectorized across all groups. Non-finite values
+    are ignored and groups without any finite values are assigned
+    zeros for all statistics.
+
+    Returns arrays of the first, second and third quartiles, the
+    upper and lower whiskers per group and a boolean mask of the
+    outliers in the supplied values.
+    """
+    counts = np.diff(offsets)
+    ngroups = len(counts)
+    codes = np.repeat(np.arange(ngroups), counts)
+    finite = isfinite(values)
+    fvals, fcodes = values[finite], codes[finite]
+    order = np.lexsort((fvals, fcodes))
+    svals, scodes = fvals[order], fcodes[order]
+    n = np.bincount(fcodes, minlength=ngroups)
+    starts = np.concatenate([[0], np.cumsum(n)[:-1]]).astype(int)
+    nonempty = n > 0
+    starts, nvalid = starts[nonempty], n[nonempty]
+
+    quartiles = []
+    for q in (25, 50, 75):
+        pos = (nvalid-1)*(q/100.)
+        lo = np.floor(pos).astype(int)
+        hi = np.minimum(lo+1, nvalid-1)
+        stat = np.zeros(ngroups)
+        stat[nonempty] = _lerp(svals[starts+lo], svals[starts+hi], pos-lo)
+        quartiles.append(stat)
+    q1, q2, q3 = quartiles
+
+    iqr = q3 - q1
+    below = np.bincount(scodes, svals <= (q3 + 1.5*iqr)[scodes], ngroups)
+    above = np.bincount(scodes, svals >= (q1 - 1.5*iqr)[scodes], ngroups)
+    upper, lower = np.zeros(ngroups, values.dtype), np.zeros(ngroups, values.dtype)
+    upper[nonempty] = svals[starts+below[nonempty].astype(int)-1]
+    lower[nonempty] = svals[starts+nvalid-above[nonempty].astype(int)]
+    outliers = np.zeros(len(values), dtype=bool)
+    outliers[finite] = (fvals > upper[fcodes]) | (fvals < lower[fcodes])
+    return q1, q2, q3, upper, lower, outliers
+
+
 def rgb2hex(rgb):
     """
     Convert RGB(A) tuple to hex.
@@ -19,10 +19,267 @@ _Exprs = Stream.define('Exprs', exprs=[])
 _Colors = Stream.define('Colors', colors=[])
 
 _SelectionStreams = namedtuple(
-    'SelectionStreams', 'colors_stream exprs_stream cmap_streams alpha_streams'
+    'SelectionStreams',
+    'colors_stream exprs_stream cmap_streams alpha_streams mask_cache'
 )
 
 
+class _CrossFilterIndex(object):
+    """
+    Cross-filter index over the rows of a tabular Dataset. For each
+    filtered dimension it keeps the rows sorted by value and the
+    positions of the active range predicate in that order. Every row
+    has a counter of the predicates it fails, so moving a range only
+    touches the rows which enter or leave it rather than re-evaluating
+    all rows. Histograms of the selected rows registered with the
+    index are updated from the same delta.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.nrows = len(dataset)
+        self._fails = np.zeros(self.nrows, dtype='int32')
+        self._selected = np.ones(self.nrows, dtype=bool)
+        self._sorted = {}
+        self._ranges = {}
+        self._histograms = {}
+
+    @classmethod
+    def applies(cls, dataset, bbox):
+        """
+        Whether the dataset is an in-memory table with numeric columns
+        along each of the bbox dimensions.
+        """
+        if dataset.interface.datatype not in ('dataframe', 'array', 'dictionary'):
+            return False
+        for d in bbox:
+            dimension = dataset.get_dimension(d)
+            if dimension is None:
+                return False
+            if dataset.interface.dtype(dataset, dimension).kind not in 'iuf':
+                return False
+        return True
+
+    def _sorted_values(self, dimension):
+        if dimension not in self._sorted:
+            values = self.dataset.dimension_values(dimension)
+            order = np.argsort(values, kind='mergesort')
+            values = values[order]
+            nvalid = len(values)
+            if values.dtype.kind == 'f':
+                nvalid -= np.isnan(values).sum()
+            self._sorted[dimension] = (order, values[:nvalid])
+        return self._sorted[dimension]
+
+    def _set_range(self, dimension, bounds):
+        """
+        Moves the range predicate on the dimension, returning the rows
+        whose predicate state changed.
+        """
+        i0, i1 = self._ranges.get(dimension, (0, self.nrows))
+        order, values = self._sorted_values(dimension)
+        if bounds is None:
+            j0, j1 = 0, self.nrows
+        else:
+            j0 = np.searchsorted(values, bounds[0], side='left')
+            j1 = max(np.searchsorted(values, bounds[1], side='right'), j0)
+        if (i0, i1) == (j0, j1):
+            return np.array([], dtype=order.dtype)
+        entering = [order[j0:min(j1, i0)], order[max(j0, i1):j1]]
+        leaving = [order[i0:min(i1, j0)], order[max(i0, j1):i1]]
+        entering, leaving = np.concatenate(entering), np.concatenate(leaving)
+        self._fails[entering] -= 1
+        self._fails[leaving] += 1
+        if bounds is None:
+            self._ranges.pop(dimension, None)
+        else:
+            self._ranges[dimension] = (j0, j1)
+        return np.concatenate([entering, leaving])
+
+    def update(self, bbox):
+        """
+        Applies the range predicates in the bbox dictionary, clearing
+        the predicates on dimensions not in the bbox, and returns the
+        boolean mask of selected rows.
+        """
+        changes = [self._set_range(d, None) for d in list(self._ranges)
+                   if d not in bbox]
+        changes += [self._set_range(d, bounds) for d, bounds in bbox.items()]
+        changed = np.unique(np.concatenate(changes)) if changes else []
+        if len(changed):
+            was_selected = self._selected[changed]
+            now_selected = self._fails[changed] == 0
+            self._selected[changed] = now_selected
+            flipped = was_selected != now_selected
+            rows, added = changed[flipped], now_selected[flipped]
+            for (bins, counts) in self._histograms.values():
+                nbins = len(counts)
+                counts += np.bincount(bins[rows[added]], minlength=nbins+1)[:nbins]
+                counts -= np.bincount(bins[rows[~added]], minlength=nbins+1)[:nbins]
+        return self._selected
+
+    def histogram(self, dimension, edges):
+        """
+        Returns the counts of the selected rows in the bins defined by
+        the edges, matching numpy.histogram. The bin of each row is
+        computed once and the counts are subsequently maintained as
+        the selection changes.
+        """
+        edges = np.asarray(edges)
+        key = (dimension, edges.tobytes())
+        if key not in self._histograms:
+            values = self.dataset.dimension_values(dimension)
+            nbins = len(edges) - 1
+            bins = np.searchsorted(edges, values, side='right') - 1
+            bins[values == edges[-1]] = nbins - 1
+            bins[(bins < 0) | (bins >= nbins) | ~np.isfinite(values)] = nbins
+            counts = np.bincount(bins[self._selected], minlength=nbins+1)[:nbins]
+            self._histograms[key] = (bins, counts)
+        return self._histograms[key][1].copy()
+
+
+def _range_expr(bbox):
+    """
+    Returns the selection expression for the ranges in the bbox
+    dictionary in the form generated by the selection streams of
+    the elements.
+    """
+    from .util.transform import dim
+    expr = None
+    for d, (lo, hi) in bbox.items():
+        lower = dim(d) >= lo
+        expr = lower if expr is None else expr & lower
+        expr = expr & (dim(d) <= hi)
+    return expr
+
+
+class _SelectionMaskCache(object):
+    """
+    Caches the boolean mask and the selected Dataset obtained by
+    applying a selection expression to a base Dataset. All elements
+    and selection layers linked by a link_selections instance share
+    one cache, so a selection expression is evaluated only once per
+    base dataset instead of once per layer and linked view. The cache
+    only holds entries for the most recent expression.
+    """
+
+    def __init__(self):
+        self._expr = None
+        self._bbox = None
+        self._entries = {}
+        self._indexes = {}
+        self._used = set()
+
+    def set_bbox(self, selection_expr, bbox):
+        """
+        Declares the ranges described by a selection expression. If the
+        expression is exactly the conjunction of the bbox ranges, masks
+        for tabular datasets are computed incrementally by a
+        _CrossFilterIndex.
+        """
+        if bbox and repr(selection_expr) == repr(_range_expr(bbox)):
+            self._bbox = (selection_expr, bbox)
+        else:
+            self._bbox = None
+
+    def _reset(self, selection_expr):
+        self._expr = selection_expr
+        self._entries = {}
+        self._indexes = {k: v for k, v in self._indexes.items() if k in self._used}
+        self._used = set()
+
+    def _crossfilter(self, dataset, selection_expr):
+        """
+        Returns the _CrossFilterIndex for the dataset and bbox if the
+        selection_expr was declared with set_bbox and the index
+        applies to the dataset.
+        """
+        if self._bbox is None or self._bbox[0] is not selection_expr:
+            return None
+        bbox = self._bbox[1]
+        if not _CrossFilterIndex.applies(dataset, bbox):
+            return None
+        key = (id(dataset.data), tuple(dataset.dimensions(label='name')))
+        cached = self._indexes.get(key)
+        if cached is None or cached[0] is not dataset.data:
+            cached = (dataset.data, _CrossFilterIndex(dataset))
+            self._indexes[key] = cached
+        self._used.add(key)
+        return cached[1], bbox
+
+    def _entry(self, dataset, selection_expr):
+        if selection_expr is not self._expr:
+            self._reset(selection_expr)
+        key = (id(dataset.data), tuple(dataset.dimensions(label='name')))
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not dataset.data:
+            crossfilter = self._crossfilter(dataset, selection_expr)
+            if crossfilter is None:
+                mask = selection_expr.apply(dataset, compute=False, keep_index=True)
+            else:
+                index, bbox = crossfilter
+                mask = index.update(bbox).copy()
+            entry = [dataset.data, mask, None]
+            self._entries[key] = entry
+        return entry
+
+    def histogram(self, element, selection_expr):
+        """
+        Returns the selected subset of a Histogram computed directly
+        from the counts maintained by the _CrossFilterIndex of its
+        dataset, or None if the histogram cannot be derived this way.
+        """
+        from .core.accessors import Apply
+        from .element import Histogram
+        from .operation.element import factory, histogram, method
+        if not isinstance(element, Histogram) or not element.pipeline.operations:
+            return None
+        ops = element.pipeline.operations
+        op, kwargs = ops[-1], {}
+        # Operations applied via .apply are wrapped in a method operation
+        if (isinstance(op, method) and op.input_type is Apply and
+            op.method_name == '__call__' and op.args):
+            op, kwargs = op.args[0], op.kwargs
+        if not (isinstance(op, histogram) or
+                (isinstance(op, type) and issubclass(op, histogram))):
+            return None
+        params = dict(op.param.get_param_values())
+        params.update(kwargs)
+        if (params['normed'] or params['cumulative'] or params['weight_dimension'] or
+            params['nonzero'] or params['groupby'] or
+            not all(isinstance(o, factory) for o in ops[:-1])):
+            return None
+        if selection_expr is not self._expr:
+            self._reset(selection_expr)
+        dataset = element.dataset
+        crossfilter = self._crossfilter(dataset, selection_expr)
+        if crossfilter is None:
+            return None
+        index, bbox = crossfilter
+        dimension = element.kdims[0].name
+        if not _CrossFilterIndex.applies(dataset, {dimension: None}):
+            return None
+        index.update(bbox)
+        return element.clone((element.edges, index.histogram(dimension, element.edges)))
+
+    def mask(self, dataset, selection_expr):
+        """
+        Returns the boolean mask of the selection_expr applied to the
+        dataset, evaluating it only if it has not been computed yet.
+        """
+        return self._entry(dataset, selection_expr)[1]
+
+    def select(self, dataset, selection_expr):
+        """
+        Returns the subset of the dataset selected by the
+        selection_expr, reusing the cached mask and selection.
+        """
+        entry = self._entry(dataset, selection_expr)
+        if entry[2] is None:
+            entry[2] = dataset.select(selection_mask=entry[1])
+        return entry[2]
+
+
 class _base_link_selections(param.ParameterizedFunction):
     """
     Baseclass for linked selection functions.
@@ -169,6 +426,14 @@ class _base_link_selections(param.ParameterizedFunction):
 
 
 class link_selections(_base_link_selections):
+    crossfilter = param.Boolean(default=False, doc="""
+        Whether to index tabular datasets by the dimensions of box
+        selections, so that moving a box only updates the rows which
+        enter or leave it and histograms of the selection are updated
+        from precomputed counts. Building the index sorts each selected
+        dimension once, which pays off for repeated brushing over large
+        in-memory datasets.""")
+
     selection_expr = param.Parameter(default=None)
     unselected_color = param.Color(default="#99a6b2")  # LightSlateGray - 65%
     selected_color = param.Color(default="#DC143C")  # Crimson
@@ -225,6 +490,7 @@ class link_selections(_base_link_selections):
             exprs_stream=exprs_stream,
             alpha_streams=alpha_streams,
             cmap_streams=cmap_streams,
+            mask_cache=_SelectionMaskCache(),
         )
 
     @property
@@ -250,6 +516,9 @@ class link_selections(_base_link_selections):
 
     def _expr_stream_updated(self, hvobj, selection_expr, bbox):
         if selection_expr:
+            self._selection_streams.mask_cache.set_bbox(
+                selection_expr, bbox if self.crossfilter else None
+            )
             self.selection_expr = selection_expr
 
 
@@ -292,7 +561,9 @@ class OverlaySelectionDisplay(SelectionDisplay):
             return Overlay(items=[])
 
         for layer_number in range(num_layers):
-            build_layer = self._build_layer_callback(layer_number)
+            build_layer = self._build_layer_callback(
+                layer_number, selection_streams.mask_cache
+            )
             sel_streams = [selection_streams.colors_stream,
                            selection_streams.exprs_stream]
 
@@ -345,10 +616,11 @@ class OverlaySelectionDisplay(SelectionDisplay):
             result *= layer
         return result
 
-    def _build_layer_callback(self, layer_number):
+    def _build_layer_callback(self, layer_number, mask_cache=None):
         def _build_layer(element, colors, exprs, **_):
             layer_element = self._build_element_layer(
-                element, colors[layer_number], exprs[layer_number]
+                element, colors[layer_number], exprs[layer_number],
+                mask_cache
             )
 
             return layer_element
@@ -356,18 +628,27 @@ class OverlaySelectionDisplay(SelectionDisplay):
         return _build_layer
 
     def _build_element_layer(
-            self, element, layer_color, selection_expr=True
+            self, element, layer_color, selection_expr=True, mask_cache=None
     ):
         raise NotImplementedError()
 
     @staticmethod
-    def _select(element, selection_expr):
+    def _select(element, selection_expr, mask_cache=None):
         from .util.transform import dim
         if isinstance(selection_expr, dim):
             try:
-                element = element.pipeline(
-                    element.dataset.select(selection_expr=selection_expr)
-                )
+                histogram = None
+                if mask_cache is None:
+                    selected = element.dataset.select(
+                        selection_expr=selection_expr
+                    )
+                else:
+                    histogram = mask_cache.histogram(element, selection_expr)
+                    if histogram is None:
+                        selected = mask_cache.select(
+                            element.dataset, selection_expr
+                        )
+                element = element.pipeline(selected) if histogram is None else histogram
             except Exception as e:
                 print(e)
                 raise
@@ -386,6 +667,8 @@ class ColorListSelectionDisplay(SelectionDisplay):
         self.color_prop = color_prop
 
     def build_selection(self, selection_streams, hvobj, operations):
+        mask_cache = selection_streams.mask_cache
+
         def _build_selection(el, colors, exprs, **_):
 
             selection_exprs = exprs[1:]
@@ -407,7 +690,11 @@ class ColorListSelectionDisplay(SelectionDisplay):
                         selection_exprs,
                         selected_colors
                 ):
-                    color_inds[expr.apply(el)] = i
+                    if mask_cache is None:
+                        mask = expr.apply(el)
+                    else:
+                        mask = np.asarray(mask_cache.mask(el, expr))
+                    color_inds[mask] = i
 
                 colors = clrs[color_inds]
 
@@ -837,11 +837,33 @@ class LinkedStream(Stream):
     A LinkedStream indicates is automatically linked to plot interactions
     on a backend via a Renderer. Not all backends may support dynamically
     supplying stream data.
-    """
 
-    def __init__(self, linked=True, **params):
+    The policy and timeout control how frequently plot interactions
+    are allowed to trigger the stream. The 'throttle' policy processes
+    the latest event at most once every timeout milliseconds, the
+    'debounce' policy waits until no events have been received for
+    the timeout and the 'adaptive' policy throttles at the timeout
+    or the measured latency of the downstream callbacks, whichever is
+    larger. If no timeout is supplied the plotting backend default is
+    used. Policies other than 'throttle' are only supported by
+    server-side callbacks.
+    """
+
+    policies = ['throttle', 'debounce', 'adaptive']
+
+    def __init__(self, linked=True, policy='throttle', timeout=None, **params):
+        if policy not in self.policies:
+            raise ValueError('%s policy must be one of %s, not %r.' %
+                             (type(self).__name__, self.policies, policy))
+        self.policy = policy
+        self.timeout = timeout
         super(LinkedStream, self).__init__(linked=linked, **params)
 
+    def rename(self, **mapping):
+        stream = super(LinkedStream, self).rename(**mapping)
+        stream.policy, stream.timeout = self.policy, self.timeout
+        return stream
+
 
 class PointerX(LinkedStream):
     """
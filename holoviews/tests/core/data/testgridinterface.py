@@ -14,9 +14,28 @@ try:
 except ImportError:
     da = None
 
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 pd_skip = skipIf(pd is None, "pandas is not available")
 
 
+def allocated_bytes(fn, *args, **kwargs):
+    """
+    Returns the result of calling fn and the peak number of bytes
+    allocated during the call.
+    """
+    tracemalloc.start()
+    try:
+        result = fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
 from .base import (
     GriddedInterfaceTests, InterfaceTests, HomogeneousColumnTests, DatatypeContext
 )
@@ -275,6 +294,50 @@ class GridInterfaceTests(BaseGridInterfaceTests):
 
     __test__ = True
 
+    def test_dataset_groupby_slices_views(self):
+        array = np.random.rand(4, 5, 3)
+        dataset = Dataset((range(3), range(5), range(4), array), ['x', 'y', 't'], 'z')
+        group = dataset.groupby('t')[2]
+        self.assertTrue(np.shares_memory(group.data['z'], array))
+        self.assertEqual(group.dimension_values('z', flat=False), array[2])
+
+    def test_dataset_canonical_values_inverted_coords_view(self):
+        array = np.random.rand(20, 30)
+        dataset = Dataset((np.arange(30)[::-1], np.arange(20)[::-1], array), ['x', 'y'], 'z')
+        values = dataset.dimension_values('z', flat=False)
+        self.assertTrue(np.shares_memory(values, array))
+        self.assertEqual(values, array[::-1, ::-1])
+
+    def test_dataset_canonical_values_1d_view(self):
+        array = np.random.rand(10)
+        dataset = Dataset((np.arange(10)[::-1], array), 'x', 'y')
+        values = dataset.dimension_values('y', flat=False)
+        self.assertTrue(np.shares_memory(values, array))
+        self.assertEqual(values, array[::-1])
+
+    def test_dataset_ordered_coords_inverted_view(self):
+        xs = np.arange(10)[::-1]
+        dataset = Dataset((xs, np.random.rand(10)), 'x', 'y')
+        coords = dataset.dimension_values('x', expanded=False)
+        self.assertTrue(np.shares_memory(coords, xs))
+        self.assertEqual(coords, np.arange(10))
+
+    def test_dataset_grid_orientation_cached(self):
+        dataset = Dataset((range(3), range(2)[::-1], np.random.rand(2, 3)), ['x', 'y'], 'z')
+        dataset.dimension_values('z', flat=False)
+        data, orientation = dataset._grid_orientation
+        self.assertIs(data, dataset.data)
+        self.assertEqual(orientation, {'x': False, 'y': True})
+
+    @skipIf(tracemalloc is None, "tracemalloc is not available")
+    def test_dataset_canonical_values_inverted_coords_no_allocation(self):
+        array = np.random.rand(500, 400)
+        dataset = Dataset((np.arange(400)[::-1], np.arange(500)[::-1], array), ['x', 'y'], 'z')
+        dataset.dimension_values('z', flat=False)
+        values, allocated = allocated_bytes(dataset.dimension_values, 'z', flat=False)
+        self.assertTrue(np.shares_memory(values, array))
+        self.assertLess(allocated, array.nbytes // 100)
+
 
 class DaskGridInterfaceTests(GridInterfaceTests):
 
@@ -309,6 +372,28 @@ class DaskGridInterfaceTests(GridInterfaceTests):
             (self.grid_xs[::-1], self.grid_ys[::-1], self.grid_zs), ['x', 'y'], ['z']
         )
 
+    def test_dataset_reduce_dask_lazy(self):
+        reduced = self.dataset_grid.reduce('x', np.nanmean)
+        self.assertIsInstance(reduced.data['z'], da.Array)
+        self.assertEqual(reduced.dimension_values('z'), np.array([0.5, 2.5, 4.5]))
+
+    def test_dataset_range_dask_vdims_fused(self):
+        zs2 = self.grid_zs * 2
+        dataset = self.element((self.grid_xs, self.grid_ys, self.grid_zs, zs2),
+                               ['x', 'y'], ['z', 'z2'])
+        self.assertEqual(dataset.range('z'), (0, 5))
+        data, ranges = dataset._dask_ranges
+        self.assertIs(data, dataset.data)
+        self.assertEqual(ranges, {'z': (0, 5), 'z2': (0, 10)})
+        self.assertEqual(dataset.range('z2'), (0, 10))
+
+    def test_dataset_persist_dask(self):
+        persisted = self.dataset_grid.persist()
+        self.assertIsInstance(persisted.data['z'], da.Array)
+        self.assertIsNot(persisted.data['z'], self.grid_zs)
+        self.assertEqual(persisted.dimension_values('z', flat=False),
+                         self.grid_zs.compute())
+
     def test_dataset_array_hm(self):
         self.assertEqual(self.dataset_hm.array(),
                          np.column_stack([self.xs, self.y_ints.compute()]))
@@ -11,6 +11,7 @@ import numpy as np
 from holoviews.core.data import Dataset, MultiInterface
 from holoviews.element import Path, Points, Polygons
 from holoviews.element.comparison import ComparisonTestCase
+from holoviews.util.transform import dim
 from param import get_logger
 
 try:
@@ -80,6 +81,81 @@ class GeomTests(ComparisonTestCase):
         self.assertEqual(mds, Path([dict(arrays[i], A=i) for i in range(2)], ['x', 'y'],
                                    'A', datatype=['multitabular']))
 
+    def test_spatial_select_bounds(self):
+        arrays = [np.array([(0, 0), (1, 1)]), np.array([(5, 5), (6, 6)]),
+                  np.array([(10, 0), (11, 1)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        self.assertIs(mds.interface, self.interface)
+        selected = mds.spatial_select(bounds=(0.5, 0.5, 5.5, 5.5))
+        self.assertEqual(selected.split(datatype='array'), arrays[:2])
+
+    def test_spatial_select_geometry(self):
+        arrays = [np.array([(0, 0), (1, 1)]), np.array([(5, 5), (6, 6)]),
+                  np.array([(10, 0), (11, 1)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        self.assertIs(mds.interface, self.interface)
+        lasso = np.array([(5, 5.2), (6.5, 5.2), (6.5, 6.2), (5, 6.2)])
+        selected = mds.spatial_select(geometry=lasso)
+        self.assertEqual(selected.split(datatype='array'), arrays[1:2])
+
+    def test_spatial_select_bounds_exact(self):
+        arrays = [np.array([(0, 0), (10, 10)]), np.array([(0, 2), (10, 2)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        self.assertIs(mds.interface, self.interface)
+        selected = mds.spatial_select(bounds=(6, 0, 9, 3))
+        self.assertEqual(selected.split(datatype='array'), arrays[1:])
+
+    def test_spatial_select_geometry_crossing_edge(self):
+        arrays = [np.array([(0, 0), (10, 0)]), np.array([(0, 5), (10, 5)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        self.assertIs(mds.interface, self.interface)
+        lasso = np.array([(4, -1), (6, -1), (5, 1)])
+        selected = mds.spatial_select(geometry=lasso)
+        self.assertEqual(selected.split(datatype='array'), arrays[:1])
+
+    def test_spatial_select_geometry_inside_polygon(self):
+        xs, ys = [0, 10, 10, 0], [0, 0, 10, 10]
+        hole = np.array([(3, 3), (7, 3), (7, 7), (3, 7)])
+        poly = Polygons([{'x': xs, 'y': ys, 'holes': [[hole]], 'z': 1},
+                         {'x': [20, 30, 30], 'y': [0, 0, 10], 'z': 2}],
+                        vdims='z', datatype=[self.datatype])
+        self.assertIs(poly.interface, self.interface)
+        lasso = np.array([(1, 1), (2, 1), (1.5, 2)])
+        selected = poly.spatial_select(geometry=lasso)
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([1]))
+        in_hole = np.array([(4, 4), (6, 4), (5, 6)])
+        self.assertEqual(len(poly.spatial_select(geometry=in_hole)), 0)
+
+    def test_spatial_index_cached(self):
+        arrays = [np.array([(0, 0), (1, 1)]), np.array([(5, 5), (6, 6)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        index = mds.interface.spatial_index(mds)
+        self.assertIs(mds.interface.spatial_index(mds), index)
+
+    def test_spatial_select_expr(self):
+        arrays = [np.array([(0, 0), (1, 1)]), np.array([(5, 5), (6, 6)]),
+                  np.array([(10, 0), (11, 1)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        self.assertIs(mds.interface, self.interface)
+        expr = dim('x').spatial_select(dim('y'), bounds=(0.5, 0.5, 5.5, 5.5))
+        self.assertEqual(expr.apply(mds), np.array([True, True, False]))
+        selected = mds.select(selection_expr=expr)
+        self.assertEqual(selected.split(datatype='array'), arrays[:2])
+
+    def test_spatial_select_expr_swapped_dims(self):
+        arrays = [np.array([(0, 0), (1, 1)]), np.array([(0, 5), (1, 6)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        expr = dim('y').spatial_select(dim('x'), bounds=(4, 0, 7, 2))
+        self.assertEqual(expr.apply(mds), np.array([False, True]))
+
+    def test_points_select_range(self):
+        points = Points([{'x': 0, 'y': 0}, {'x': 5, 'y': 5}, {'x': 9, 'y': 1}],
+                        ['x', 'y'], datatype=[self.datatype])
+        self.assertIs(points.interface, self.interface)
+        selected = points.select(x=(0.5, 5.5))
+        self.assertEqual(len(selected), 1)
+        self.assertEqual(selected.dimension_values('x'), np.array([5]))
+
     def test_array_length(self):
         arrays = [np.column_stack([np.arange(i, i+2), np.arange(i, i+2)]) for i in range(2)]
         mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
@@ -524,3 +600,11 @@ class MultiDictInterfaceTest(MultiBaseInterfaceTest):
     subtype = 'dictionary'
 
     __test__ = True
+
+    def test_spatial_index_rebuilt_on_replaced_geometry(self):
+        arrays = [np.array([(0, 0), (1, 1)]), np.array([(5, 5), (6, 6)])]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=[self.datatype])
+        index = mds.interface.spatial_index(mds)
+        mds.data[1] = {'x': np.array([20, 21]), 'y': np.array([20, 21])}
+        self.assertIsNot(mds.interface.spatial_index(mds), index)
+        self.assertEqual(len(mds.spatial_select(bounds=(4, 4, 7, 7))), 0)
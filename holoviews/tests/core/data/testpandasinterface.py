@@ -1,3 +1,4 @@
+import weakref
 from unittest import SkipTest
 
 import numpy as np
@@ -165,6 +166,24 @@ class BasePandasInterfaceTests(HeterogeneousColumnTests, InterfaceTests):
         ds = Dataset(df.groupby(['x', 'y']).mean(), [('x', 'X'), ('y', 'Y')])
         self.assertEqual(ds, Dataset(df, [('x', 'X'), ('y', 'Y')]))
 
+    def test_dataset_categorical_dimension_values_unique(self):
+        df = pd.DataFrame({'x': pd.Categorical(['b', 'a', 'b', 'c']), 'y': [1, 2, 3, 4]})
+        ds = Dataset(df, 'x', 'y')
+        self.assertEqual(ds.dimension_values('x', expanded=False),
+                         np.array(['b', 'a', 'c'], dtype=object))
+
+    def test_dataset_dimension_values_unique_cache_invalidated(self):
+        df = pd.DataFrame({'x': pd.Categorical(['b', 'a', 'b']), 'y': [1, 2, 3]})
+        ds = Dataset(df, 'x', 'y')
+        values = ds.dimension_values('x', expanded=False)
+        values[0] = 'z'
+        self.assertEqual(ds.dimension_values('x', expanded=False),
+                         np.array(['b', 'a'], dtype=object))
+        new_df = pd.DataFrame({'x': pd.Categorical(['c', 'c', 'd']), 'y': [1, 2, 3]})
+        ds.data = ds.clone(new_df).data
+        self.assertEqual(ds.dimension_values('x', expanded=False),
+                         np.array(['c', 'd'], dtype=object))
+
 
 
 class PandasInterfaceTests(BasePandasInterfaceTests):
@@ -173,3 +192,27 @@ class PandasInterfaceTests(BasePandasInterfaceTests):
     data_type = pd.DataFrame
 
     __test__ = True
+
+    def test_dataset_dimension_values_unique_cache_column_assignment(self):
+        df = pd.DataFrame({'x': pd.Categorical(['b', 'a', 'b']), 'y': [1, 2, 3]})
+        ds = Dataset(df, 'x', 'y')
+        ds.dimension_values('x', expanded=False)
+        df['x'] = pd.Categorical(['b', 'b', 'b'])
+        self.assertEqual(ds.dimension_values('x', expanded=False),
+                         np.array(['b'], dtype=object))
+
+    def test_dataset_dimension_values_unique_cache_token_identity(self):
+        df = pd.DataFrame({'x': pd.Categorical(['b', 'a', 'b']), 'y': [1, 2, 3]})
+        ds = Dataset(df, 'x', 'y')
+        token = ds.interface.unique_token(ds, 'x')
+        self.assertIs(token[0], df['x'].values)
+        self.assertEqual(ds.interface.unique_token(ds, 'y'), None)
+
+    def test_dataset_dimension_values_unique_cache_releases_data(self):
+        df = pd.DataFrame({'x': pd.Categorical(['b', 'a', 'b']), 'y': [1, 2, 3]})
+        ds = Dataset(df, 'x', 'y')
+        ds.dimension_values('x', expanded=False)
+        ref = weakref.ref(ds.data)
+        del df
+        ds.data = ds.data.copy()
+        self.assertIs(ref(), None)
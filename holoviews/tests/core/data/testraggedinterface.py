@@ -0,0 +1,143 @@
+"""
+Tests for the RaggedInterface.
+"""
+
+import numpy as np
+
+from holoviews.core.data import Dataset, RaggedData, RaggedInterface
+from holoviews.element import Path, Polygons
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.util.transform import dim
+
+
+class RaggedInterfaceTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.geoms = [{'x': np.array([0., 1, 2]), 'y': np.array([0., 1, 0]), 'z': 1},
+                      {'x': np.array([5., 6]), 'y': np.array([1., 1]), 'z': 2},
+                      {'x': np.array([7.]), 'y': np.array([8.]), 'z': 3}]
+
+    def test_ragged_data_packing(self):
+        data = RaggedData.from_geometries(self.geoms, ['x', 'y', 'z'])
+        self.assertEqual(data.offsets, np.array([0, 3, 5, 6]))
+        self.assertEqual(data.columns['x'], np.array([0., 1, 2, 5, 6, 7]))
+        self.assertEqual(data.scalars['z'], np.array([1, 2, 3]))
+
+    def test_ragged_data_take(self):
+        data = RaggedData.from_geometries(self.geoms, ['x', 'y', 'z']).take([2, 0])
+        self.assertEqual(data.offsets, np.array([0, 1, 4]))
+        self.assertEqual(data.columns['x'], np.array([7., 0, 1, 2]))
+        self.assertEqual(data.scalars['z'], np.array([3, 1]))
+
+    def test_ragged_dataset(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        self.assertIs(path.interface, RaggedInterface)
+        self.assertEqual(len(path), 3)
+
+    def test_ragged_values_expanded(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        self.assertEqual(path.dimension_values('x'),
+                         np.array([0., 1, 2, np.NaN, 5, 6, np.NaN, 7]))
+        self.assertEqual(path.dimension_values('z'),
+                         np.array([1., 1, 1, np.NaN, 2, 2, np.NaN, 3]))
+
+    def test_ragged_values_not_expanded(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        self.assertEqual(path.dimension_values('z', expanded=False), np.array([1, 2, 3]))
+
+    def test_ragged_polygon_values_closed(self):
+        polys = Polygons(self.geoms[:2], vdims='z', datatype=['ragged'])
+        self.assertEqual(polys.dimension_values('x'),
+                         np.array([0., 1, 2, 0, np.NaN, 5, 6, 5]))
+
+    def test_ragged_range(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        self.assertEqual(path.range('x'), (0., 7.))
+        self.assertEqual(path.range('z'), (1, 3))
+
+    def test_ragged_select_vertices(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        selected = path.select(x=(0.5, 5.5))
+        self.assertIs(selected.interface, RaggedInterface)
+        self.assertEqual(len(selected), 2)
+        self.assertEqual(selected.data.offsets, np.array([0, 2, 3]))
+        self.assertEqual(selected.data.columns['x'], np.array([1., 2, 5]))
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([1, 2]))
+
+    def test_ragged_select_vertices_x_and_y(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        selected = path.select(x=(0.5, 6.5), y=(0.5, 1.5))
+        self.assertEqual(selected.data.offsets, np.array([0, 1, 3]))
+        self.assertEqual(selected.dimension_values('x'), np.array([1., np.NaN, 5, 6]))
+
+    def test_ragged_select_scalar(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        selected = path.select(z=[1, 3])
+        self.assertEqual(selected.data.offsets, np.array([0, 3, 4]))
+
+    def test_ragged_iloc(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        self.assertEqual(path.iloc[1:].dimension_values('x'), np.array([5., 6, np.NaN, 7]))
+
+    def test_ragged_split_columns(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        for geom, split in zip(self.geoms, path.split(datatype='columns')):
+            self.assertEqual(dict(split), dict(geom, geom_type='Line'))
+
+    def test_ragged_split_array(self):
+        path = Path(self.geoms, datatype=['ragged'])
+        for geom, array in zip(self.geoms, path.split(datatype='array')):
+            self.assertEqual(array, np.column_stack([geom['x'], geom['y']]))
+
+    def test_ragged_groupby(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        grouped = path.groupby('z')
+        self.assertEqual(grouped.keys(), [1, 2, 3])
+        self.assertEqual(grouped[2].dimension_values('x'), np.array([5., 6]))
+
+    def test_ragged_cast_to_dataset(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        ds = Dataset(path.dframe(), kdims=['x', 'y'], vdims='z')
+        self.assertEqual(len(ds), 8)
+
+    def test_ragged_spatial_select_bounds(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        selected = path.spatial_select(bounds=(4, 0, 10, 10))
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([2, 3]))
+
+    def test_ragged_spatial_select_geometry(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        lasso = np.array([(0.5, 0.5), (1.5, 0.5), (1.5, 1.5), (0.5, 1.5)])
+        selected = path.spatial_select(geometry=lasso)
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([1]))
+
+    def test_ragged_spatial_select_bounds_exact(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        selected = path.spatial_select(bounds=(1.2, 0.9, 1.8, 2))
+        self.assertEqual(len(selected), 0)
+        selected = path.spatial_select(bounds=(5.5, 0, 5.8, 2))
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([2]))
+
+    def test_ragged_spatial_select_geometry_inside_polygon(self):
+        poly = Polygons(self.geoms[:1], vdims='z', datatype=['ragged'])
+        lasso = np.array([(0.9, 0.2), (1.1, 0.2), (1, 0.4)])
+        selected = poly.spatial_select(geometry=lasso)
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([1]))
+
+    def test_ragged_spatial_select_expr(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        expr = dim('x').spatial_select(dim('y'), bounds=(4, 0, 10, 10))
+        selected = path.select(selection_expr=expr)
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([2, 3]))
+
+    def test_ragged_spatial_index_rebuilt_on_new_offsets(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        index = path.interface.spatial_index(path)
+        path.data.offsets = path.data.offsets.copy()
+        self.assertIsNot(path.interface.spatial_index(path), index)
+
+    def test_ragged_spatial_index_shared_by_clones(self):
+        path = Path(self.geoms, vdims='z', datatype=['ragged'])
+        index = path.interface.spatial_index(path)
+        clone = path.clone()
+        self.assertIs(clone.interface.spatial_index(clone), index)
@@ -284,6 +284,17 @@ class DaskXArrayInterfaceTest(XArrayInterfaceTests):
                                              dask_zs), kdims=['x', 'y'],
                                             vdims=['z'])
 
+    def test_xarray_dataset_groupby_multiple_dims_lazy(self):
+        import dask.array
+        array = np.random.rand(2, 3, 4, 5)
+        zs = dask.array.from_array(array, 2)
+        xrarr = xr.DataArray(zs, coords={'t': [0, 1], 'l': [0, 1, 2], 'y': range(4), 'x': range(5)},
+                             dims=['t', 'l', 'y', 'x'])
+        ds = Dataset(xr.Dataset({'v': xrarr}), kdims=['x', 'y', 'l', 't'], vdims=['v'])
+        group = ds.groupby(['t', 'l'])[1, 2]
+        self.assertIsInstance(group.data.v.data, dask.array.Array)
+        self.assertEqual(group.dimension_values('v', flat=False), array[1, 2])
+
     def test_xarray_dataset_with_scalar_dim_canonicalize(self):
         import dask.array
         xs = [0, 1]
@@ -297,6 +308,24 @@ class DaskXArrayInterfaceTest(XArrayInterfaceTests):
         expected = np.array([[0, 1], [2, 3], [4, 5]])
         self.assertEqual(canonical, expected)
 
+    def test_xarray_dataset_reduce_dask_lazy(self):
+        import dask.array
+        reduced = self.dataset_grid.reduce('x', np.nanmean)
+        self.assertIsInstance(reduced.data.z.data, dask.array.Array)
+        self.assertEqual(reduced.dimension_values('z'), np.array([0.5, 2.5, 4.5]))
+
+    def test_xarray_dataset_range_dask_cached(self):
+        self.assertEqual(self.dataset_grid.range('z'), (0, 5))
+        data, ranges = self.dataset_grid._dask_ranges
+        self.assertIs(data, self.dataset_grid.data)
+        self.assertEqual(ranges, {'z': (0, 5)})
+
+    def test_xarray_dataset_persist_dask(self):
+        import dask.array
+        persisted = self.dataset_grid.persist()
+        self.assertIsInstance(persisted.data.z.data, dask.array.Array)
+        self.assertEqual(persisted.dimension_values('z', flat=False), self.grid_zs)
+
 
 
 class ImageElement_XArrayInterfaceTests(BaseImageElementInterfaceTests):
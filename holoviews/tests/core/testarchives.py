@@ -124,3 +124,35 @@ class TestFileArchive(ComparisonTestCase):
             raise AssertionError("No file %r created on export." % fname)
         self.assertEqual(json.load(open(fname, 'r')), data)
         self.assertEqual(archive.listing(), [])
+
+    def test_filearchive_batch_image_pickle_zip(self):
+        export_name = 'archive_image'
+        filenames = ['Group1-Im1.hvz', 'Group2-Im2.hvz']
+        archive = FileArchive(export_name=export_name, batch=True,
+                              pack=True, archive_format='zip')
+        archive.add(self.image1)
+        archive.add(self.image2)
+        self.assertEqual(archive.listing(), [])
+        archive.export()
+        if not os.path.isfile(export_name+'.zip'):
+            raise AssertionError("No zip file %r created on export." % export_name)
+
+        namelist = ['archive_image/%s' % f for f in filenames]
+        with zipfile.ZipFile(export_name+'.zip', 'r') as f:
+            self.assertEqual(sorted(namelist), sorted(f.namelist()))
+        self.assertEqual(archive.listing(), [])
+
+    def test_filearchive_batch_deduplicates_render(self):
+        export_name = 'archive_image_test_batch'
+        calls = []
+        def exporter(obj):
+            calls.append(obj)
+            return Serializer(obj)
+        archive = FileArchive(export_name=export_name, exporters=[exporter],
+                              batch=True, executor='thread', pack=False,
+                              flush_archive=False)
+        archive.add(self.image1)
+        archive.add(self.image1)
+        archive.export()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(archive.listing(), ['Group1-Im1.pkl', 'Group1-Im1-1.pkl'])
@@ -1,9 +1,10 @@
 from collections import OrderedDict
+from functools import partial
 
 from holoviews.core import Dimension
 from holoviews.core.ndmapping import MultiDimensionalMapping, NdMapping
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews import HoloMap, Dataset
+from holoviews import HoloMap, LazyHoloMap, Dataset
 import numpy as np
 
 class DimensionTest(ComparisonTestCase):
@@ -120,6 +121,31 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
         self.assertEqual(ndmap[:, 0.0:3.0].keys(), [(1, 2.0)])
 
+    def test_ndmapping_slice_list_values(self):
+        ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
+        self.assertEqual(ndmap[[5], :].keys(), [(5, 3.0)])
+
+    def test_ndmapping_slice_mixed_type_keys(self):
+        ndmap = NdMapping([(('A', 1), 'a'), ((0, 2), 'b')], kdims=['x', 'y'])
+        self.assertEqual(ndmap[:, 2:].keys(), [(0, 2)])
+
+    def test_ndmapping_slice_after_setitem(self):
+        ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
+        self.assertEqual(ndmap[1:].keys(), [(1, 2.0), (5, 3.0)])
+        ndmap[(3, 1.0)] = 'c'
+        self.assertEqual(ndmap[1:].keys(), [(1, 2.0), (3, 1.0), (5, 3.0)])
+
+    def test_idxmapping_sorted_numeric_keys(self):
+        data = [((2, 0.5), 'a'), ((1, 3.0), 'b'), ((2, 0.1), 'c'), ((1, 1.0), 'd')]
+        ndmap = MultiDimensionalMapping(data, kdims=['x', 'y'])
+        self.assertEqual(ndmap.keys(), [(1, 1.0), (1, 3.0), (2, 0.1), (2, 0.5)])
+        self.assertEqual(ndmap.dimension_values('y'), np.array([1.0, 3.0, 0.1, 0.5]))
+
+    def test_idxmapping_sort_no_kdims(self):
+        ndmap = MultiDimensionalMapping([((), 'a')], kdims=[])
+        self.assertEqual(ndmap.keys(), [()])
+        self.assertEqual(ndmap.values(), ['a'])
+
     def test_idxmapping_unsorted(self):
         data = [('B', 1), ('C', 2), ('A', 3)]
         ndmap = MultiDimensionalMapping(data, sort=False)
@@ -249,3 +275,75 @@ class HoloMapTest(ComparisonTestCase):
         hists = hmap.hist(dimension=['x', 'y'])
         self.assertEqual(hists['right'].last.kdims, ['y'])
         self.assertEqual(hists['top'].last.kdims, ['x'])
+
+
+class LazyHoloMapTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.xs = np.arange(10)
+        self.evaluated = []
+
+    def frame(self, i):
+        self.evaluated.append(i)
+        return Dataset({'x': self.xs, 'y': self.xs * i}, kdims=['x'], vdims=['y'])
+
+    def lazy_map(self, **params):
+        return LazyHoloMap([(i, partial(self.frame, i)) for i in range(10)],
+                           kdims=['z'], **params)
+
+    def test_lazy_holomap_keys_not_evaluated(self):
+        hmap = self.lazy_map()
+        self.assertEqual(hmap.keys(), list(range(10)))
+        self.assertEqual(hmap.dimension_values('z'), np.arange(10))
+        self.assertEqual(hmap.range('z'), (0, 9))
+        self.assertEqual(self.evaluated, [])
+
+    def test_lazy_holomap_getitem_evaluates_frame(self):
+        hmap = self.lazy_map()
+        self.assertEqual(hmap[3], self.frame(3))
+        self.assertEqual(self.evaluated, [3, 3])
+
+    def test_lazy_holomap_cache(self):
+        hmap = self.lazy_map(cache_size=2)
+        hmap[1], hmap[1], hmap[2], hmap[3], hmap[1]
+        self.assertEqual(self.evaluated, [1, 2, 3, 1])
+
+    def test_lazy_holomap_slice_not_evaluated(self):
+        sliced = self.lazy_map()[2:5]
+        self.assertIsInstance(sliced, LazyHoloMap)
+        self.assertEqual(sliced.keys(), [2, 3, 4])
+        self.assertNotIn(4, self.evaluated)
+        self.assertEqual(sliced[4], self.frame(4))
+
+    def test_lazy_holomap_map(self):
+        mapped = self.lazy_map().map(lambda x: x.clone(vdims=['y2']), Dataset)
+        self.assertNotIn(2, self.evaluated)
+        self.assertEqual(mapped[2].vdims, ['y2'])
+        self.assertIn(2, self.evaluated)
+
+    def test_lazy_holomap_mul_element_not_evaluated(self):
+        other = Dataset({'x': self.xs, 'y': self.xs}, kdims=['x'], vdims=['y'])
+        overlaid = self.lazy_map() * other
+        reverse = other * self.lazy_map()
+        self.assertIsInstance(overlaid, LazyHoloMap)
+        self.assertIsInstance(reverse, LazyHoloMap)
+        self.assertEqual(self.evaluated, [])
+        self.assertEqual(overlaid[2], self.frame(2) * other)
+        self.assertEqual(reverse[2], other * self.frame(2))
+
+    def test_lazy_holomap_range_summary(self):
+        hmap = self.lazy_map(ranges={'y': (0, 81)})
+        self.assertEqual(hmap.range('y'), (0, 81))
+        self.assertEqual(self.evaluated, [])
+
+    def test_lazy_holomap_values(self):
+        hmap = self.lazy_map()
+        self.assertEqual(hmap.values(), [self.frame(i) for i in range(10)])
+
+    def test_dataset_groupby_lazy(self):
+        ds = Dataset({'x': [0, 0, 1, 1], 'y': [0, 1, 0, 1], 'z': [1, 2, 3, 4]},
+                     kdims=['x', 'y'], vdims=['z'])
+        grouped = ds.groupby('x', lazy=True)
+        self.assertIsInstance(grouped, LazyHoloMap)
+        self.assertEqual(grouped.keys(), [0, 1])
+        self.assertEqual(grouped[1], ds.groupby('x')[1])
@@ -1,7 +1,13 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
 import param
 
+from holoviews.core.io import OperationCache
 from holoviews.core.operation import Operation
-from holoviews.element import Curve
+from holoviews.element import Curve, Image
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import Stream, Params
 
@@ -68,3 +74,127 @@ class TestOperationBroadcast(ComparisonTestCase):
         inst = ParamClass(label='Test')
         applied = TestOperation(curve, dynamic=False, label=inst.dynamic_label)
         self.assertEqual(applied, curve.relabel('Test!'))
+
+
+class CountingOperation(Operation):
+
+    factor = param.Number(default=2)
+
+    fn = param.Callable(default=np.abs)
+
+    calls = 0
+
+    def _process(self, element, key=None):
+        CountingOperation.calls += 1
+        return element.clone((element.dimension_values(0),
+                              element.dimension_values(1)*self.p.factor))
+
+
+class TestOperationCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.cache = OperationCache(path=self.path)
+        CountingOperation.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_operation_cache_hit(self):
+        curve = Curve([1, 2, 3])
+        first = CountingOperation(curve, disk_cache=self.cache)
+        second = CountingOperation(curve, disk_cache=self.cache)
+        self.assertEqual(CountingOperation.calls, 1)
+        self.assertEqual(first, Curve([2, 4, 6]))
+        self.assertEqual(second, first)
+
+    def test_operation_cache_miss_on_params(self):
+        curve = Curve([1, 2, 3])
+        CountingOperation(curve, disk_cache=self.cache)
+        result = CountingOperation(curve, factor=3, disk_cache=self.cache)
+        self.assertEqual(CountingOperation.calls, 2)
+        self.assertEqual(result, Curve([3, 6, 9]))
+
+    def test_operation_cache_miss_on_instance_params(self):
+        curve = Curve([1, 2, 3])
+        CountingOperation.instance(factor=3)(curve, disk_cache=self.cache)
+        result = CountingOperation.instance(factor=5)(curve, disk_cache=self.cache)
+        self.assertEqual(CountingOperation.calls, 2)
+        self.assertEqual(result, Curve([5, 10, 15]))
+
+    def test_operation_cache_miss_on_data(self):
+        CountingOperation(Curve([1, 2, 3]), disk_cache=self.cache)
+        result = CountingOperation(Curve([1, 2, 4]), disk_cache=self.cache)
+        self.assertEqual(CountingOperation.calls, 2)
+        self.assertEqual(result, Curve([2, 4, 8]))
+
+    def test_operation_cache_shared_between_instances(self):
+        curve = Curve([1, 2, 3])
+        CountingOperation(curve, disk_cache=self.cache)
+        other = OperationCache(path=self.path)
+        CountingOperation(curve, disk_cache=other)
+        self.assertEqual(CountingOperation.calls, 1)
+
+    def test_operation_cache_npz_format(self):
+        CountingOperation(Curve([1, 2, 3]), disk_cache=self.cache)
+        files = os.listdir(self.path)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].endswith('.npz'))
+        with np.load(os.path.join(self.path, files[0]), allow_pickle=False) as f:
+            self.assertEqual(f['dim_1'], np.array([2, 4, 6]))
+
+    def test_operation_cache_image_roundtrip(self):
+        img = Image(np.random.rand(3, 4), bounds=(0, 0, 4, 3))
+        self.assertTrue(self.cache.store('image', img))
+        self.assertEqual(self.cache.load('image'), img)
+
+    def test_operation_cache_missing_key(self):
+        self.assertIs(self.cache.load('missing'), None)
+
+    def test_operation_cache_uncacheable_param(self):
+        curve = Curve([1, 2, 3])
+        op = CountingOperation.instance(fn=lambda x: x)
+        op(curve, disk_cache=self.cache)
+        op(curve, disk_cache=self.cache)
+        self.assertEqual(CountingOperation.calls, 2)
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_operation_cache_lru_eviction(self):
+        curves = [Curve(np.arange(100)+i) for i in range(3)]
+        self.cache.store('a', curves[0])
+        size = os.path.getsize(os.path.join(self.path, 'a.npz'))
+        self.cache.max_size = int(size * 2.5)
+        self.cache.store('b', curves[1])
+        os.utime(os.path.join(self.path, 'a.npz'), (0, 0))
+        self.cache.store('c', curves[2])
+        self.assertEqual(sorted(os.listdir(self.path)), ['b.npz', 'c.npz'])
+        self.assertIs(self.cache.load('a'), None)
+        self.assertEqual(self.cache.load('b'), curves[1])
+
+    def test_operation_cache_miss_on_dimension_range(self):
+        from holoviews.core import Dataset, Dimension
+        from holoviews.operation import histogram
+        xs = np.arange(10)
+        histogram(Dataset(xs, 'x'), disk_cache=self.cache)
+        ranged = Dataset(xs, Dimension('x', range=(0, 100)))
+        result = histogram(ranged, disk_cache=self.cache)
+        self.assertEqual(len(os.listdir(self.path)), 2)
+        self.assertEqual(result.range(0), (0, 100))
+
+    def test_operation_cache_hit_equals_fresh_result(self):
+        from holoviews.core import Dimension
+        curve = Curve([1, 2, 3], vdims=Dimension('y', range=(0, 5), unit='m'))
+        fresh = CountingOperation(curve)
+        CountingOperation(curve, disk_cache=self.cache)
+        cached = CountingOperation(curve, disk_cache=self.cache)
+        self.assertEqual(CountingOperation.calls, 2)
+        self.assertEqual(cached, fresh)
+        self.assertEqual(cached.vdims[0].range, (0, 5))
+        self.assertEqual(cached.vdims[0].unit, 'm')
+        self.assertEqual(cached.interface, fresh.interface)
+
+    def test_operation_cache_skips_non_roundtrip_dimension(self):
+        from holoviews.core import Dimension
+        dim = Dimension('y', value_format=lambda x: str(x))
+        self.assertFalse(self.cache.store('fmt', Curve([1, 2, 3], vdims=dim)))
+        self.assertEqual(os.listdir(self.path), [])
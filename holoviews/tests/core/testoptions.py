@@ -3,7 +3,8 @@ import pickle
 from unittest import SkipTest
 
 import numpy as np
-from holoviews import Store, Histogram, Image, Curve, Points, DynamicMap, opts
+from holoviews import (Store, Histogram, Image, Curve, Points, DynamicMap,
+                       LazyHoloMap, opts)
 from holoviews.core.options import (
     OptionError, Cycle, Options, OptionTree, StoreOptions, options_policy
 )
@@ -698,6 +699,29 @@ class TestOptsMethod(ComparisonTestCase):
         self.assertEqual(self.lookup_options(im, 'style').options,
                          {'cmap': 'Blues', 'interpolation': 'nearest'})
 
+    def test_opts_lazy_holomap_deferred(self):
+        evaluated = []
+        def frame(i):
+            evaluated.append(i)
+            return Curve([i, i+1])
+        hmap = LazyHoloMap([(i, lambda i=i: frame(i)) for i in range(5)], kdims=['i'])
+        styled = hmap.opts(color='red')
+        self.assertIsInstance(styled, LazyHoloMap)
+        self.assertEqual(evaluated, [])
+        self.assertEqual(self.lookup_options(styled[2], 'style').options['color'], 'red')
+        self.assertEqual(evaluated, [2])
+
+    def test_options_lazy_holomap_deferred(self):
+        evaluated = []
+        def frame(i):
+            evaluated.append(i)
+            return Curve([i, i+1])
+        hmap = LazyHoloMap([(i, lambda i=i: frame(i)) for i in range(5)], kdims=['i'])
+        styled = hmap.options(color='red')
+        self.assertIsInstance(styled, LazyHoloMap)
+        self.assertEqual(evaluated, [])
+        self.assertEqual(self.lookup_options(styled[2], 'style').options['color'], 'red')
+
     def test_opts_method_dynamicmap_grouped(self):
         dmap = DynamicMap(lambda X: Curve([1, 2, X]),
                           kdims=['X']).redim.range(X=(0, 3))
@@ -19,7 +19,7 @@ from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
     deephash, merge_dimensions, get_path, make_path_unique, compute_density,
     date_range, dt_to_int, compute_edges, isfinite, cross_index, closest_match,
-    dimension_range, tree_attribute
+    dimension_range, tree_attribute, unique_array
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -883,3 +883,30 @@ class TestClosestMatch(ComparisonTestCase):
         self.assertEqual(closest_match(spec, specs), None)
         spec = ('Scatter', 'Foo', 'Bar', 5)
         self.assertEqual(closest_match(spec, specs), None)
+
+
+
+class TestUniqueArray(ComparisonTestCase):
+
+    def test_unique_array_numeric(self):
+        self.assertEqual(unique_array(np.array([3, 1, 3, 2])), np.array([3, 1, 2]))
+
+    def test_unique_array_object(self):
+        arr = np.array(['b', 'a', 'b', 'c'], dtype=object)
+        self.assertEqual(unique_array(arr), np.array(['b', 'a', 'c'], dtype=object))
+
+    def test_unique_array_datetime64(self):
+        arr = np.array(['2020-01-02', '2020-01-01', '2020-01-02'], dtype='datetime64[D]')
+        expected = np.array(['2020-01-02', '2020-01-01'], dtype='datetime64[ns]')
+        self.assertEqual(unique_array(arr), expected)
+
+    def test_unique_array_datetime_objects(self):
+        arr = np.array([datetime.datetime(2020, 1, 2), datetime.datetime(2020, 1, 1),
+                        datetime.datetime(2020, 1, 2)], dtype=object)
+        expected = np.array(['2020-01-02', '2020-01-01'], dtype='datetime64[ns]')
+        self.assertEqual(unique_array(arr), expected)
+
+    @pd_skip
+    def test_unique_array_categorical(self):
+        arr = pd.Series(['b', 'a', 'b', 'c'], dtype='category')
+        self.assertEqual(unique_array(arr), np.array(['b', 'a', 'c'], dtype=object))
@@ -123,6 +123,35 @@ class DatashaderAggregateTests(ComparisonTestCase):
                          ['index', 'a'], 'Count', datatype=['xarray'], bounds=bounds)
         self.assertEqual(img, expected)
 
+    def test_aggregate_ndoverlay_dask_categories_lazy(self):
+        df = pd.DataFrame({'x': [0.2, 0.4, 0.0], 'y': [0.3, 0.7, 0.99]})
+        overlay = NdOverlay({'A': Points(dd.from_pandas(df, npartitions=2)),
+                             'B': Points(dd.from_pandas(df, npartitions=1))}, 'z')
+        _, _, data, glyph = aggregate.get_agg_data(overlay, 'z')
+        self.assertEqual(glyph, 'points')
+        self.assertIsInstance(data.data, dd.DataFrame)
+        self.assertTrue(data.data['z'].cat.known)
+        self.assertEqual(list(data.data['z'].cat.categories), ['A', 'B'])
+
+    def test_aggregate_ndoverlay_mixed_dask_curves_lazy(self):
+        df = pd.DataFrame({'x': [0, 1], 'y': [1, 2]})
+        overlay = NdOverlay({0: Curve(df), 1: Curve(dd.from_pandas(df, npartitions=2))})
+        _, _, data, glyph = aggregate.get_agg_data(overlay)
+        self.assertEqual(glyph, 'line')
+        self.assertIsInstance(data.data, dd.DataFrame)
+        computed = data.data.compute()
+        self.assertEqual(computed.x.values, np.array([0, 1, np.NaN, 0, 1]))
+        self.assertEqual(computed.y.values, np.array([1, 2, np.NaN, 1, 2]))
+
+    def test_aggregate_points_dask_scheduler(self):
+        df = pd.DataFrame({'x': [0.2, 0.4, 0.0], 'y': [0.3, 0.7, 0.99]})
+        points = Points(dd.from_pandas(df, npartitions=2))
+        img = aggregate(points, dynamic=False,  x_range=(0, 1), y_range=(0, 1),
+                        width=2, height=2, scheduler='synchronous')
+        expected = Image(([0.25, 0.75], [0.25, 0.75], [[1, 0], [2, 0]]),
+                         vdims=['Count'])
+        self.assertEqual(img, expected)
+
     def test_aggregate_curve_datetimes_microsecond_timebase(self):
         dates = pd.date_range(start="2016-01-01", end="2016-01-03", freq='1D')
         xstart = np.datetime64('2015-12-31T23:59:59.723518000', 'us')
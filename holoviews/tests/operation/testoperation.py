@@ -21,7 +21,8 @@ from holoviews.core.util import pd
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.element import (operation, transform, threshold,
                                          gradient, contours, histogram,
-                                         interpolate_curve)
+                                         interpolate_curve, downsample1d, chain,
+                                         method)
 
 pd_skip = skipIf(pd is None, "Pandas not available")
 mpl_skip = skipIf(mpl is None, "Matplotlib is not available")
@@ -73,6 +74,53 @@ class OperationTests(ComparisonTestCase):
         op_img = gradient(img)
         self.assertEqual(op_img, img.clone(np.array([[3.162278, 3.162278], [3.162278, 3.162278]]), group='Gradient'))
 
+    def test_chain_fused_matches_sequential(self):
+        img = Image(np.random.rand(10, 10), label='Test')
+        ops = [transform.instance(operator=np.sqrt), threshold.instance(level=0.6),
+               gradient.instance()]
+        fused = chain(img, operations=ops)
+        sequential = img
+        for op in ops:
+            sequential = op(sequential)
+        self.assertEqual(fused, sequential)
+        self.assertEqual(fused.group, 'Gradient')
+
+    def test_chain_fused_preserves_metadata(self):
+        img = Image(np.random.rand(10, 10), label='Test', vdims=['v'])
+        fused = chain(img, operations=[transform.instance(operator=np.sqrt), threshold.instance()])
+        self.assertEqual(fused, threshold(transform(img, operator=np.sqrt)))
+        self.assertEqual(fused.label, 'Test')
+        self.assertEqual(fused.vdims, img.vdims)
+
+    def test_chain_fused_skips_element_processing(self):
+        class strict_threshold(threshold):
+            def _process(self, matrix, key=None):
+                raise AssertionError('Expected threshold to be fused')
+        img = Image(np.array([[0, 1, 0], [3, 4, 5.]]))
+        fused = chain(img, operations=[transform.instance(operator=lambda x: x*2),
+                                       strict_threshold.instance(level=1.5)])
+        self.assertEqual(fused.data, np.array([[0, 1, 0], [1, 1, 1.]]))
+
+    def test_chain_fused_pipeline(self):
+        img = Image(np.random.rand(10, 10))
+        fused = chain(img, operations=[threshold.instance(), gradient.instance()])
+        op = fused.pipeline.operations[-1]
+        self.assertIsInstance(op, method)
+        self.assertIsInstance(op.args[0], chain)
+        self.assertEqual(fused.pipeline(img), fused)
+
+    def test_chain_unfusable_input(self):
+        img = Image((range(10), range(10), np.random.rand(10, 10)), datatype=['grid'])
+        ops = [gradient.instance(), threshold.instance(level=0.1)]
+        result = chain(img, operations=ops)
+        self.assertEqual(result, threshold(gradient(img), level=0.1))
+
+    def test_chain_fused_does_not_modify_operations(self):
+        img = Image(np.random.rand(10, 10))
+        op = threshold.instance(level=0.2)
+        chain(img, operations=[transform.instance(operator=np.sqrt), op])
+        self.assertNotIn('p', op.__dict__)
+
     @mpl_skip
     def test_image_contours(self):
         img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
@@ -338,6 +386,43 @@ class OperationTests(ComparisonTestCase):
                       vdims=['y', 'z'])
         self.assertEqual(interpolated, curve)
 
+    def test_downsample1d_lttb(self):
+        ys = np.zeros(1000)
+        ys[500] = 10
+        curve = Curve(ys)
+        downsampled = downsample1d(curve, width=10, dynamic=False)
+        xs = downsampled.dimension_values(0)
+        self.assertEqual(len(downsampled), 20)
+        self.assertEqual(xs[[0, -1]], np.array([0, 999]))
+        self.assertIn(500, xs)
+
+    def test_downsample1d_minmax(self):
+        ys = np.zeros(1000)
+        ys[500], ys[700] = 10, -10
+        curve = Curve(ys)
+        downsampled = downsample1d(curve, width=10, algorithm='minmax', dynamic=False)
+        xs = downsampled.dimension_values(0)
+        self.assertTrue(len(downsampled) <= 22)
+        self.assertEqual(xs[[0, -1]], np.array([0, 999]))
+        self.assertIn(500, xs)
+        self.assertIn(700, xs)
+
+    def test_downsample1d_x_range(self):
+        curve = Curve(np.arange(1000))
+        downsampled = downsample1d(curve, width=100, x_range=(100, 199), dynamic=False)
+        self.assertEqual(downsampled, curve.iloc[99:201])
+
+    def test_downsample1d_short_curve_unchanged(self):
+        curve = Curve(np.arange(10))
+        self.assertIs(downsample1d(curve, width=10, dynamic=False), curve)
+
+    def test_downsample1d_dynamic_plot_size(self):
+        curve = Curve(np.arange(1000))
+        downsampled = downsample1d(curve)
+        plot_size, range_x = downsampled.streams
+        plot_size.event(width=10, height=10, scale=2.0)
+        self.assertEqual(len(downsampled[()]), 40)
+
     def test_interpolate_datetime_curve_post(self):
         dates = np.array([dt.datetime(2017, 1, i) for i in range(1, 5)]).astype('M')
         values = [0, 1, 2, 3]
@@ -7,7 +7,8 @@ except:
 
 import numpy as np
 
-from holoviews import Distribution, Bivariate, Area, Image, Contours, Polygons
+from holoviews import (Dataset, Distribution, Bivariate, Area, Image,
+                       Contours, Polygons)
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.stats import (univariate_kde, bivariate_kde)
 
@@ -76,3 +77,41 @@ class KDEOperationTests(ComparisonTestCase):
                             y_range=(0, 4), contours=False)
         img = Image(np.zeros((2, 2)), bounds=(-2, -2, 6, 6), vdims=['Density'])
         self.assertEqual(kde, img)
+
+    def test_univariate_kde_binned_matches_exact(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(1000))
+        exact = univariate_kde(dist, method='exact')
+        binned = univariate_kde(dist, method='binned')
+        self.assertEqual(exact.dimension_values(0), binned.dimension_values(0))
+        ys_exact, ys_binned = exact.dimension_values(1), binned.dimension_values(1)
+        self.assertTrue(np.abs(ys_exact-ys_binned).max() < 1e-3*ys_exact.max())
+
+    def test_univariate_kde_weights(self):
+        ds = Dataset(([0, 0, 1, 4], [1, 1, 1, 0]), kdims=['x'], vdims=['weight'])
+        weighted = univariate_kde(ds, dimension='x', n_samples=5, bin_range=(0, 4),
+                                  weights='weight', method='exact')
+        ys = weighted.dimension_values(1)
+        self.assertTrue(ys[0] > ys[-1])
+
+    def test_univariate_kde_weights_distribution_vdim(self):
+        dist = Distribution([0, 0, 1, 4], vdims=['weight'])
+        with self.assertRaises(ValueError):
+            univariate_kde(dist, weights='weight')
+
+    def test_univariate_kde_weights_binned_matches_exact(self):
+        np.random.seed(1)
+        ds = Dataset((np.random.randn(1000), np.random.rand(1000)),
+                     kdims=['x'], vdims=['weight'])
+        exact = univariate_kde(ds, dimension='x', weights='weight', method='exact')
+        binned = univariate_kde(ds, dimension='x', weights='weight', method='binned')
+        ys_exact, ys_binned = exact.dimension_values(1), binned.dimension_values(1)
+        self.assertTrue(np.abs(ys_exact-ys_binned).max() < 1e-3*ys_exact.max())
+
+    def test_bivariate_kde_binned_matches_exact(self):
+        np.random.seed(1)
+        bivariate = Bivariate(np.random.randn(1000, 2))
+        exact = bivariate_kde(bivariate, contours=False, method='exact')
+        binned = bivariate_kde(bivariate, contours=False, method='binned')
+        zs_exact, zs_binned = exact.dimension_values(2), binned.dimension_values(2)
+        self.assertTrue(np.abs(zs_exact-zs_binned).max() < 1e-2*zs_exact.max())
@@ -13,7 +13,7 @@ scipy_skip = skipIf(scipy is None, "SciPy is not available.")
 
 import numpy as np
 
-from holoviews import Curve, Scatter
+from holoviews import Curve, NdOverlay, Scatter
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.timeseries import (rolling, resample, rolling_outlier_std)
 
@@ -80,3 +80,65 @@ class TimeseriesOperationTests(ComparisonTestCase):
     def test_rolling_outliers_std_dates(self):
         outliers = rolling_outlier_std(self.date_outliers, rolling_window=2, sigma=1)
         self.assertEqual(outliers, Scatter([(pd.Timestamp("2016-01-05"), 10)]))
+
+    def test_roll_incremental_matches_full(self):
+        ys = np.random.rand(50)
+        op = rolling.instance(rolling_window=3, incremental=True)
+        for n in [20, 21, 30, 50]:
+            curve = Curve(ys[:n])
+            self.assertEqual(op(curve), rolling(curve, rolling_window=3))
+
+    def test_roll_incremental_delta(self):
+        ys = np.random.rand(30)
+        op = rolling.instance(rolling_window=3, center=False, incremental=True)
+        self.assertIs(op(Curve(ys[:20]))._stream_delta, None)
+        self.assertEqual(op(Curve(ys[:25]))._stream_delta, (20, 0, 5))
+        op = rolling.instance(rolling_window=3, center=True, incremental=True)
+        op(Curve(ys[:20]))
+        self.assertEqual(op(Curve(ys[:25]))._stream_delta, (20, 3, 5))
+
+    def test_roll_incremental_trimmed_buffer(self):
+        ys = np.random.rand(30)
+        xs = np.arange(30)
+        op = rolling.instance(rolling_window=3, incremental=True)
+        op(Curve((xs[:20], ys[:20])))
+        rolled = op(Curve((xs[5:25], ys[5:25])))
+        full = rolling(Curve((xs[:25], ys[:25])), rolling_window=3)
+        self.assertEqual(rolled, full.iloc[5:])
+
+    def test_roll_incremental_overlay_layers(self):
+        xs = np.arange(30)
+        ys = np.random.rand(2, 30)
+        op = rolling.instance(rolling_window=3, incremental=True)
+        for n in [20, 25, 30]:
+            overlay = NdOverlay({i: Curve((xs[:n], ys[i, :n])) for i in range(2)})
+            self.assertEqual(op(overlay), rolling(overlay, rolling_window=3))
+
+    def test_roll_incremental_different_inputs(self):
+        xs = np.arange(20)
+        ys = np.random.rand(2, 21)
+        op = rolling.instance(rolling_window=3, incremental=True)
+        op(Curve((xs, ys[0, :20])))
+        other = Curve((xs, ys[1, :20]))
+        self.assertEqual(op(other), rolling(other, rolling_window=3))
+        extended = Curve((np.arange(21), ys[1]))
+        op(Curve((xs, ys[0, :20])))
+        rolled = op(extended)
+        self.assertIs(rolled._stream_delta, None)
+        self.assertEqual(rolled, rolling(extended, rolling_window=3))
+
+    def test_resample_incremental_matches_full(self):
+        dates = pd.date_range("2016-01-01", periods=100, freq='5H')
+        ys = np.random.rand(100)
+        op = resample.instance(rule='D', incremental=True)
+        for n in [40, 41, 70, 100]:
+            curve = Curve((dates[:n], ys[:n]))
+            self.assertEqual(op(curve), resample(curve, rule='D'))
+
+    def test_rolling_outliers_std_incremental_matches_full(self):
+        ys = np.random.rand(60)
+        ys[[12, 45]] = 10
+        op = rolling_outlier_std.instance(rolling_window=3, sigma=1, incremental=True)
+        for n in [30, 31, 60]:
+            curve = Curve(ys[:n])
+            self.assertEqual(op(curve), rolling_outlier_std(curve, rolling_window=3, sigma=1))
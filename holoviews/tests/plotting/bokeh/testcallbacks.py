@@ -1,4 +1,7 @@
 import datetime as dt
+import threading
+import time
+
 from collections import deque, namedtuple
 
 import numpy as np
@@ -12,6 +15,8 @@ from holoviews.streams import (PointDraw, PolyDraw, PolyEdit, BoxEdit,
                                RangeXY, PlotSize, CDSStream, SingleTap)
 import pyviz_comms as comms
 
+from panel.io.state import state
+
 try:
     from bokeh.events import Tap
     from bokeh.io.doc import set_curdoc
@@ -456,6 +461,105 @@ class TestServerCallbacks(CallbackTestCase):
         self.assertEqual(resolved, {'id': cds.ref['id'],
                                     'value': points.columns()})
 
+    def test_server_callback_policy_from_streams(self):
+        points = Points([1, 2, 3])
+        PointerXY(source=points, policy='debounce', timeout=200)
+        RangeXY(source=points)
+        plot = bokeh_server_renderer.get_plot(points)
+        policies = sorted(cb.policy for cb in plot.callbacks)
+        self.assertEqual(policies, [('debounce', 200), ('throttle', 50)])
+
+    def test_server_callback_adaptive_delay_uses_latency(self):
+        points = Points([1, 2, 3])
+        PointerXY(source=points, policy='adaptive')
+        plot = bokeh_server_renderer.get_plot(points)
+        callback = plot.callbacks[0]
+        self.assertEqual(callback._delay(), 50)
+        callback._latency = 400
+        self.assertEqual(callback._delay(), 400)
+
+    def test_prefetch_frame_memoizes_dynamic_callback(self):
+        calls = []
+        def callback(x_range, y_range):
+            calls.append((x_range, y_range))
+            return Points([1, 2, 3])
+        stream = RangeXY()
+        dmap = DynamicMap(callback, streams=[stream])
+        plot = bokeh_server_renderer.get_plot(dmap)
+        stream.update(x_range=(0, 1), y_range=(0, 2))
+        plot._prefetch_frame()
+        self.assertEqual(calls[-1], ((0, 1), (0, 2)))
+        ncalls = len(calls)
+        plot.refresh()
+        self.assertEqual(len(calls), ncalls)
+
+    def test_prefetch_frame_does_not_modify_plot_state(self):
+        calls = []
+        def callback(x_range, y_range):
+            calls.append(x_range)
+            return Points([1, 2, 3])
+        stream = RangeXY()
+        dmap = DynamicMap(callback, streams=[stream])
+        plot = bokeh_server_renderer.get_plot(dmap)
+        data = list(dmap.data.items())
+        stream.update(x_range=(0, 1), y_range=(0, 2))
+        plot._prefetch_frame()
+        self.assertEqual(list(dmap.data.items()), data)
+        self.assertEqual(calls[-1], (0, 1))
+        ncalls = len(calls)
+        plot.update(())
+        self.assertEqual(len(calls), ncalls)
+
+    def test_prefetch_frame_raises_callback_errors(self):
+        def callback(x_range, y_range):
+            if x_range is not None:
+                raise ValueError('Callback failed')
+            return Points([1, 2, 3])
+        stream = RangeXY()
+        dmap = DynamicMap(callback, streams=[stream])
+        plot = bokeh_server_renderer.get_plot(dmap)
+        stream.update(x_range=(0, 1), y_range=(0, 2))
+        with self.assertRaises(ValueError):
+            plot._prefetch_frame()
+
+    def test_server_callback_thread_executor_dispatch(self):
+        threads = []
+        def callback(x, y):
+            threads.append(threading.current_thread().ident)
+            return Points([(x, y)])
+        dmap = DynamicMap(callback, kdims=[], streams=[PointerXY()])
+        plot = bokeh_server_renderer.get_plot(dmap.opts(executor='thread'))
+        callback = plot.callbacks[0]
+        scheduled = []
+        callback._schedule = lambda cb, delay=None: scheduled.append(cb)
+        document = plot.document
+        set_curdoc(document)
+        thread_id = state._thread_id
+        main_thread = threading.current_thread().ident
+        try:
+            # Emulate a server session running on the current thread
+            document._session_context = object()
+            state._thread_id = main_thread
+            reschedule = lambda: None
+            ncalls = len(threads)
+            callback._dispatch([{'x': 0.3, 'y': 0.2}], reschedule)
+            for _ in range(500):
+                if len(document.session_callbacks) >= 2:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(len(threads), ncalls+1)
+            self.assertNotEqual(threads[-1], main_thread)
+            for session_callback in list(document.session_callbacks):
+                session_callback.callback()
+        finally:
+            document._session_context = None
+            state._thread_id = thread_id
+        self.assertEqual(len(threads), ncalls+1)
+        self.assertEqual(scheduled, [reschedule])
+        data = plot.handles['source'].data
+        self.assertEqual(data['x'], np.array([0.3]))
+        self.assertEqual(data['y'], np.array([0.2]))
+
 
 
 
@@ -8,14 +8,16 @@ from holoviews.core.options import Cycle, Palette
 from holoviews.core.util import pd, basestring
 from holoviews.element import Curve
 from holoviews.plotting.util import rgb2hex
-from holoviews.streams import PointerX
+from holoviews.streams import PointerX, RangeXY
 from holoviews.util.transform import dim
 
 from .testplot import TestBokehPlot, bokeh_renderer
 
 try:
     from bokeh.models import FactorRange, FixedTicker
-    from holoviews.plotting.bokeh.callbacks import Callback, PointerXCallback
+    from holoviews.plotting.bokeh.callbacks import (
+        Callback, PointerXCallback, RangeXYCallback
+    )
 except:
     pass
 
@@ -430,3 +432,29 @@ class TestCurvePlot(TestBokehPlot):
                 self.assertEqual(linestyle, [])
             else:
                 self.assertEqual(linestyle, [6])
+
+    def test_curve_downsample_attaches_range_stream(self):
+        curve = Curve(np.arange(10000)).opts(downsample='lttb', width=100)
+        plot = bokeh_renderer.get_plot(curve)
+        callbacks = [cb for cb in plot.callbacks if isinstance(cb, RangeXYCallback)]
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsInstance(callbacks[0].streams[0], RangeXY)
+
+    def test_curve_downsample_resamples_on_range_change(self):
+        curve = Curve(np.arange(10000)).opts(downsample='minmax', width=100)
+        plot = bokeh_renderer.get_plot(curve)
+        stream = [cb for cb in plot.callbacks if isinstance(cb, RangeXYCallback)][0].streams[0]
+        stream.event(x_range=(1000, 2000), y_range=(0, 10000))
+        xs = plot.handles['source'].data['x']
+        self.assertTrue(len(xs) < 1000)
+        self.assertTrue(xs.min() >= 999)
+        self.assertTrue(xs.max() <= 2001)
+
+    def test_curve_downsample_reuses_declared_range_stream(self):
+        stream = RangeXY()
+        curve = DynamicMap(lambda x_range, y_range: Curve(np.arange(10000)),
+                           streams=[stream]).opts(downsample='lttb')
+        plot = bokeh_renderer.get_plot(curve)
+        callbacks = [cb for cb in plot.callbacks if isinstance(cb, RangeXYCallback)]
+        self.assertEqual(len(callbacks), 1)
+        self.assertIs(callbacks[0].streams[0], stream)
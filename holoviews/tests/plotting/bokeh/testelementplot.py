@@ -5,14 +5,20 @@ import numpy as np
 
 from bokeh.core.properties import value
 from holoviews.core import Dimension, DynamicMap, NdOverlay, HoloMap
-from holoviews.element import Curve, Image, Scatter, Labels
+from holoviews.element import Bars, Curve, Image, Scatter, Labels
 from holoviews.streams import Stream, PointDraw
 from holoviews.plotting.util import process_cmap
 from holoviews.util import render
+from holoviews.plotting.bokeh.util import cds_column_replace
 
 from .testplot import TestBokehPlot, bokeh_renderer
 from ...utils import LoggingComparisonTestCase
 
+try:
+    from unittest.mock import patch
+except:
+    from mock import patch
+
 try:
     from bokeh.document import Document
     from bokeh.models import tools
@@ -353,6 +359,46 @@ class TestElementPlot(LoggingComparisonTestCase, TestBokehPlot):
         self.assertEqual(sorted(plot.handles['source'].data.keys()), ['a', 'b', 'y'])
         self.assertEqual(plot.state.xaxis[0].axis_label, 'b')
 
+    def test_shared_frame_data_columns(self):
+        hmap = HoloMap({i: Curve(np.arange(10)*i) for i in range(3)}).opts(shared_frame_data=True)
+        plot = bokeh_renderer.get_plot(hmap)
+        source = plot.handles['source']
+        payloads = []
+        def record(source, data):
+            payloads.append(data)
+            return cds_column_replace(source, data)
+        with patch('holoviews.plotting.bokeh.plot.cds_column_replace', side_effect=record):
+            plot.update((1,))
+        self.assertEqual(plot._shared_columns, {source.ref['id']: {'x'}})
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(list(payloads[0]), ['y'])
+        self.assertEqual(payloads[0]['y'], np.arange(10))
+        self.assertEqual(source.data['x'], np.arange(10))
+        self.assertEqual(source.data['y'], np.arange(10))
+
+    def test_shared_frame_data_does_not_render_frames(self):
+        hmap = HoloMap({i: Curve(np.arange(10)*i) for i in range(3)}).opts(shared_frame_data=True)
+        plot = bokeh_renderer.get_plot(hmap)
+        with patch.object(plot, 'get_data', side_effect=plot.get_data) as get_data:
+            plot.update((1,))
+        self.assertEqual(get_data.call_count, 1)
+
+    def test_downcast_lossless_columns(self):
+        curve = Curve((np.arange(10), np.linspace(0, 1, 10))).opts(downcast=True)
+        plot = bokeh_renderer.get_plot(curve)
+        source = plot.handles['source']
+        self.assertEqual(source.data['x'].dtype, np.uint8)
+        self.assertEqual(source.data['y'].dtype, np.float64)
+        self.assertEqual(source.data['x'], np.arange(10))
+
+    def test_transport_dtypes_by_dimension(self):
+        bars = Bars((['A', 'B', 'C'], [0.5, 1.5, 2.5]), 'x', 'y 1').opts(
+            transport_dtypes={'y 1': 'float32'})
+        plot = bokeh_renderer.get_plot(bars)
+        source = plot.handles['source']
+        self.assertEqual(source.data['y_1'].dtype, np.float32)
+        self.assertEqual(source.data['y_1'], np.array([0.5, 1.5, 2.5]))
+
     def test_categorical_axis_fontsize(self):
         curve = Curve([('A', 1), ('B', 2)]).options(fontsize={'minor_xticks': '6pt', 'xticks': 18})
         plot = bokeh_renderer.get_plot(curve)
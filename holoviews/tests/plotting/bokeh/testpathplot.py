@@ -4,7 +4,9 @@ import numpy as np
 from holoviews.core import NdOverlay, HoloMap
 from holoviews.core.options import Cycle
 from holoviews.element import Path, Polygons, Contours
+from holoviews.selection import link_selections
 from holoviews.streams import PolyDraw
+from holoviews.util.transform import dim
 
 from .testplot import TestBokehPlot, bokeh_renderer
 
@@ -158,6 +160,29 @@ class TestPathPlot(TestBokehPlot):
         self.assertEqual(item.label, legend)
         self.assertEqual(item.renderers, [plot.handles['glyph_renderer']])
 
+    def test_path_selection_expr_bounds(self):
+        path = Path([{'x': [0, 1], 'y': [0, 1]}, {'x': [5, 6], 'y': [5, 6]},
+                     {'x': [0, 9], 'y': [9, 0]}])
+        expr, bbox = path._get_selection_expr_for_stream_value(bounds=(7, 7, 4, 4))
+        self.assertEqual(bbox, {'x': (4, 7), 'y': (4, 7)})
+        self.assertEqual(expr.apply(path), np.array([False, True, True]))
+
+    def test_path_selection_expr_bounds_invert_axes(self):
+        path = Path([{'x': [0, 1], 'y': [5, 6]}, {'x': [5, 6], 'y': [0, 1]}]).opts(
+            invert_axes=True)
+        expr, bbox = path._get_selection_expr_for_stream_value(bounds=(4, 0, 7, 2))
+        self.assertEqual(bbox, {'x': (0, 2), 'y': (4, 7)})
+        self.assertEqual(expr.apply(path), np.array([True, False]))
+
+    def test_path_link_selections_selects_geometries(self):
+        path = Path([{'x': [0, 1], 'y': [0, 1]}, {'x': [5, 6], 'y': [5, 6]}])
+        lnk_sel = link_selections.instance()
+        linked = lnk_sel(path)
+        bokeh_renderer.get_plot(linked)
+        lnk_sel.selection_expr = dim('x').spatial_select(dim('y'), bounds=(4, 4, 7, 7))
+        selected = linked[()].Path.II
+        self.assertEqual(selected.split(datatype='array'), [np.array([(5, 5), (6, 6)])])
+
         
 
 class TestPolygonPlot(TestBokehPlot):
@@ -5,7 +5,7 @@ from holoviews.element import QuadMesh, Image
 from .testplot import TestBokehPlot, bokeh_renderer
 
 try:
-    from bokeh.models import ColorBar
+    from bokeh.models import ColorBar, Image as Image_glyph, Quad
 except:
     pass
 
@@ -40,7 +40,7 @@ class TestQuadMeshPlot(TestBokehPlot):
     def test_quadmesh_inverted_coords(self):
         xs = [0, 1, 2]
         ys = [2, 1, 0]
-        qmesh = QuadMesh((xs, ys, np.random.rand(3, 3)))
+        qmesh = QuadMesh((xs, ys, np.random.rand(3, 3))).opts(image_rendering=False)
         plot = bokeh_renderer.get_plot(qmesh)
         source = plot.handles['source']
         self.assertEqual(source.data['z'], qmesh.dimension_values(2, flat=False).T.flatten())
@@ -48,3 +48,61 @@ class TestQuadMeshPlot(TestBokehPlot):
         self.assertEqual(source.data['right'], np.array([0.5, 0.5, 0.5, 1.5, 1.5, 1.5, 2.5, 2.5, 2.5]))
         self.assertEqual(source.data['top'], np.array([0.5, 1.5, 2.5, 0.5, 1.5, 2.5, 0.5, 1.5, 2.5]))
         self.assertEqual(source.data['bottom'], np.array([-0.5, 0.5, 1.5, -0.5, 0.5, 1.5, -0.5, 0.5, 1.5]))
+
+    def test_quadmesh_regular_image(self):
+        arr = np.random.rand(3, 4)
+        qmesh = QuadMesh(([0, 1, 2, 3], [0, 1, 2], arr))
+        plot = bokeh_renderer.get_plot(qmesh)
+        source = plot.handles['source']
+        self.assertIsInstance(plot.handles['glyph'], Image_glyph)
+        self.assertEqual(source.data['image'][0], arr)
+        self.assertEqual(source.data['x'], [-0.5])
+        self.assertEqual(source.data['y'], [-0.5])
+        self.assertEqual(source.data['dw'], [4])
+        self.assertEqual(source.data['dh'], [3])
+
+    def test_quadmesh_rectilinear_image_resampled(self):
+        arr = np.array([[0, 1, 2]])
+        qmesh = QuadMesh(([0, 1, 3, 6], [0, 1], arr))
+        plot = bokeh_renderer.get_plot(qmesh)
+        source = plot.handles['source']
+        self.assertEqual(source.data['image'][0], np.array([[0, 1, 1, 2, 2, 2]]))
+        self.assertEqual(source.data['dw'], [6])
+
+    def test_quadmesh_rectilinear_oversampled_falls_back_to_quads(self):
+        arr = np.array([[0, 1, 2]])
+        qmesh = QuadMesh(([0, 0.01, 1, 2], [0, 1], arr))
+        plot = bokeh_renderer.get_plot(qmesh)
+        source = plot.handles['source']
+        self.assertIsInstance(plot.handles['glyph'], Quad)
+        self.assertEqual(source.data['left'], np.array([0, 0.01, 1]))
+        self.assertEqual(source.data['z'], np.array([0, 1, 2]))
+
+    def test_quadmesh_hover_falls_back_to_quads(self):
+        qmesh = QuadMesh(([0, 1, 2], [0, 1, 2], np.random.rand(3, 3))).opts(tools=['hover'])
+        plot = bokeh_renderer.get_plot(qmesh)
+        self.assertIsInstance(plot.handles['glyph'], Quad)
+
+    def test_quadmesh_log_axis_falls_back_to_quads(self):
+        qmesh = QuadMesh(([1, 10, 100], [0, 1, 2], np.random.rand(3, 3))).opts(logx=True)
+        plot = bokeh_renderer.get_plot(qmesh)
+        self.assertIsInstance(plot.handles['glyph'], Quad)
+
+    def test_quadmesh_line_style_falls_back_to_quads(self):
+        qmesh = QuadMesh(([0, 1, 2], [0, 1, 2], np.random.rand(3, 3))).opts(
+            line_color='white', line_alpha=1, line_width=2)
+        plot = bokeh_renderer.get_plot(qmesh)
+        glyph = plot.handles['glyph']
+        self.assertIsInstance(glyph, Quad)
+        self.assertEqual(glyph.line_color, 'white')
+        self.assertEqual(glyph.line_width, 2)
+
+    def test_quadmesh_irregular_patches(self):
+        xs = np.array([[0, 1], [0, 1]])
+        ys = np.array([[0, 0], [1, 1.5]])
+        zs = np.array([[1., np.NaN], [2, 3]])
+        qmesh = QuadMesh((xs, ys, zs))
+        plot = bokeh_renderer.get_plot(qmesh)
+        source = plot.handles['source']
+        self.assertEqual(len(source.data['xs']), 3)
+        self.assertEqual(source.data['z'], np.array([1., 2, 3]))
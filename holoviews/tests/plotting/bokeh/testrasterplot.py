@@ -94,3 +94,32 @@ class TestRasterPlot(TestBokehPlot):
         self.assertEqual(cdata['y'], [0.5])
         self.assertEqual(cdata['dh'], [1.0])
         self.assertEqual(cdata['dw'], [1.0])
+
+    def test_image_downsample_to_frame(self):
+        img = Image(np.random.rand(600, 450)).opts(
+            downsample_image=True, frame_width=150, frame_height=200)
+        plot = bokeh_renderer.get_plot(img)
+        source = plot.handles['source']
+        self.assertEqual(source.data['image'][0].shape, (200, 150))
+        self.assertEqual(source.data['dw'][0], 1)
+        self.assertEqual(source.data['dh'][0], 1)
+
+    def test_rgb_downsample_to_frame(self):
+        rgb = RGB(np.random.rand(600, 450, 3)).opts(
+            downsample_image=True, frame_width=150, frame_height=200)
+        plot = bokeh_renderer.get_plot(rgb)
+        source = plot.handles['source']
+        self.assertEqual(source.data['image'][0].shape, (200, 150))
+
+    def test_image_quantize(self):
+        arr = np.array([[0, 0.25], [0.75, np.NaN]])
+        img = Image(arr).opts(quantize=True, cmap=['red', 'green', 'blue', 'black'])
+        plot = bokeh_renderer.get_plot(img)
+        source = plot.handles['source']
+        glyph = plot.handles['glyph']
+        codes = source.data['image'][0]
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertIs(glyph.color_mapper, plot.handles['index_mapper'])
+        self.assertEqual(glyph.color_mapper.low, 0.5)
+        self.assertEqual(glyph.color_mapper.high, 4.5)
+        self.assertEqual(np.sort(codes.flatten()), np.array([0, 1, 2, 4]))
@@ -7,7 +7,8 @@ from unittest import SkipTest
 import numpy as np
 import param
 
-from holoviews import DynamicMap, HoloMap, Image, GridSpace, Table, Curve, Store
+from holoviews import (DynamicMap, HoloMap, LazyHoloMap, Image, GridSpace,
+                       Table, Curve, Store)
 from holoviews.streams import Stream
 from holoviews.plotting import Renderer
 from holoviews.element.comparison import ComparisonTestCase
@@ -54,6 +55,16 @@ class BokehRendererTest(ComparisonTestCase):
         plot = renderer.get_plot(self.image1)
         self.assertIs(plot.document, curdoc())
 
+    def test_get_plot_lazy_holomap_in_layout(self):
+        evaluated = []
+        def frame(i):
+            evaluated.append(i)
+            return Curve([i, i+1])
+        lazy = LazyHoloMap([(i, lambda i=i: frame(i)) for i in range(5)], kdims=['i'])
+        plot = self.renderer.get_plot(lazy + self.image1)
+        self.assertEqual(evaluated, [0])
+        self.assertIsInstance(plot.layout.values()[0].main, DynamicMap)
+
     def test_get_size_single_plot(self):
         plot = self.renderer.get_plot(self.image1)
         w, h = self.renderer.get_size(plot)
@@ -21,6 +21,14 @@ class TestCurvePlot(TestMPLPlot):
         plot = mpl_renderer.get_plot(curve)
         self.assertEqual(plot.handles['axis'].get_xlim(), (735964.0, 735973.0))
 
+    def test_curve_downsample_to_xlim(self):
+        curve = Curve(np.arange(10000)).opts(downsample='minmax', xlim=(1000, 2000))
+        plot = mpl_renderer.get_plot(curve)
+        xs = plot.handles['artist'].get_xdata()
+        self.assertTrue(len(xs) < 10000)
+        self.assertTrue(xs.min() >= 999)
+        self.assertTrue(xs.max() <= 2001)
+
     @pd_skip
     def test_curve_pandas_timestamps(self):
         dates = pd.date_range('2016-01-01', '2016-01-10', freq='D')
@@ -1,5 +1,6 @@
 import numpy as np
 
+from holoviews.core import Dimension
 from holoviews.element import BoxWhisker
 
 from .testplot import TestPlotlyPlot
@@ -62,3 +63,18 @@ class TestBoxWhiskerPlot(TestPlotlyPlot):
         element = BoxWhisker(([3, 2, 1], [0, 1, 2])).options(visible=False)
         state = self._get_plot_state(element)
         self.assertEqual(state['data'][0]['visible'], False)
+
+    def test_boxwhisker_multi_mixed_type_keys(self):
+        xs = np.array(['A']*4+[1]*4, dtype=object)
+        box = BoxWhisker((xs, [1, 2, 3, 4, 5, 6, 7, 8]), 'x', 'y', datatype=['dictionary'])
+        state = self._get_plot_state(box)
+        self.assertEqual([d['name'] for d in state['data']], ['A', '1'])
+        self.assertEqual(state['data'][0]['y'], np.array([1, 2, 3, 4]))
+        self.assertEqual(state['data'][1]['y'], np.array([5, 6, 7, 8]))
+
+    def test_boxwhisker_multi_categorical_order(self):
+        box = BoxWhisker((['A']*4+['B']*4, [1, 2, 3, 4, 5, 6, 7, 8]),
+                         Dimension('x', values=['B', 'A']), 'y')
+        state = self._get_plot_state(box)
+        self.assertEqual([d['name'] for d in state['data']], ['B', 'A'])
+        self.assertEqual(state['data'][0]['y'], np.array([5, 6, 7, 8]))
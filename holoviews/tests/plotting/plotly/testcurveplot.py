@@ -1,8 +1,14 @@
 import numpy as np
 
 from holoviews.element import Curve
+from holoviews.streams import RangeXY
 
-from .testplot import TestPlotlyPlot
+from .testplot import TestPlotlyPlot, plotly_renderer
+
+try:
+    from holoviews.plotting.plotly.callbacks import RangeXYCallback
+except:
+    pass
 
 
 class TestCurvePlot(TestPlotlyPlot):
@@ -57,3 +63,20 @@ class TestCurvePlot(TestPlotlyPlot):
         element = Curve([1, 2, 3]).options(visible=False)
         state = self._get_plot_state(element)
         self.assertEqual(state['data'][0]['visible'], False)
+
+    def test_curve_downsample_attaches_range_stream(self):
+        curve = Curve(np.arange(10000)).opts(downsample='lttb', width=100)
+        plot = plotly_renderer.get_plot(curve)
+        callbacks = [cb for cb in plot.callbacks if isinstance(cb, RangeXYCallback)]
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsInstance(callbacks[0].streams[0], RangeXY)
+
+    def test_curve_downsample_resamples_on_range_change(self):
+        curve = Curve(np.arange(10000)).opts(downsample='minmax', width=100)
+        plot = plotly_renderer.get_plot(curve)
+        stream = [cb for cb in plot.callbacks if isinstance(cb, RangeXYCallback)][0].streams[0]
+        stream.event(x_range=(1000, 2000), y_range=(0, 10000))
+        xs = np.asarray(plot.state['data'][0]['x'])
+        self.assertTrue(len(xs) < 1000)
+        self.assertTrue(xs.min() >= 999)
+        self.assertTrue(xs.max() <= 2001)
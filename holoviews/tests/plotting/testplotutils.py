@@ -9,13 +9,13 @@ from holoviews.core.spaces import DynamicMap, HoloMap
 from holoviews.core.options import Store, Cycle
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.element import (Image, Scatter, Curve, Points,
-                               Area, VectorField, HLine, Path)
+                               Area, VectorField, HLine, Path, BoxWhisker)
 from holoviews.operation import operation
 from holoviews.plotting.util import (
     compute_overlayable_zorders, get_min_distance, process_cmap,
     initialize_dynamic, split_dmap_overlay, _get_min_distance_numpy,
     bokeh_palette_to_palette, mplcmap_to_palette, color_intervals,
-    get_range, get_axis_padding)
+    get_range, get_axis_padding, grouped_values, grouped_box_stats)
 from holoviews.streams import PointerX
 
 try:
@@ -613,6 +613,46 @@ class TestPlotUtils(ComparisonTestCase):
         self.assertEqual(dist, 1.0)
 
 
+class TestGroupedStatistics(ComparisonTestCase):
+
+    def test_grouped_values_order_of_appearance(self):
+        box = BoxWhisker((['B', 'A', 'B', 'A', 'C'], [1, 2, 3, 4, 5]), 'x', 'y')
+        keys, values, offsets = grouped_values(box)
+        self.assertEqual(keys, [('B',), ('A',), ('C',)])
+        self.assertEqual(values, np.array([1, 3, 2, 4, 5]))
+        self.assertEqual(offsets, np.array([0, 2, 4, 5]))
+
+    def test_grouped_values_multi_level(self):
+        box = BoxWhisker((['A', 'B', 'A', 'B'], [1, 1, 1, 2], [1, 2, 3, 4]),
+                         ['x', 'z'], 'y')
+        keys, values, offsets = grouped_values(box)
+        self.assertEqual(keys, [('A', 1), ('B', 1), ('B', 2)])
+        self.assertEqual(values, np.array([1, 3, 2, 4]))
+
+    def test_grouped_values_no_kdims(self):
+        box = BoxWhisker([3, 1, 2], label='Test')
+        keys, values, offsets = grouped_values(box)
+        self.assertEqual(keys, [('Test',)])
+        self.assertEqual(values, np.array([3, 1, 2]))
+
+    def test_grouped_box_stats_matches_percentile(self):
+        groups = [np.random.randn(n) for n in (1, 7, 50)]
+        groups[2][[0, 10]] = [25, np.nan]
+        values = np.concatenate(groups+[np.array([np.nan])])
+        offsets = np.array([0, 1, 8, 58, 59])
+        q1, q2, q3, upper, lower, outliers = grouped_box_stats(values, offsets)
+        for i, vals in enumerate(groups):
+            vals = vals[np.isfinite(vals)]
+            e1, e2, e3 = (np.percentile(vals, q) for q in (25, 50, 75))
+            iqr = e3 - e1
+            self.assertEqual((q1[i], q2[i], q3[i]), (e1, e2, e3))
+            self.assertEqual(upper[i], vals[vals <= e3 + 1.5*iqr].max())
+            self.assertEqual(lower[i], vals[vals >= e1 - 1.5*iqr].min())
+        self.assertEqual((q1[3], q2[3], q3[3], upper[3], lower[3]), (0, 0, 0, 0, 0))
+        self.assertTrue(outliers[8])
+        self.assertFalse(outliers[18])
+
+
 class TestRangeUtilities(ComparisonTestCase):
 
     def test_get_axis_padding_scalar(self):
@@ -1,10 +1,14 @@
 from unittest import SkipTest, skip, skipIf
 
 import holoviews as hv
+import numpy as np
 import pandas as pd
 
 from holoviews.core.options import Store
-from holoviews.selection import link_selections
+from holoviews.operation import histogram
+from holoviews.selection import (
+    link_selections, _CrossFilterIndex, _SelectionMaskCache, _range_expr
+)
 from holoviews.element.comparison import ComparisonTestCase
 
 try:
@@ -293,6 +297,91 @@ class TestLinkSelections(ComparisonTestCase):
         )
 
 
+class TestSelectionMaskCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.dataset = hv.Dataset(
+            pd.DataFrame({'x': [1, 2, 3], 'y': [0, 3, 2]}), kdims='x', vdims='y'
+        )
+        self.expr = hv.dim('x') > 1
+
+    def test_mask_shared_by_clones(self):
+        cache = _SelectionMaskCache()
+        mask = cache.mask(self.dataset, self.expr)
+        self.assertIs(cache.mask(self.dataset.clone(), self.expr), mask)
+        self.assertEqual(list(mask), [False, True, True])
+
+    def test_selection_shared_by_clones(self):
+        cache = _SelectionMaskCache()
+        selected = cache.select(self.dataset, self.expr)
+        self.assertIs(cache.select(self.dataset.clone(), self.expr), selected)
+        self.assertEqual(selected, self.dataset.select(selection_expr=self.expr))
+
+    def test_new_expression_invalidates_cache(self):
+        cache = _SelectionMaskCache()
+        mask = cache.mask(self.dataset, self.expr)
+        new_mask = cache.mask(self.dataset, hv.dim('x') > 2)
+        self.assertIsNot(new_mask, mask)
+        self.assertEqual(list(new_mask), [False, False, True])
+
+    def test_new_data_invalidates_cache(self):
+        cache = _SelectionMaskCache()
+        mask = cache.mask(self.dataset, self.expr)
+        other = self.dataset.clone(self.dataset.data.copy())
+        self.assertIsNot(cache.mask(other, self.expr), mask)
+
+
+class TestCrossFilterIndex(ComparisonTestCase):
+
+    def setUp(self):
+        self.dataset = hv.Dataset(
+            pd.DataFrame({'x': [3, 1, 4, 1, 5, 9, 2, 6],
+                          'y': [2, 7, 1, 8, 2, 8, 1, 8]}),
+            kdims='x', vdims='y'
+        )
+
+    def expected(self, bbox):
+        if not bbox:
+            return np.ones(len(self.dataset), dtype=bool)
+        return _range_expr(bbox).apply(self.dataset)
+
+    def test_crossfilter_update(self):
+        index = _CrossFilterIndex(self.dataset)
+        bbox = {'x': (1, 4), 'y': (1, 7)}
+        self.assertEqual(index.update(bbox), self.expected(bbox))
+
+    def test_crossfilter_incremental_updates(self):
+        index = _CrossFilterIndex(self.dataset)
+        for bbox in [{'x': (1, 4)}, {'x': (2, 6)}, {'x': (2, 6), 'y': (2, 8)},
+                     {'y': (0, 1)}, {}]:
+            self.assertEqual(index.update(bbox), self.expected(bbox))
+
+    def test_crossfilter_histogram_counts(self):
+        index = _CrossFilterIndex(self.dataset)
+        edges = np.linspace(0, 10, 6)
+        index.update({'x': (1, 4)})
+        self.assertEqual(index.histogram('y', edges), np.array([2, 1, 0, 1, 1]))
+        index.update({'x': (4, 9)})
+        self.assertEqual(index.histogram('y', edges), np.array([1, 1, 0, 0, 2]))
+
+    def test_mask_cache_uses_crossfilter(self):
+        cache = _SelectionMaskCache()
+        bbox = {'x': (2, 6), 'y': (1, 2)}
+        expr = _range_expr(bbox)
+        cache.set_bbox(expr, bbox)
+        self.assertEqual(cache.mask(self.dataset, expr), self.expected(bbox))
+        self.assertEqual(len(cache._indexes), 1)
+
+    def test_mask_cache_histogram(self):
+        cache = _SelectionMaskCache()
+        hist = histogram(self.dataset, dimension='y', normed=False, num_bins=4)
+        bbox = {'x': (2, 6), 'y': (1, 8)}
+        expr = _range_expr(bbox)
+        cache.set_bbox(expr, bbox)
+        selected = cache.histogram(hist, expr)
+        self.assertEqual(selected, hist.pipeline(self.dataset.select(selection_expr=expr)))
+
+
 # Backend implementations
 class TestLinkSelectionsPlotly(TestLinkSelections):
     def setUp(self):
@@ -143,6 +143,19 @@ class TestPointerStreams(ComparisonTestCase):
         except TypeError as e:
             self.assertEqual(str(e), "Constant parameter 'y' cannot be modified")
 
+    def test_positionXY_policy_excluded_from_contents(self):
+        position = PointerXY(x=1, y=3, policy='debounce', timeout=200)
+        self.assertEqual(position.contents, dict(x=1, y=3))
+        self.assertEqual((position.policy, position.timeout), ('debounce', 200))
+
+    def test_positionXY_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            PointerXY(policy='fastest')
+
+    def test_positionXY_rename_preserves_policy(self):
+        position = PointerXY(policy='adaptive', timeout=100).rename(x='x1')
+        self.assertEqual((position.policy, position.timeout), ('adaptive', 100))
+
 
 
 class TestParamsStream(LoggingComparisonTestCase):
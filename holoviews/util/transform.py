@@ -5,6 +5,7 @@ from types import BuiltinFunctionType, BuiltinMethodType, FunctionType, MethodTy
 
 import numpy as np
 
+from ..core.data.sindex import points_in_polygon
 from ..core.dimension import Dimension
 from ..core.util import basestring, unique_iterator
 from ..element import Graph
@@ -135,6 +136,34 @@ def categorize(values, categories, default=None):
     return result
 
 
+def spatial_select(xs, ys, bounds=None, geometry=None):
+    """Selects the coordinates inside a region.
+
+    Returns a boolean mask of the coordinates which lie inside the
+    supplied bounds or polygon geometry. When applied to a
+    multi-geometry dataset the expression instead selects the whole
+    geometries intersecting the region (see Interface.spatial_mask).
+
+    Args:
+        xs: Array of x-coordinates
+        ys: Array of y-coordinates
+        bounds: Tuple of the (x0, y0, x1, y1) bounds to select
+        geometry: Polygon to select declared as an array of
+            x- and y-coordinates
+
+    Returns:
+        Boolean array of the selected coordinates
+    """
+    xs, ys = np.asarray(xs), np.asarray(ys)
+    if geometry is not None:
+        geometry = np.asarray(geometry, dtype='float')
+        return points_in_polygon(xs, ys, geometry[:, 0], geometry[:, 1])
+    elif bounds is None:
+        raise ValueError('Spatial selection requires bounds or a geometry.')
+    x0, y0, x1, y1 = bounds
+    return (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+
+
 digitize = _maybe_map(np.digitize)
 isin = _maybe_map(np.isin)
 astype = _maybe_map(np.asarray)
@@ -168,6 +197,7 @@ class dim(object):
         isin: 'isin',
         astype: 'astype',
         round_: 'round',
+        spatial_select: 'spatial_select',
     }
 
     _numpy_funcs = {
@@ -302,6 +332,25 @@ class dim(object):
     def digitize(self, *args, **kwargs): return dim(self, digitize,  *args, **kwargs)
     def isin(self, *args, **kwargs):     return dim(self, isin,  *args, **kwargs)
 
+    def spatial_select(self, ydim, bounds=None, geometry=None):
+        """Selects the coordinates inside a region.
+
+        Treating this dimension as the x-coordinate and ydim as the
+        y-coordinate selects the coordinates inside the supplied
+        bounds or polygon. On multi-geometry datasets whole geometries
+        intersecting the region are selected using the spatial index
+        of the interface.
+
+        Args:
+            ydim: Dimension or dim of the y-coordinates
+            bounds: Tuple of the (x0, y0, x1, y1) bounds to select
+            geometry: Polygon to select declared as an array of
+                x- and y-coordinates
+        """
+        if not isinstance(ydim, dim):
+            ydim = dim(ydim)
+        return dim(self, spatial_select, ydim, bounds=bounds, geometry=geometry)
+
     def bin(self, bins, labels=None):
         """Bins continuous values.
 
@@ -419,15 +468,20 @@ class dim(object):
                 dimension = dataset.nodes.kdims[2]
             dataset = dataset if dimension in dataset else dataset.nodes
 
-        data = dataset.interface.values(
-            dataset,
-            dimension,
-            expanded=expanded,
-            flat=flat,
-            compute=compute,
-            keep_index=keep_index
-        )
-        for o in self.ops:
+        ops = self.ops
+        mask = self._spatial_mask(dataset)
+        if mask is not None:
+            data, ops = mask, ops[1:]
+        else:
+            data = dataset.interface.values(
+                dataset,
+                dimension,
+                expanded=expanded,
+                flat=flat,
+                compute=compute,
+                keep_index=keep_index
+            )
+        for o in ops:
             args = o['args']
             fn_args = [data]
             for arg in args:
@@ -453,6 +507,32 @@ class dim(object):
                 data = o['fn'](*args, **kwargs)
         return data
 
+    def _spatial_mask(self, dataset):
+        """
+        Returns the mask of the geometries selected by a leading
+        spatial_select on a multi-geometry dataset, or None if the
+        expression does not start with a spatial selection on the
+        coordinates of the geometries.
+        """
+        if not self.ops or self.ops[0]['fn'] is not spatial_select:
+            return None
+        op = self.ops[0]
+        ydim = op['args'][0]
+        if (not dataset.interface.multi or isinstance(dataset, Graph) or
+            not isinstance(ydim, dim) or ydim.ops):
+            return None
+        dims = [dataset.get_dimension(d) for d in (self.dimension, ydim.dimension)]
+        kdims = dataset.kdims[:2]
+        bounds, geometry = op['kwargs'].get('bounds'), op['kwargs'].get('geometry')
+        if dims == kdims[::-1]:
+            if bounds is not None:
+                bounds = (bounds[1], bounds[0], bounds[3], bounds[2])
+            if geometry is not None:
+                geometry = np.asarray(geometry)[:, ::-1]
+        elif dims != kdims:
+            return None
+        return dataset.interface.spatial_mask(dataset, bounds, geometry)
+
     def __repr__(self):
         op_repr = "'%s'" % self.dimension
         for o in self.ops: